@@ -0,0 +1,89 @@
+"""add_review_perf_indexes
+
+Revision ID: 9c0d1e2f3a4b
+Revises: 548777494dfe
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c0d1e2f3a4b'
+down_revision: Union[str, None] = '548777494dfe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _safe_create_index(name, table, columns, **kw):
+    """Create index if it doesn't already exist.
+
+    Checks via inspector rather than catching the DB error, since a failed
+    CREATE INDEX aborts the whole transaction on Postgres (unlike SQLite).
+    """
+    inspector = sa.inspect(op.get_bind())
+    existing = {idx['name'] for idx in inspector.get_indexes(table)}
+    if name in existing:
+        return
+    op.create_index(name, table, columns, **kw)
+
+
+def upgrade() -> None:
+    """Add a (user_id, product_id) unique constraint and composite indexes for review listing"""
+
+    # Constraint first: SQLite's batch rebuild reflects existing indexes and
+    # would recreate them without their DESC ordering
+    inspector = sa.inspect(op.get_bind())
+    existing = {uc['name'] for uc in inspector.get_unique_constraints('reviews')}
+    if 'uix_review_user_product' not in existing:
+        # Duplicates can only come from racing double-submits (create_review
+        # checked before inserting). Keep the most recently updated one so the
+        # constraint can be created.
+        op.execute(
+            """
+            DELETE FROM reviews WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY user_id, product_id
+                        ORDER BY updated_at DESC, created_at DESC
+                    ) AS rn
+                    FROM reviews
+                ) ranked
+                WHERE rn > 1
+            )
+            """
+        )
+
+        # batch mode so SQLite (no ALTER TABLE ADD CONSTRAINT) rebuilds the table
+        with op.batch_alter_table('reviews') as batch_op:
+            batch_op.create_unique_constraint('uix_review_user_product', ['user_id', 'product_id'])
+
+    # Keyset pagination indexes: product_id filter + each sort order, all DESC
+    _safe_create_index(
+        'ix_reviews_product_created',
+        'reviews',
+        ['product_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    _safe_create_index(
+        'ix_reviews_product_upvotes',
+        'reviews',
+        ['product_id', sa.text('upvotes DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    _safe_create_index(
+        'ix_reviews_product_rating',
+        'reviews',
+        ['product_id', sa.text('rating DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove review performance indexes"""
+
+    op.drop_index('ix_reviews_product_rating', table_name='reviews')
+    op.drop_index('ix_reviews_product_upvotes', table_name='reviews')
+    op.drop_index('ix_reviews_product_created', table_name='reviews')
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.drop_constraint('uix_review_user_product', type_='unique')
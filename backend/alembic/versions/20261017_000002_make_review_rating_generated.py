@@ -0,0 +1,82 @@
+"""make_review_rating_generated
+
+Revision ID: 0a1b2c3d4e5f
+Revises: 9c0d1e2f3a4b
+Create Date: 2026-10-17 00:00:01.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a1b2c3d4e5f'
+down_revision: Union[str, None] = '9c0d1e2f3a4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RATING_EXPR = "CAST(round((effects_rating + taste_rating + value_rating) / 3.0) AS INTEGER)"
+
+
+# Composite sort indexes from 9c0d1e2f3a4b. They are dropped and recreated
+# around the column swap: one covers rating, and SQLite's batch rebuild would
+# recreate the others without their DESC ordering.
+SORT_INDEXES = [
+    ('ix_reviews_product_created', ['product_id', 'created_at DESC', 'id DESC']),
+    ('ix_reviews_product_upvotes', ['product_id', 'upvotes DESC', 'created_at DESC', 'id DESC']),
+    ('ix_reviews_product_rating', ['product_id', 'rating DESC', 'created_at DESC', 'id DESC']),
+]
+
+
+def _drop_sort_indexes():
+    for name, _ in reversed(SORT_INDEXES):
+        op.drop_index(name, table_name='reviews')
+
+
+def _create_sort_indexes():
+    for name, columns in SORT_INDEXES:
+        op.create_index(name, 'reviews', [sa.text(c) if ' ' in c else c for c in columns])
+
+
+def upgrade() -> None:
+    """Replace reviews.rating with a stored column generated from the component ratings"""
+
+    # Legacy rows may carry only an overall rating; seed the missing
+    # components from it so the generated value matches what was stored
+    op.execute(
+        """
+        UPDATE reviews SET
+            effects_rating = COALESCE(effects_rating, rating),
+            taste_rating = COALESCE(taste_rating, rating),
+            value_rating = COALESCE(value_rating, rating)
+        WHERE effects_rating IS NULL OR taste_rating IS NULL OR value_rating IS NULL
+        """
+    )
+
+    # Neither database can turn an existing column into a generated one:
+    # drop and re-add it (batch mode rebuilds the table on SQLite)
+    _drop_sort_indexes()
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.drop_column('rating')
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.add_column(
+            sa.Column('rating', sa.Integer(), sa.Computed(RATING_EXPR, persisted=True))
+        )
+    _create_sort_indexes()
+
+
+def downgrade() -> None:
+    """Turn reviews.rating back into a plain column written by the application"""
+
+    _drop_sort_indexes()
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.drop_column('rating')
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.add_column(sa.Column('rating', sa.Integer(), nullable=True))
+    op.execute(f"UPDATE reviews SET rating = {RATING_EXPR}")
+    with op.batch_alter_table('reviews') as batch_op:
+        batch_op.alter_column('rating', existing_type=sa.Integer(), nullable=False)
+    _create_sort_indexes()
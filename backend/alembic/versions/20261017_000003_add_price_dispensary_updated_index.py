@@ -0,0 +1,49 @@
+"""add_price_dispensary_updated_index
+
+Revision ID: 1b2c3d4e5f6a
+Revises: 0a1b2c3d4e5f
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b2c3d4e5f6a'
+down_revision: Union[str, None] = '0a1b2c3d4e5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _safe_create_index(name, table, columns, **kw):
+    """Create index if it doesn't already exist.
+
+    Checks via inspector rather than catching the DB error, since a failed
+    CREATE INDEX aborts the whole transaction on Postgres (unlike SQLite).
+    """
+    inspector = sa.inspect(op.get_bind())
+    existing = {idx['name'] for idx in inspector.get_indexes(table)}
+    if name in existing:
+        return
+    op.create_index(name, table, columns, **kw)
+
+
+def upgrade() -> None:
+    """Add a (dispensary_id, last_updated DESC) index for latest-prices-per-dispensary reads"""
+
+    # Scraper status and recent-products both filter prices by dispensary and
+    # order by last_updated DESC; this returns rows pre-sorted so LIMIT stops early
+    _safe_create_index(
+        'ix_prices_dispensary_last_updated',
+        'prices',
+        ['dispensary_id', sa.text('last_updated DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove the dispensary/last_updated index"""
+
+    op.drop_index('ix_prices_dispensary_last_updated', table_name='prices')
@@ -0,0 +1,67 @@
+"""add_name_trigram_indexes
+
+Revision ID: 2c3d4e5f6a7b
+Revises: 1b2c3d4e5f6a
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c3d4e5f6a7b'
+down_revision: Union[str, None] = '1b2c3d4e5f6a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _safe_create_index(name, table, columns, **kw):
+    """Create index if it doesn't already exist.
+
+    Checks via inspector rather than catching the DB error, since a failed
+    CREATE INDEX aborts the whole transaction on Postgres (unlike SQLite).
+    """
+    inspector = sa.inspect(op.get_bind())
+    existing = {idx['name'] for idx in inspector.get_indexes(table)}
+    if name in existing:
+        return
+    op.create_index(name, table, columns, **kw)
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add GIN trigram indexes on product and brand names"""
+
+    # Trigram search is PostgreSQL-only; SQLite search keeps its ILIKE pre-filter
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Serve product search's ILIKE '%word%' and `%` similarity matches
+    _safe_create_index(
+        'ix_products_name_trgm',
+        'products',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    _safe_create_index(
+        'ix_brands_name_trgm',
+        'brands',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Remove the trigram indexes (the extension is left installed)"""
+
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_brands_name_trgm', table_name='brands')
+    op.drop_index('ix_products_name_trgm', table_name='products')
@@ -0,0 +1,62 @@
+"""add_generated_name_lower
+
+Revision ID: 3d4e5f6a7b8c
+Revises: 2c3d4e5f6a7b
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d4e5f6a7b8c'
+down_revision: Union[str, None] = '2c3d4e5f6a7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['products', 'brands']
+
+
+def _restore_lower_name_index() -> None:
+    """
+    Recreate ix_products_name_lower (LOWER(name), from 20260121_193140).
+
+    On SQLite the batch rebuild of products recreates only the indexes
+    reflection can see, which excludes expression indexes, so it is lost
+    with every rebuild. Other databases alter the table in place and keep it.
+    """
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.create_index(
+        'ix_products_name_lower',
+        'products',
+        [sa.text('LOWER(name)')],
+        if_not_exists=True
+    )
+
+
+def upgrade() -> None:
+    """Add a stored name_lower column generated from name to products and brands"""
+
+    # Generated, so existing rows are filled in as the column is added and
+    # every later insert or rename keeps it current (batch mode rebuilds the
+    # table on SQLite, which can't ADD a stored generated column)
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(
+                sa.Column('name_lower', sa.String(), sa.Computed('lower(name)', persisted=True))
+            )
+    _restore_lower_name_index()
+
+
+def downgrade() -> None:
+    """Remove the name_lower columns"""
+
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('name_lower')
+    _restore_lower_name_index()
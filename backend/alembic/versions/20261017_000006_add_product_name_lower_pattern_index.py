@@ -0,0 +1,50 @@
+"""add_product_name_lower_pattern_index
+
+Revision ID: 4e5f6a7b8c9d
+Revises: 3d4e5f6a7b8c
+Create Date: 2026-10-17 00:00:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e5f6a7b8c9d'
+down_revision: Union[str, None] = '3d4e5f6a7b8c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _safe_create_index(name, table, columns, **kw):
+    """Create index if it doesn't already exist.
+
+    Checks via inspector rather than catching the DB error, since a failed
+    CREATE INDEX aborts the whole transaction on Postgres (unlike SQLite).
+    """
+    inspector = sa.inspect(op.get_bind())
+    existing = {idx['name'] for idx in inspector.get_indexes(table)}
+    if name in existing:
+        return
+    op.create_index(name, table, columns, **kw)
+
+
+def upgrade() -> None:
+    """Add a pattern-ops index on products.name_lower for autocomplete prefix matches"""
+
+    # varchar_pattern_ops lets LIKE 'prefix%' use the btree regardless of the
+    # database collation (ignored on SQLite)
+    _safe_create_index(
+        'ix_products_name_lower_pattern',
+        'products',
+        ['name_lower'],
+        postgresql_ops={'name_lower': 'varchar_pattern_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Remove the name_lower pattern index"""
+
+    op.drop_index('ix_products_name_lower_pattern', table_name='products')
@@ -0,0 +1,93 @@
+"""add_user_review_count
+
+Revision ID: 5f6a7b8c9d0e
+Revises: 4e5f6a7b8c9d
+Create Date: 2026-10-17 00:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f6a7b8c9d0e'
+down_revision: Union[str, None] = '4e5f6a7b8c9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+POSTGRES_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION users_review_count() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE users SET review_count = review_count + 1 WHERE id = NEW.user_id;
+        ELSE
+            UPDATE users SET review_count = review_count - 1 WHERE id = OLD.user_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_reviews_user_count
+    AFTER INSERT OR DELETE ON reviews
+    FOR EACH ROW EXECUTE FUNCTION users_review_count()
+    """,
+]
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER trg_reviews_user_count_insert AFTER INSERT ON reviews
+    BEGIN
+        UPDATE users SET review_count = review_count + 1 WHERE id = NEW.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER trg_reviews_user_count_delete AFTER DELETE ON reviews
+    BEGIN
+        UPDATE users SET review_count = review_count - 1 WHERE id = OLD.user_id;
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    """Add users.review_count, backfill it, and keep it current with review triggers"""
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(
+            sa.Column('review_count', sa.Integer(), nullable=False, server_default='0')
+        )
+
+    op.execute(
+        "UPDATE users SET review_count = "
+        "(SELECT COUNT(*) FROM reviews WHERE reviews.user_id = users.id)"
+    )
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        triggers = POSTGRES_TRIGGERS
+    elif dialect == 'sqlite':
+        triggers = SQLITE_TRIGGERS
+    else:
+        triggers = []
+    for statement in triggers:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Remove the review triggers and users.review_count"""
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS trg_reviews_user_count ON reviews")
+        op.execute("DROP FUNCTION IF EXISTS users_review_count()")
+    elif dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS trg_reviews_user_count_insert")
+        op.execute("DROP TRIGGER IF EXISTS trg_reviews_user_count_delete")
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('review_count')
@@ -0,0 +1,36 @@
+"""drop_redundant_watchlist_user_index
+
+Revision ID: 6a7b8c9d0e1f
+Revises: 5f6a7b8c9d0e
+Create Date: 2026-10-17 00:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a7b8c9d0e1f'
+down_revision: Union[str, None] = '5f6a7b8c9d0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop ix_watchlists_user_id, which uix_user_product (user_id, product_id) already covers"""
+
+    # Every watchlist query filters by user_id, alone or with product_id; the
+    # unique constraint's index answers both, so the single-column index only
+    # costs writes
+    inspector = sa.inspect(op.get_bind())
+    existing = {idx['name'] for idx in inspector.get_indexes('watchlists')}
+    if 'ix_watchlists_user_id' in existing:
+        op.drop_index('ix_watchlists_user_id', table_name='watchlists')
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index"""
+
+    op.create_index('ix_watchlists_user_id', 'watchlists', ['user_id'], unique=False)
@@ -12,6 +12,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Connection pool per process (PostgreSQL only). Every API worker and
+    # scraper subprocess gets its own pool, so size * processes must stay
+    # under the server's connection limit.
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
 
     # Supabase Configuration
     supabase_url: Optional[str] = None
@@ -31,6 +37,8 @@ class Settings(BaseSettings):
     scraper_timeout: int = 30
     max_retries: int = 3
     max_concurrent_scrapers: int = 4
+    # Run scrapers in one long-lived worker process instead of one process per run
+    scraper_persistent_worker: bool = False
 
     # Logging
     log_level: str = "INFO"
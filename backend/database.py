@@ -31,12 +31,21 @@ if is_sqlite:
     # settings and avoid pool_size/max_overflow which cause warnings.
     engine_kwargs["pool_pre_ping"] = True
 else:
+    # LIFO checkout keeps reusing the most recently returned connections, so
+    # surplus ones sit idle long enough for pool_recycle/server timeouts to
+    # retire them instead of every connection being cycled through
     engine_kwargs.update(
         pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-        pool_recycle=3600,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_use_lifo=True,
     )
+    if is_postgres:
+        # psycopg2 already sends executemany INSERTs (the scraper price
+        # upsert) as multi-row VALUES pages; also batch executemany
+        # UPDATE/DELETE statements with execute_batch
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
 
 engine = create_engine(
     settings.database_url,
@@ -65,6 +74,19 @@ SessionLocal = sessionmaker(
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
+def dialect_insert(db: Session, table):
+    """
+    Return an INSERT for ``table`` built with the session's dialect, so
+    callers get ``on_conflict_do_nothing`` / ``on_conflict_do_update`` on
+    both PostgreSQL (production) and SQLite (local dev and tests).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+
 # Dependency to get database session
 def get_db():
     """Dependency for getting database session in FastAPI routes"""
@@ -18,7 +18,8 @@ if sys.platform == "win32":
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -99,6 +100,7 @@ async def lifespan(_app: FastAPI):
     On startup:
     1. Log all registered scrapers
     2. Optionally start the scheduler with auto-registered scrapers
+    3. Open the HTTP session shared by in-process scraper runs
     """
     # Clean up zombie "running" ScraperRun entries from previous sessions
     from datetime import datetime, timedelta, timezone
@@ -139,13 +141,27 @@ async def lifespan(_app: FastAPI):
     await scheduler.start()
     logger.info(f"Scraper scheduler started with {scheduler.job_count} jobs")
 
+    # One pooled HTTP session for scrapers run inside this process (test
+    # runs, run-all), so they reuse keep-alive connections and cached DNS
+    # instead of opening a fresh session per scrape
+    import aiohttp
+    _app.state.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+    )
+
     yield
 
+    await _app.state.http_session.close()
+
     # Graceful shutdown - wait for running jobs to complete
     scheduler = get_scheduler()
     await scheduler.stop(wait=True)
     logger.info("Scraper scheduler stopped")
 
+    # Let the persistent scraper worker (if enabled) finish and exit
+    from services.scraper_subprocess import stop_scraper_worker
+    stop_scraper_worker()
+
 # Rate limiter (keyed by client IP)
 limiter = Limiter(key_func=get_remote_address)
 
@@ -154,7 +170,9 @@ app = FastAPI(
     title="Utah Cannabis Aggregator API",
     description="REST API for cannabis price aggregation and reviews",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes responses several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -191,6 +209,10 @@ _allowed_origins = (
     else _default_origins
 )
 
+# Compress larger responses (scraper test dumps, search pages) for clients
+# that accept gzip; responses that are already encoded pass through as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_allowed_origins,
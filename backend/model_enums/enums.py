@@ -32,6 +32,13 @@ ALL_INTENTIONS = {
     "mood": [i.value for i in MoodIntention]
 }
 
+# Frozen per-type tag sets for O(1) membership checks in validate_intention
+_INTENTION_SETS = {
+    intention_type: frozenset(tags)
+    for intention_type, tags in ALL_INTENTIONS.items()
+}
+_EMPTY_INTENTIONS = frozenset()
+
 
 def validate_intention(intention_type: str, intention_tag: str) -> bool:
     """
@@ -44,6 +51,4 @@ def validate_intention(intention_type: str, intention_tag: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if intention_type not in ALL_INTENTIONS:
-        return False
-    return intention_tag in ALL_INTENTIONS[intention_type]
+    return intention_tag in _INTENTION_SETS.get(intention_type, _EMPTY_INTENTIONS)
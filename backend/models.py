@@ -13,7 +13,7 @@ Tables:
 - Promotion: Recurring and one-time promotional offers
 - ScraperRun: Log of every scraper execution for monitoring
 """
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Text, JSON, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Text, JSON, UniqueConstraint, Index, Computed, DDL, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -28,6 +28,9 @@ class User(Base):
     username = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=True)
     is_admin = Column(Boolean, default=False, nullable=False, server_default="false")
+    # Kept in step by triggers on reviews (see REVIEW_COUNT_TRIGGERS), so
+    # profiles never have to COUNT a user's reviews
+    review_count = Column(Integer, default=0, nullable=False, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -67,8 +70,18 @@ class Brand(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False, unique=True, index=True)
+    # Lowercased name for search scoring, kept in sync by the database
+    name_lower = Column(String, Computed("lower(name)", persisted=True))
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Trigram index for product search (PostgreSQL only, needs pg_trgm)
+    __table_args__ = (
+        Index(
+            'ix_brands_name_trgm', name,
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+
     # Relationships
     products = relationship("Product", back_populates="brand", cascade="all, delete-orphan")
 
@@ -88,6 +101,8 @@ class Product(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False, index=True)  # e.g., "Gorilla Glue #4"
+    # Lowercased name for search scoring, kept in sync by the database
+    name_lower = Column(String, Computed("lower(name)", persisted=True))
     product_type = Column(String, nullable=False)  # e.g., "Flower", "Vape", "Edible"
     thc_percentage = Column(Float, nullable=True)  # THC content as % (null when source is mg)
     cbd_percentage = Column(Float, nullable=True)  # CBD content as % (null when source is mg)
@@ -111,6 +126,20 @@ class Product(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Trigram index for product search (PostgreSQL only, needs pg_trgm)
+        Index(
+            'ix_products_name_trgm', name,
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+        # Autocomplete prefix scans (name_lower LIKE 'q%'); the pattern opclass
+        # lets PostgreSQL use it under any collation
+        Index(
+            'ix_products_name_lower_pattern', name_lower,
+            postgresql_ops={'name_lower': 'varchar_pattern_ops'}
+        ),
+    )
+
     # Relationships
     brand = relationship("Brand", back_populates="products")
     prices = relationship("Price", back_populates="product", cascade="all, delete-orphan")
@@ -147,8 +176,12 @@ class Price(Base):
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Unique constraint: one price per product per dispensary
-    __table_args__ = (UniqueConstraint('product_id', 'dispensary_id', name='uix_product_dispensary'),)
+    # Unique constraint: one price per product per dispensary. The composite
+    # index serves "latest prices at a dispensary" (scraper status/recent).
+    __table_args__ = (
+        UniqueConstraint('product_id', 'dispensary_id', name='uix_product_dispensary'),
+        Index('ix_prices_dispensary_last_updated', dispensary_id, last_updated.desc()),
+    )
 
     # Relationships
     product = relationship("Product", back_populates="prices")
@@ -171,7 +204,11 @@ class Review(Base):
     __tablename__ = "reviews"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    rating = Column(Integer, nullable=False)  # 1-5 stars
+    # 1-5 stars, derived by the database from the component ratings on every write
+    rating = Column(
+        Integer,
+        Computed("CAST(round((effects_rating + taste_rating + value_rating) / 3.0) AS INTEGER)", persisted=True),
+    )
     effects_rating = Column(Integer, nullable=True)  # 1-5 for effects
     taste_rating = Column(Integer, nullable=True)  # 1-5 for taste
     value_rating = Column(Integer, nullable=True)  # 1-5 for value
@@ -191,14 +228,67 @@ class Review(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # One review per user per product; the composite indexes back each
+    # sort order of GET /api/reviews/product/{id} (keyset columns, all DESC)
+    __table_args__ = (
+        UniqueConstraint('user_id', 'product_id', name='uix_review_user_product'),
+        Index('ix_reviews_product_created', product_id, created_at.desc(), id.desc()),
+        Index('ix_reviews_product_upvotes', product_id, upvotes.desc(), created_at.desc(), id.desc()),
+        Index('ix_reviews_product_rating', product_id, rating.desc(), created_at.desc(), id.desc()),
+    )
+
     # Relationships
     user = relationship("User", back_populates="reviews")
     product = relationship("Product", back_populates="reviews")
 
+    @property
+    def username(self) -> str:
+        """Author's username for API responses (eager-load ``user`` to avoid a lazy load)"""
+        return self.user.username if self.user else "Unknown"
+
     def __repr__(self):
         return f"<Review {self.rating}★ for {self.product_id}>"
 
 
+# users.review_count is maintained in the database rather than by the review
+# routes, so every path that adds or removes reviews (product merges, cascade
+# deletes, maintenance scripts) keeps it right
+REVIEW_COUNT_TRIGGERS = [
+    DDL("""
+        CREATE OR REPLACE FUNCTION users_review_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE users SET review_count = review_count + 1 WHERE id = NEW.user_id;
+            ELSE
+                UPDATE users SET review_count = review_count - 1 WHERE id = OLD.user_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """).execute_if(dialect='postgresql'),
+    DDL("""
+        CREATE TRIGGER trg_reviews_user_count
+        AFTER INSERT OR DELETE ON reviews
+        FOR EACH ROW EXECUTE FUNCTION users_review_count()
+    """).execute_if(dialect='postgresql'),
+    DDL("""
+        CREATE TRIGGER trg_reviews_user_count_insert AFTER INSERT ON reviews
+        BEGIN
+            UPDATE users SET review_count = review_count + 1 WHERE id = NEW.user_id;
+        END
+    """).execute_if(dialect='sqlite'),
+    DDL("""
+        CREATE TRIGGER trg_reviews_user_count_delete AFTER DELETE ON reviews
+        BEGIN
+            UPDATE users SET review_count = review_count - 1 WHERE id = OLD.user_id;
+        END
+    """).execute_if(dialect='sqlite'),
+]
+
+for _trigger in REVIEW_COUNT_TRIGGERS:
+    event.listen(Review.__table__, "after_create", _trigger)
+
+
 class ScraperFlag(Base):
     """
     Flags for products with low confidence matches requiring manual admin review.
@@ -318,7 +408,7 @@ class Watchlist(Base):
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
 
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     product_id = Column(String, ForeignKey("products.id"), nullable=False, index=True)
 
     # Alert preferences
@@ -328,7 +418,9 @@ class Watchlist(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Unique constraint: one watchlist entry per user per product
+    # Unique constraint: one watchlist entry per user per product. Its index
+    # also serves user_id-only lookups (left prefix), so user_id has no index
+    # of its own
     __table_args__ = (UniqueConstraint('user_id', 'product_id', name='uix_user_product'),)
 
     # Relationships
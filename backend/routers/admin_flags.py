@@ -51,6 +51,7 @@ from services.admin.flag_analyzer import (
     get_matched_product_dispensary_ids,
 )
 from routers.auth import verify_admin
+from routers.scrapers import clear_dispensary_cache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(verify_admin)])
 
@@ -1339,6 +1340,7 @@ async def merge_dispensaries(
         })
 
     db.commit()
+    clear_dispensary_cache()
     return {
         "target_id": body.target_id,
         "target_name": target.name,
@@ -21,6 +21,7 @@ from database import get_db, SessionLocal
 from models import ScraperRun, Product, Price, Brand, Dispensary
 from services.scrapers.registry import ScraperRegistry
 from routers.auth import verify_admin
+from routers.search import clear_search_caches
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +202,7 @@ async def _run_scraper_in_background(scraper_id: str) -> None:
 
         # Run scraper in subprocess with 900-second timeout
         result = await run_scraper_subprocess_async(scraper_id, timeout=900)
+        clear_search_caches()
 
         logger.info(f"Subprocess for scraper '{scraper_id}' completed: {result['status']}")
 
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_
 from database import get_db
 from models import Product, Price, Dispensary, Promotion
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 
@@ -280,17 +280,18 @@ async def get_related_products(
         .all()
     )
 
-    # Score each candidate by fuzzy name similarity
-    target_name = target.name.lower()
-    scored = []
-    for c in candidates:
-        score = fuzz.WRatio(target_name, c.name.lower()) / 100.0
-        if score >= 0.60:
-            scored.append((c, score))
-
-    # Sort by similarity descending, take top N
-    scored.sort(key=lambda x: x[1], reverse=True)
-    top = scored[:limit]
+    # Score each candidate by fuzzy name similarity. process.extract prepares
+    # the target name once, skips candidates as soon as they can't reach the
+    # 60% cutoff, and returns the top N by similarity (ties in load order).
+    # name_lower is generated by the database, so nothing is lowercased here.
+    matches = process.extract(
+        target.name_lower,
+        [c.name_lower for c in candidates],
+        scorer=fuzz.WRatio,
+        score_cutoff=60,
+        limit=limit,
+    )
+    top = [(candidates[index], score / 100.0) for _, score, index in matches]
 
     results = []
     for p, similarity in top:
@@ -1,19 +1,35 @@
 """
 Review endpoints for submitting, viewing, and managing product reviews
+
+Endpoints are plain ``def`` rather than ``async def``: every one of them
+does blocking SQLAlchemy work on the pooled sync engine, so FastAPI runs
+them in its threadpool instead of stalling the event loop.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+import base64
+import binascii
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import DateTime, Integer, String, and_, delete, desc, func, lambda_stmt, literal, or_, select, update
 from pydantic import BaseModel, Field
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
-from database import get_db
+from database import dialect_insert, get_db
 from models import Review, Product, User
 from model_enums.enums import validate_intention, ALL_INTENTIONS
 from routers.auth import get_current_user
+from services.response_cache import TTLCache
 
-router = APIRouter(prefix="/api/reviews", tags=["reviews"])
+# orjson renders the (often long) review payloads several times faster than
+# the stdlib json encoder FastAPI uses by default
+router = APIRouter(
+    prefix="/api/reviews",
+    tags=["reviews"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # Request/Response Models
@@ -26,7 +42,7 @@ class ReviewCreate(BaseModel):
     intention_type: str = Field(..., description="Either 'medical' or 'mood'")
     intention_tag: str = Field(..., description="Specific intention like 'pain' or 'socializing'")
     batch_number: Optional[str] = None
-    cultivation_date: Optional[str] = None  # ISO date string
+    cultivation_date: Optional[date] = None  # ISO date string (YYYY-MM-DD)
     comment: Optional[str] = Field(None, max_length=1000)
 
     class Config:
@@ -53,7 +69,7 @@ class ReviewUpdate(BaseModel):
     intention_type: Optional[str] = None
     intention_tag: Optional[str] = None
     batch_number: Optional[str] = None
-    cultivation_date: Optional[str] = None
+    cultivation_date: Optional[date] = None
     comment: Optional[str] = Field(None, max_length=1000)
 
 
@@ -80,15 +96,185 @@ class ReviewResponse(BaseModel):
         from_attributes = True
 
 
+class ReviewPage(BaseModel):
+    """One page of reviews plus the opaque cursor for the next page"""
+    items: list[ReviewResponse]
+    next_cursor: Optional[str] = None
+
+
+# Keyset columns per sort order. Every order is descending and ends with
+# Review.id as a tie-breaker so the (sort key, id) tuple is unique.
+_SORT_KEYS = {
+    "recent": (Review.created_at, Review.id),
+    "helpful": (Review.upvotes, Review.created_at, Review.id),
+    "rating_high": (Review.rating, Review.created_at, Review.id),
+}
+
+
+# First pages of product reviews, pre-encoded as JSON and tagged with the
+# parent product id; every review write for a product drops its entries.
+_first_page_cache = TTLCache(maxsize=1024, ttl=30)
+
+
 # Helper functions
-def compute_overall_rating(effects: int, taste: int, value: int) -> int:
-    """Compute overall rating from component ratings"""
-    return round((effects + taste + value) / 3)
+def _raise_missing_or_forbidden(db: Session, review_id: str, action: str):
+    """After an owner-scoped write matched nothing, raise 404 or 403 as appropriate"""
+    exists_stmt = lambda_stmt(lambda: select(Review.id).where(Review.id == review_id))
+    if db.scalar(exists_stmt) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"You can only {action} your own reviews"
+    )
+
+
+def _resolve_parent_id(db: Session, product_id: str) -> Optional[str]:
+    """
+    Resolve a product id to the parent that holds its reviews in one query:
+    a variant maps to its master_product_id, a parent maps to itself.
+    Returns None if the product doesn't exist.
+
+    Runs on every review read and create, so it is a lambda_stmt: the
+    statement is built and compiled once and product_id is bound per call.
+    """
+    stmt = lambda_stmt(
+        lambda: select(func.coalesce(Product.master_product_id, Product.id))
+        .where(Product.id == product_id)
+    )
+    return db.scalar(stmt)
+
+
+def _encode_cursor(review: Review, columns: tuple) -> str:
+    """Encode a review's sort-key values as an opaque URL-safe cursor"""
+    values = []
+    for column in columns:
+        value = getattr(review, column.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _cursor_value(column, value):
+    """
+    Convert one decoded cursor value to its column's type, raising ValueError
+    if it doesn't match, so a crafted cursor can't reach the keyset query
+    """
+    if isinstance(column.type, DateTime):
+        if not isinstance(value, str):
+            raise ValueError(f"{column.key} must be an ISO timestamp")
+        return datetime.fromisoformat(value)
+    if value is None and column.nullable:
+        return value
+    if isinstance(column.type, Integer):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{column.key} must be an integer")
+        return value
+    if isinstance(column.type, String):
+        if not isinstance(value, str):
+            raise ValueError(f"{column.key} must be a string")
+        return value
+    raise ValueError(f"{column.key} can't be used in a cursor")
+
+
+def _decode_cursor(cursor: str, columns: tuple) -> list:
+    """Decode a cursor produced by _encode_cursor for the same sort order"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match sort order")
+        return [_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def _after_cursor(columns: tuple, values: list):
+    """
+    Keyset predicate selecting rows strictly after the cursor in a
+    descending (c1, c2, ..., id) ordering:
+    c1 < v1 OR (c1 = v1 AND c2 < v2) OR ...
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        equal_prefix = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal_prefix, column < values[i]))
+    return or_(*clauses)
+
+
+def _product_reviews_query(
+    db: Session,
+    product_id: str,
+    intention_type: Optional[str],
+    intention_tag: Optional[str],
+    sort_by: str,
+):
+    """
+    Filtered review query for a product (variants resolve to their parent).
+
+    Returns (query, keyset columns for sort_by, parent product id); the
+    caller applies the ordering so it can add a keyset predicate first.
+    """
+    # Resolve variant to parent for review lookup
+    product_id = _resolve_parent_id(db, product_id) or product_id
+
+    # Build base query; eager-load authors so username doesn't lazy-load per row
+    query = (
+        db.query(Review)
+        .options(joinedload(Review.user))
+        .filter(Review.product_id == product_id)
+    )
+
+    # Apply filters
+    if intention_type:
+        query = query.filter(Review.intention_type == intention_type)
+
+    if intention_tag:
+        query = query.filter(Review.intention_tag == intention_tag)
+
+    # Unknown sort_by defaults to recent
+    columns = _SORT_KEYS.get(sort_by, _SORT_KEYS["recent"])
+    return query, columns, product_id
+
+
+def _load_review_page(
+    db: Session,
+    product_id: str,
+    intention_type: Optional[str],
+    intention_tag: Optional[str],
+    sort_by: str,
+    limit: int,
+    cursor: Optional[str],
+) -> tuple[dict, str]:
+    """Query one page of product reviews; returns (page, parent product id)"""
+    query, columns, product_id = _product_reviews_query(
+        db, product_id, intention_type, intention_tag, sort_by
+    )
+
+    # Apply keyset pagination
+    if cursor:
+        query = query.filter(_after_cursor(columns, _decode_cursor(cursor, columns)))
+    query = query.order_by(*(desc(column) for column in columns))
+
+    # Fetch one extra row to learn whether another page exists
+    reviews = query.limit(limit + 1).all()
+    has_more = len(reviews) > limit
+    reviews = reviews[:limit]
+
+    # ORM rows go straight to ReviewPage (from_attributes) for serialization
+    page = {
+        "items": reviews,
+        "next_cursor": _encode_cursor(reviews[-1], columns) if has_more else None,
+    }
+    return page, product_id
 
 
 # Endpoints
 @router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_review(
+def create_review(
     review_data: ReviewCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -106,33 +292,6 @@ async def create_review(
     Returns:
         Review ID and success message
     """
-    # Validate product exists
-    product = db.query(Product).filter(Product.id == review_data.product_id).first()
-    if not product:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Product not found"
-        )
-
-    # Resolve variant to parent - reviews always attach to parent product
-    if not product.is_master and product.master_product_id:
-        parent = db.query(Product).filter(Product.id == product.master_product_id).first()
-        if parent:
-            product = parent
-            review_data.product_id = product.id
-
-    # Check if user already reviewed this product
-    existing_review = db.query(Review).filter(
-        Review.user_id == current_user.id,
-        Review.product_id == review_data.product_id
-    ).first()
-
-    if existing_review:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You have already reviewed this product. Use PUT to update your review."
-        )
-
     # Validate intention tags
     if not validate_intention(review_data.intention_type, review_data.intention_tag):
         raise HTTPException(
@@ -140,125 +299,149 @@ async def create_review(
             detail=f"Invalid intention. Valid options for '{review_data.intention_type}': {ALL_INTENTIONS.get(review_data.intention_type, [])}"
         )
 
-    # Compute overall rating
-    overall_rating = compute_overall_rating(
-        review_data.effects_rating,
-        review_data.taste_rating,
-        review_data.value_rating
+    # Resolve variant to parent (reviews always attach to the parent product)
+    # and insert in one statement: INSERT ... SELECT FROM products yields no
+    # row for an unknown product, and the (user_id, product_id) unique
+    # constraint turns a duplicate into a no-op, which also holds under
+    # concurrent double-submits
+    parent_id = func.coalesce(Product.master_product_id, Product.id)
+    source = select(
+        literal(current_user.id),
+        parent_id,
+        literal(review_data.effects_rating),
+        literal(review_data.taste_rating),
+        literal(review_data.value_rating),
+        literal(review_data.intention_type, String),
+        literal(review_data.intention_tag, String),
+        literal(review_data.batch_number, String),
+        literal(review_data.cultivation_date, DateTime),
+        literal(review_data.comment, String),
+    ).where(Product.id == review_data.product_id)
+    stmt = (
+        dialect_insert(db, Review)
+        .from_select(
+            [
+                "user_id", "product_id", "effects_rating", "taste_rating", "value_rating",
+                "intention_type", "intention_tag", "batch_number", "cultivation_date", "comment",
+            ],
+            source,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "product_id"])
+        .returning(Review.id, Review.product_id)
     )
+    inserted = db.execute(stmt).one_or_none()
 
-    # Parse cultivation date if provided
-    cultivation_date_parsed = None
-    if review_data.cultivation_date:
-        try:
-            cultivation_date_parsed = datetime.fromisoformat(review_data.cultivation_date)
-        except ValueError:
+    if inserted is None:
+        # Only the failure path pays for a second lookup to tell the cases apart
+        db.rollback()
+        if _resolve_parent_id(db, review_data.product_id) is None:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid cultivation date format. Use ISO format (YYYY-MM-DD)"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
             )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already reviewed this product. Use PUT to update your review."
+        )
+    review_id, parent_id = inserted
 
-    # Create review
-    review = Review(
-        user_id=current_user.id,
-        product_id=review_data.product_id,
-        rating=overall_rating,
-        effects_rating=review_data.effects_rating,
-        taste_rating=review_data.taste_rating,
-        value_rating=review_data.value_rating,
-        intention_type=review_data.intention_type,
-        intention_tag=review_data.intention_tag,
-        batch_number=review_data.batch_number,
-        cultivation_date=cultivation_date_parsed,
-        comment=review_data.comment
-    )
-
-    db.add(review)
     db.commit()
-    db.refresh(review)
+    _first_page_cache.invalidate_tag(parent_id)
 
     return {
-        "id": review.id,
+        "id": review_id,
+        "product_id": parent_id,
         "status": "created",
         "message": "Review submitted successfully"
     }
 
 
-@router.get("/product/{product_id}")
-async def get_product_reviews(
+@router.get("/product/{product_id}", response_model=ReviewPage)
+def get_product_reviews(
     product_id: str,
     intention_type: Optional[str] = None,
     intention_tag: Optional[str] = None,
     sort_by: str = "recent",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
-) -> list[ReviewResponse]:
+) -> dict:
     """
-    Get reviews for a specific product
+    Get a page of reviews for a specific product
+
+    Uses keyset (cursor) pagination on (sort key, id) so each request costs
+    O(limit) regardless of how many reviews the product has.
 
     Args:
         product_id: Product ID
         intention_type: Filter by intention type ("medical" or "mood")
         intention_tag: Filter by specific intention tag
         sort_by: Sort order - "recent", "helpful" (upvotes), or "rating_high"
+        limit: Page size (1-100, default 20)
+        cursor: Opaque cursor from a previous page's next_cursor
         db: Database session
 
     Returns:
-        List of reviews with user information
+        Page of reviews with user information and next_cursor
+        (None when there are no more reviews)
     """
-    # Resolve variant to parent for review lookup
-    product = db.query(Product).filter(Product.id == product_id).first()
-    if product and not product.is_master and product.master_product_id:
-        product_id = product.master_product_id
+    # First pages are served from the response cache (pre-encoded JSON)
+    if cursor is None:
+        def render_first_page():
+            page, parent_id = _load_review_page(
+                db, product_id, intention_type, intention_tag, sort_by, limit, None
+            )
+            return ReviewPage.model_validate(page).model_dump_json().encode(), parent_id
 
-    # Build base query
-    query = db.query(Review).filter(Review.product_id == product_id)
+        key = (product_id, intention_type, intention_tag, sort_by, limit)
+        content = _first_page_cache.get_or_set(key, render_first_page)
+        return Response(content=content, media_type="application/json")
 
-    # Apply filters
-    if intention_type:
-        query = query.filter(Review.intention_type == intention_type)
+    page, _ = _load_review_page(
+        db, product_id, intention_type, intention_tag, sort_by, limit, cursor
+    )
+    return page
 
-    if intention_tag:
-        query = query.filter(Review.intention_tag == intention_tag)
 
-    # Apply sorting
-    if sort_by == "recent":
-        query = query.order_by(desc(Review.created_at))
-    elif sort_by == "helpful":
-        query = query.order_by(desc(Review.upvotes), desc(Review.created_at))
-    elif sort_by == "rating_high":
-        query = query.order_by(desc(Review.rating), desc(Review.created_at))
-    else:
-        # Default to recent
-        query = query.order_by(desc(Review.created_at))
-
-    reviews = query.all()
-
-    # Format response with user information
-    return [
-        ReviewResponse(
-            id=r.id,
-            rating=r.rating,
-            effects_rating=r.effects_rating,
-            taste_rating=r.taste_rating,
-            value_rating=r.value_rating,
-            intention_type=r.intention_type,
-            intention_tag=r.intention_tag,
-            batch_number=r.batch_number,
-            cultivation_date=r.cultivation_date,
-            comment=r.comment,
-            upvotes=r.upvotes,
-            user_id=r.user_id,
-            username=r.user.username if r.user else "Unknown",
-            product_id=r.product_id,
-            created_at=r.created_at,
-            updated_at=r.updated_at
-        )
-        for r in reviews
-    ]
+@router.get("/product/{product_id}/stream")
+def stream_product_reviews(
+    product_id: str,
+    intention_type: Optional[str] = None,
+    intention_tag: Optional[str] = None,
+    sort_by: str = "recent",
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Stream every review for a product as NDJSON (one ReviewResponse per line)
+
+    For exports and "all reviews" views. Rows are fetched in batches of 500
+    with yield_per and written out as they arrive, so memory stays flat no
+    matter how many reviews the product has.
+
+    Args:
+        product_id: Product ID
+        intention_type: Filter by intention type ("medical" or "mood")
+        intention_tag: Filter by specific intention tag
+        sort_by: Sort order - "recent", "helpful" (upvotes), or "rating_high"
+        db: Database session
+
+    Returns:
+        application/x-ndjson stream of reviews
+    """
+    query, columns, _ = _product_reviews_query(
+        db, product_id, intention_type, intention_tag, sort_by
+    )
+    query = query.order_by(*(desc(column) for column in columns)).yield_per(500)
+
+    def generate():
+        for review in query:
+            yield ReviewResponse.model_validate(review).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.put("/{review_id}")
-async def update_review(
+def update_review(
     review_id: str,
     review_data: ReviewUpdate,
     current_user: User = Depends(get_current_user),
@@ -278,28 +461,23 @@ async def update_review(
     Returns:
         Success message
     """
-    # Find review
-    review = db.query(Review).filter(Review.id == review_id).first()
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-
-    # Check ownership
-    if review.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your own reviews"
-        )
-
-    # Update fields if provided
-    update_data = review_data.dict(exclude_unset=True)
+    update_data = review_data.model_dump(exclude_unset=True)
 
     # Validate intention if being updated
     if "intention_type" in update_data or "intention_tag" in update_data:
-        intention_type = update_data.get("intention_type", review.intention_type)
-        intention_tag = update_data.get("intention_tag", review.intention_tag)
+        intention_type = update_data.get("intention_type")
+        intention_tag = update_data.get("intention_tag")
+
+        # Only a partial intention update needs the stored half
+        if "intention_type" not in update_data or "intention_tag" not in update_data:
+            current = db.execute(
+                select(Review.user_id, Review.intention_type, Review.intention_tag)
+                .where(Review.id == review_id)
+            ).first()
+            if current is None or current.user_id != current_user.id:
+                _raise_missing_or_forbidden(db, review_id, "update")
+            intention_type = update_data.get("intention_type", current.intention_type)
+            intention_tag = update_data.get("intention_tag", current.intention_tag)
 
         if not validate_intention(intention_type, intention_tag):
             raise HTTPException(
@@ -307,40 +485,32 @@ async def update_review(
                 detail=f"Invalid intention combination"
             )
 
-    # Parse cultivation date if provided
-    if "cultivation_date" in update_data and update_data["cultivation_date"]:
-        try:
-            update_data["cultivation_date"] = datetime.fromisoformat(update_data["cultivation_date"])
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid cultivation date format. Use ISO format (YYYY-MM-DD)"
-            )
-
-    # Update review fields
-    for field, value in update_data.items():
-        setattr(review, field, value)
+    # One owner-scoped UPDATE of just the changed columns (updated_at via
+    # onupdate; the overall rating is a generated column the database keeps
+    # in step with the component ratings)
+    reviewed_product_id = db.execute(
+        update(Review)
+        .where(Review.id == review_id, Review.user_id == current_user.id)
+        .values(**update_data)
+        .returning(Review.product_id)
+    ).scalar_one_or_none()
 
-    # Recalculate overall rating if any component rating changed
-    if any(field in update_data for field in ["effects_rating", "taste_rating", "value_rating"]):
-        review.rating = compute_overall_rating(
-            review.effects_rating,
-            review.taste_rating,
-            review.value_rating
-        )
+    if reviewed_product_id is None:
+        db.rollback()
+        _raise_missing_or_forbidden(db, review_id, "update")
 
-    review.updated_at = datetime.utcnow()
     db.commit()
+    _first_page_cache.invalidate_tag(reviewed_product_id)
 
     return {
-        "id": review.id,
+        "id": review_id,
         "status": "updated",
         "message": "Review updated successfully"
     }
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_review(
+def delete_review(
     review_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -358,29 +528,25 @@ async def delete_review(
     Returns:
         No content (204)
     """
-    # Find review
-    review = db.query(Review).filter(Review.id == review_id).first()
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
+    # Delete only if the caller owns it (or admin - future enhancement)
+    reviewed_product_id = db.execute(
+        delete(Review)
+        .where(Review.id == review_id, Review.user_id == current_user.id)
+        .returning(Review.product_id)
+    ).scalar_one_or_none()
 
-    # Check ownership (or admin - future enhancement)
-    if review.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete your own reviews"
-        )
+    if reviewed_product_id is None:
+        db.rollback()
+        _raise_missing_or_forbidden(db, review_id, "delete")
 
-    db.delete(review)
     db.commit()
+    _first_page_cache.invalidate_tag(reviewed_product_id)
 
     return None
 
 
 @router.post("/{review_id}/upvote")
-async def upvote_review(
+def upvote_review(
     review_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -399,21 +565,27 @@ async def upvote_review(
     Returns:
         Updated upvote count
     """
-    # Find review
-    review = db.query(Review).filter(Review.id == review_id).first()
-    if not review:
+    # Increment upvotes atomically in the database (race-free, one statement)
+    row = db.execute(
+        update(Review)
+        .where(Review.id == review_id)
+        .values(upvotes=func.coalesce(Review.upvotes, 0) + 1)
+        .returning(Review.upvotes, Review.product_id)
+    ).first()
+
+    if row is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Review not found"
         )
 
-    # Increment upvotes
-    review.upvotes += 1
     db.commit()
-    db.refresh(review)
+    new_upvotes = row.upvotes
+    _first_page_cache.invalidate_tag(row.product_id)
 
     return {
-        "review_id": review.id,
-        "upvotes": review.upvotes,
+        "review_id": review_id,
+        "upvotes": new_upvotes,
         "message": "Review upvoted successfully"
     }
@@ -9,28 +9,84 @@ This router provides:
 
 The endpoints use the ScraperRegistry to dynamically discover and run
 any registered scraper without requiring code changes.
+
+Endpoints that only read the database are plain ``def`` so FastAPI runs
+their blocking SQLAlchemy calls in its threadpool; endpoints that await
+scrapers or subprocesses stay ``async def``.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
+from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import gzip
+import hashlib
+import logging
 import time
 
+import aiohttp
+import orjson
+
 from database import get_db
 from services.scraper_runner import ScraperRunner
 from services.scraper_subprocess import run_scraper_subprocess_async
 from services.scrapers.registry import ScraperRegistry
 from services.scrapers.base_scraper import BaseScraper, ScrapedProduct
-from models import Product, Price, Dispensary
+from services.response_cache import TTLCache
+from models import Brand, Product, Price, Dispensary
 from routers.auth import verify_admin
+from routers.search import clear_search_caches
+
+logger = logging.getLogger(__name__)
 
 # All endpoints on this router trigger real scraper work (Playwright subprocesses,
 # full run-all sweeps) or expose an HTML control panel that does — so the entire
 # router requires admin auth. Public scraper info is served elsewhere.
-router = APIRouter(prefix="/scrapers", tags=["scrapers"], dependencies=[Depends(verify_admin)])
+# Test runs can return thousands of products with raw_data, so JSON goes
+# through orjson; the dashboard overrides this with HTMLResponse.
+router = APIRouter(
+    prefix="/scrapers",
+    tags=["scrapers"],
+    dependencies=[Depends(verify_admin)],
+    default_response_class=ORJSONResponse,
+)
+
+
+# Scraper status changes only when a run saves prices. Runs started here
+# drop the cache; scheduled and admin-panel runs are bounded by the TTL.
+_status_cache = TTLCache(maxsize=8, ttl=30)
+
+# Dispensary name -> id for the registry's dispensaries. The rows only change
+# when an admin merges dispensaries, which clears this cache.
+_dispensary_ids = TTLCache(maxsize=64, ttl=600)
+
+# Background scraper runs started by POST /run/{scraper_id}, by scraper id.
+# Holding the task keeps it from being garbage collected mid-run and lets a
+# second request for the same scraper be refused while one is in flight.
+_running_scrapers: Dict[str, "asyncio.Task[None]"] = {}
+
+
+def clear_dispensary_cache() -> None:
+    """Drop cached dispensary ids (after dispensaries are merged or removed)"""
+    _dispensary_ids.clear()
+
+
+def _dispensary_id(db: Session, name: str) -> Optional[str]:
+    """
+    Look up a dispensary id by exact name, caching hits.
+
+    Misses aren't cached, so a dispensary created by its first scraper
+    run is found on the next request.
+    """
+    return _dispensary_ids.get_or_set(
+        name,
+        lambda: (db.execute(select(Dispensary.id).where(Dispensary.name == name)).scalar(), None)
+    )
 
 
 # ========== Response Models ==========
@@ -163,92 +219,113 @@ class RecentProductResponse(BaseModel):
         }
 
 
-# ========== Dashboard Endpoints ==========
-
-@router.get("/dashboard", response_class=HTMLResponse)
-async def scraper_dashboard():
-    """
-    Simple dashboard to trigger scrapers manually.
+# ========== Cached Registry Views ==========
 
-    Provides a web interface for running scrapers without API access.
-    Useful for quick manual testing and one-off imports.
-    """
-    scrapers = ScraperRegistry.get_all()
+# Registry views only change on deploy (or a hot registration), so clients
+# may reuse them for a while and revalidate with If-None-Match after that.
+# Private because the whole router is admin-only.
+_REGISTRY_CACHE_CONTROL = "private, max-age=300, stale-while-revalidate=60"
 
-    # Generate buttons for each scraper
-    scraper_buttons = ""
-    for scraper_id, config in scrapers.items():
-        scraper_buttons += f"""
-        <div class="card">
-            <h2>{config.name}</h2>
-            <p>{config.description or config.dispensary_name}</p>
-            <button onclick="runScraper('{scraper_id}')">🚀 Run Scraper</button>
-            <div id="status-{scraper_id}" class="status"></div>
-        </div>
-        """
+_HTML = "text/html; charset=utf-8"
+_DASHBOARD_HEADERS = {"Vary": "Accept-Encoding"}
+_DASHBOARD_GZIP_HEADERS = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
 
-    return f"""
+# Dashboard page pieces. Only the card template is formatted, so the CSS
+# and JS braces in the head and tail stay as written.
+_DASHBOARD_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>🕷️ Scraper Dashboard</title>
         <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; max-width: 800px; margin: 2rem auto; padding: 0 1rem; background: #f9f9f9; }}
-            .card {{ background: white; border: 1px solid #ddd; padding: 2rem; border-radius: 12px; box-shadow: 0 2px 4px rgba(0,0,0,0.05); margin-bottom: 1rem; }}
-            h1 {{ color: #333; }}
-            h2 {{ margin-top: 0; color: #555; }}
-            p {{ color: #666; }}
-            button {{ background: #10b981; color: white; border: none; padding: 0.75rem 1.5rem; border-radius: 6px; font-size: 1rem; cursor: pointer; transition: background 0.2s; }}
-            button:hover {{ background: #059669; }}
-            button:disabled {{ background: #ccc; cursor: not-allowed; }}
-            .status {{ margin-top: 1rem; padding: 1rem; background: #f3f4f6; border-radius: 6px; display: none; }}
-            pre {{ white-space: pre-wrap; word-wrap: break-word; margin: 0; }}
+            body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; max-width: 800px; margin: 2rem auto; padding: 0 1rem; background: #f9f9f9; }
+            .card { background: white; border: 1px solid #ddd; padding: 2rem; border-radius: 12px; box-shadow: 0 2px 4px rgba(0,0,0,0.05); margin-bottom: 1rem; }
+            h1 { color: #333; }
+            h2 { margin-top: 0; color: #555; }
+            p { color: #666; }
+            button { background: #10b981; color: white; border: none; padding: 0.75rem 1.5rem; border-radius: 6px; font-size: 1rem; cursor: pointer; transition: background 0.2s; }
+            button:hover { background: #059669; }
+            button:disabled { background: #ccc; cursor: not-allowed; }
+            .status { margin-top: 1rem; padding: 1rem; background: #f3f4f6; border-radius: 6px; display: none; }
+            pre { white-space: pre-wrap; word-wrap: break-word; margin: 0; }
         </style>
     </head>
     <body>
         <h1>🕷️ Scraper Control Center</h1>
-        {scraper_buttons}
+"""
+
+_DASHBOARD_CARD = """
+        <div class="card">
+            <h2>{name}</h2>
+            <p>{description}</p>
+            <button onclick="runScraper('{id}')">🚀 Run Scraper</button>
+            <div id="status-{id}" class="status"></div>
+        </div>
+"""
 
+_DASHBOARD_TAIL = """
         <script>
-            async function runScraper(scraperId) {{
-                const btn = document.querySelector(`button[onclick="runScraper('${{scraperId}}')"]`);
-                const statusDiv = document.getElementById(`status-${{scraperId}}`);
+            async function runScraper(scraperId) {
+                const btn = document.querySelector(`button[onclick="runScraper('${scraperId}')"]`);
+                const statusDiv = document.getElementById(`status-${scraperId}`);
 
                 btn.disabled = true;
-                btn.textContent = "Running... (Please Wait)";
+                btn.textContent = "Starting...";
                 statusDiv.style.display = "block";
-                statusDiv.innerHTML = "⏳ Scraping in progress... check backend logs for details.";
+                statusDiv.innerHTML = "⏳ Starting scraper...";
 
-                try {{
-                    const response = await fetch(`/scrapers/run/${{scraperId}}`, {{ method: 'POST' }});
+                try {
+                    const response = await fetch(`/scrapers/run/${scraperId}`, { method: 'POST' });
                     const data = await response.json();
-                    statusDiv.innerHTML = `<h3>${{data.status === 'success' ? '✅' : '❌'}} Result:</h3><pre>${{JSON.stringify(data, null, 2)}}</pre>`;
-                }} catch (e) {{
-                    statusDiv.innerHTML = `<h3>❌ Error:</h3><pre>${{e.message}}</pre>`;
-                }} finally {{
+                    statusDiv.innerHTML = `<h3>${response.ok ? '🚀 Started' : '❌ Error'}:</h3><pre>${JSON.stringify(data, null, 2)}</pre>`;
+                } catch (e) {
+                    statusDiv.innerHTML = `<h3>❌ Error:</h3><pre>${e.message}</pre>`;
+                } finally {
                     btn.disabled = false;
                     btn.textContent = "🚀 Run Scraper";
-                }}
-            }}
+                }
+            }
         </script>
     </body>
     </html>
+"""
+
+
+@lru_cache(maxsize=1)
+def _render_dashboard(registry_version: int) -> Tuple[Tuple[bytes, str], Tuple[bytes, str]]:
     """
+    Render the dashboard HTML for the current registry contents.
 
+    Cached per registry version: the page only changes when a scraper is
+    registered, so requests just read the rendered bytes and validators.
 
-# ========== Dynamic Scraper Endpoints ==========
+    Returns:
+        ((UTF-8 HTML, its ETag), (gzip-compressed HTML, its ETag))
+    """
+    cards = "".join(
+        _DASHBOARD_CARD.format(
+            id=scraper_id,
+            name=config.name,
+            description=config.description or config.dispensary_name
+        )
+        for scraper_id, config in ScraperRegistry.get_all().items()
+    )
+    page = (_DASHBOARD_HEAD + cards + _DASHBOARD_TAIL).encode("utf-8")
+    etag = _etag(page)
+    # Each encoding is its own representation, so it needs its own strong ETag
+    return (page, etag), (gzip.compress(page, mtime=0), etag[:-1] + '-gzip"')
 
-@router.get("/list", response_model=List[ScraperInfoResponse])
-async def list_scrapers():
+
+@lru_cache(maxsize=2)
+def _scraper_list(registry_version: int, enabled_only: bool) -> Tuple[bytes, str]:
     """
-    List all registered scrapers.
+    Serialize the /list payload once per registry version (and enabled_only flag).
 
-    Returns information about all available scrapers including
-    their IDs, names, enabled status, and schedule configuration.
+    Returns:
+        Tuple of (JSON body, ETag of the body)
     """
-    scrapers = []
-    for config in ScraperRegistry.get_all().values():
-        scrapers.append(ScraperInfoResponse(
+    body = orjson.dumps([
+        ScraperInfoResponse(
             id=config.id,
             name=config.name,
             description=config.description,
@@ -256,57 +333,180 @@ async def list_scrapers():
             dispensary_name=config.dispensary_name,
             dispensary_location=config.dispensary_location,
             schedule_minutes=config.schedule_minutes
-        ))
-    return scrapers
+        ).model_dump()
+        for config in ScraperRegistry.get_all().values()
+        if config.enabled or not enabled_only
+    ])
+    return body, _etag(body)
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names ``etag``"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _conditional_response(
+    request: Request, body: bytes, etag: str, media_type: str, headers: Dict[str, str]
+) -> Response:
+    """Send ``body`` with validators, or an empty 304 if the client's copy is current"""
+    headers = {**headers, "ETag": etag, "Cache-Control": _REGISTRY_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def _shared_http_session(request: Request) -> Optional[aiohttp.ClientSession]:
+    """The app-wide HTTP session opened in the lifespan, if the app has one"""
+    return getattr(request.app.state, "http_session", None)
+
+
+@lru_cache(maxsize=1)
+def _scraper_ids(registry_version: int) -> List[str]:
+    """Registered scraper IDs for "not found" messages, once per registry version"""
+    return list(ScraperRegistry.get_all().keys())
+
+
+# ========== Dashboard Endpoints ==========
+
+@router.get("/dashboard", response_class=HTMLResponse)
+async def scraper_dashboard(request: Request):
+    """
+    Simple dashboard to trigger scrapers manually.
+
+    Provides a web interface for running scrapers without API access.
+    Useful for quick manual testing and one-off imports.
+    """
+    plain, compressed = _render_dashboard(ScraperRegistry.version())
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return _conditional_response(request, *compressed, _HTML, _DASHBOARD_GZIP_HEADERS)
+    return _conditional_response(request, *plain, _HTML, _DASHBOARD_HEADERS)
+
+
+# ========== Dynamic Scraper Endpoints ==========
+
+@router.get("/list", response_model=List[ScraperInfoResponse])
+async def list_scrapers(request: Request, enabled_only: bool = False):
+    """
+    List all registered scrapers.
+
+    Returns information about all available scrapers including
+    their IDs, names, enabled status, and schedule configuration.
+
+    Args:
+        enabled_only: Only list scrapers that are currently enabled
+    """
+    body, etag = _scraper_list(ScraperRegistry.version(), enabled_only)
+    return _conditional_response(request, body, etag, "application/json", {})
 
 
 @router.post("/run/all")
-async def run_all_scrapers(db: Session = Depends(get_db)):
+async def run_all_scrapers(request: Request, db: Session = Depends(get_db)):
     """
     Run all enabled scrapers and save results to database.
 
-    Executes each enabled scraper sequentially. Results are
-    returned as a mapping of scraper IDs to their results.
+    Executes the enabled scrapers concurrently (bounded by
+    max_concurrent_scrapers). Results are returned as a mapping of
+    scraper IDs to their results.
 
     Args:
+        request: Incoming request (for the app-wide HTTP session)
         db: Database session
 
     Returns:
         Dict mapping scraper IDs to their scrape results
     """
-    runner = ScraperRunner(db)
-    return await runner.run_all()
+    runner = ScraperRunner(db, http_session=_shared_http_session(request))
+    results = await runner.run_all()
+    _status_cache.clear()
+    clear_search_caches()
+    return results
+
+
+async def _run_scraper_in_background(scraper_id: str) -> None:
+    """
+    Run a scraper subprocess and drop the caches its results invalidate.
+
+    Uses the subprocess wrapper to prevent zombie runs: if the scraper hangs
+    (e.g. a Playwright timeout), the subprocess is killed after 900s and the
+    ScraperRun record is marked as error.
+    """
+    try:
+        result = await run_scraper_subprocess_async(scraper_id, timeout=900)
+        logger.info(f"Scraper '{scraper_id}' finished: {result['status']}")
+    except Exception as e:
+        logger.error(f"Scraper '{scraper_id}' failed to run: {e}", exc_info=True)
+    finally:
+        _status_cache.clear()
+        clear_search_caches()
+        _running_scrapers.pop(scraper_id, None)
 
 
-@router.post("/run/{scraper_id}")
+@router.post("/run/{scraper_id}", status_code=202)
 async def run_scraper(scraper_id: str):
     """
-    Run a specific scraper by ID in a subprocess with timeout protection.
+    Start a specific scraper by ID in a subprocess and return immediately.
 
-    Uses the subprocess wrapper to prevent zombie runs — if the scraper
-    hangs (e.g., Playwright timeout), the subprocess is killed after 900s
-    and the ScraperRun record is marked as error.
+    The scrape takes minutes, so it runs after the response is sent instead
+    of holding the request open. Poll /scrapers/status (or the run log) for
+    the outcome.
 
     Args:
         scraper_id: The scraper's registry ID (e.g., "wholesomeco", "beehive")
 
     Returns:
-        Result of the scrape including product count and status
+        Confirmation that the run was started
     """
     config = ScraperRegistry.get(scraper_id)
     if not config:
         raise HTTPException(status_code=404, detail=f"Scraper '{scraper_id}' not found")
 
-    result = await run_scraper_subprocess_async(scraper_id, timeout=900)
-
-    if result["status"] == "error":
-        raise HTTPException(status_code=500, detail=result.get("message", "Scraper failed"))
-
-    return result
+    running = _running_scrapers.get(scraper_id)
+    if running is not None and not running.done():
+        raise HTTPException(status_code=409, detail=f"Scraper '{scraper_id}' is already running")
+
+    _running_scrapers[scraper_id] = asyncio.create_task(_run_scraper_in_background(scraper_id))
+
+    return {
+        "status": "started",
+        "scraper_id": scraper_id,
+        "scraper_name": config.name,
+        "message": f"Scraper '{config.name}' started. Poll /scrapers/status to check progress."
+    }
+
+
+def _encode_scraped_product(product: ScrapedProduct, include_raw: bool = False) -> bytes:
+    """Serialize a scraped product in the ScrapedProductResponse shape (raw_data only on request)"""
+    return orjson.dumps(
+        {
+            "name": product.name,
+            "brand": product.brand,
+            "category": product.category,
+            "price": product.price,
+            "thc_percentage": product.thc_percentage,
+            "cbd_percentage": product.cbd_percentage,
+            "unit_size": product.weight,
+            "raw_data": product.raw_data if include_raw else None
+        },
+        default=str
+    )
 
 
 @router.get("/test/{scraper_id}", response_model=ScraperTestResponse)
-async def test_scraper(scraper_id: str):
+async def test_scraper(
+    scraper_id: str,
+    request: Request,
+    include_raw: bool = Query(False, description="Include each product's raw scraped payload")
+):
     """
     Test a scraper without saving to database.
 
@@ -316,10 +516,15 @@ async def test_scraper(scraper_id: str):
     - Debugging scraping issues
     - Verifying data extraction logic
 
-    Returns all scraped products with complete details including raw_data field.
+    Returns all scraped products. raw_data is null unless include_raw is set,
+    since the raw payloads make up most of the response size.
+    The JSON is streamed as products arrive, so products_found and duration
+    come after the products array.
 
     Args:
         scraper_id: The scraper's registry ID
+        request: Incoming request (for the app-wide HTTP session)
+        include_raw: Whether to include raw_data for each product
 
     Returns:
         ScraperTestResponse with products and duration
@@ -330,7 +535,7 @@ async def test_scraper(scraper_id: str):
         raise HTTPException(
             status_code=404,
             detail=f"Scraper '{scraper_id}' not found. "
-                   f"Available: {list(ScraperRegistry.get_all().keys())}"
+                   f"Available: {_scraper_ids(ScraperRegistry.version())}"
         )
 
     if not config.enabled:
@@ -343,42 +548,122 @@ async def test_scraper(scraper_id: str):
 
     try:
         scraper = config.scraper_class(dispensary_id=scraper_id)
-        products = await scraper.scrape_products()
-
-        duration = time.time() - start_time
-
-        # Convert ScrapedProduct to Pydantic model
-        product_responses = [
-            ScrapedProductResponse(
-                name=p.name,
-                brand=p.brand,
-                category=p.category,
-                price=p.price,
-                thc_percentage=p.thc_percentage,
-                cbd_percentage=p.cbd_percentage,
-                unit_size=p.weight,
-                raw_data=p.raw_data
-            )
-            for p in products
-        ]
-
-        return ScraperTestResponse(
-            scraper=scraper_id,
-            products_found=len(products),
-            duration=round(duration, 2),
-            products=product_responses
-        )
+        scraper.http_session = _shared_http_session(request)
+        products = scraper.iter_products()
+        # Wait for the first product before responding, so a scraper that
+        # fails up front still gets a proper 500 instead of a broken stream
+        first = await anext(products, None)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Scraper test failed: {str(e)}"
         )
 
+    async def stream_body():
+        yield b'{"scraper":' + orjson.dumps(scraper_id) + b',"products":['
+        count = 0
+        product = first
+        try:
+            while product is not None:
+                yield (b"," if count else b"") + _encode_scraped_product(product, include_raw)
+                count += 1
+                product = await anext(products, None)
+        except Exception:
+            # Headers are already sent; abort so the client sees a failed
+            # transfer rather than a truncated document
+            logger.exception(f"Scraper test for '{scraper_id}' failed mid-stream")
+            raise
+        duration = round(time.time() - start_time, 2)
+        yield (
+            b'],"products_found":' + orjson.dumps(count)
+            + b',"duration":' + orjson.dumps(duration) + b'}'
+        )
+
+    return StreamingResponse(stream_body(), media_type="application/json")
+
 
 # ========== Status Endpoints ==========
 
+def _load_scraper_statuses(db: Session) -> List[ScraperStatusResponse]:
+    """
+    Build the status of every registered scraper from the database.
+
+    Args:
+        db: Database session
+
+    Returns:
+        One ScraperStatusResponse per registered scraper
+    """
+    configs = list(ScraperRegistry.get_all().values())
+    # Disabled scrapers have no fresh data by definition, so they are
+    # reported without touching the database
+    dispensary_names = {config.dispensary_name for config in configs if config.enabled}
+
+    # One grouped aggregate for every scraper's dispensary instead of up to
+    # three queries per scraper. The outer join keeps dispensaries that have
+    # no prices yet (count 0); names missing from the result aren't in the DB.
+    # Both aggregates read only (dispensary_id, last_updated), so the scan is
+    # answered from ix_prices_dispensary_last_updated without touching rows.
+    rows = []
+    if dispensary_names:
+        rows = db.query(
+            Dispensary.name,
+            func.max(Price.last_updated),
+            func.count(Price.dispensary_id)
+        ).outerjoin(
+            Price, Price.dispensary_id == Dispensary.id
+        ).filter(
+            Dispensary.name.in_(dispensary_names)
+        ).group_by(Dispensary.name).all()
+
+    stats = {name: (last_run, count) for name, last_run, count in rows}
+
+    statuses = []
+    for config in configs:
+        if not config.enabled:
+            statuses.append(ScraperStatusResponse(
+                name=config.id,
+                last_run=None,
+                status="never_run",
+                last_product_count=0,
+                error_message="Scraper is disabled"
+            ))
+            continue
+
+        if config.dispensary_name not in stats:
+            statuses.append(ScraperStatusResponse(
+                name=config.id,
+                last_run=None,
+                status="never_run",
+                last_product_count=0,
+                error_message="Dispensary not found in database"
+            ))
+            continue
+
+        # Most recent price update is the proxy for the last scraper run
+        last_run, product_count = stats[config.dispensary_name]
+        if product_count:
+            statuses.append(ScraperStatusResponse(
+                name=config.id,
+                last_run=last_run,
+                status="success",
+                last_product_count=product_count,
+                error_message=None
+            ))
+        else:
+            statuses.append(ScraperStatusResponse(
+                name=config.id,
+                last_run=None,
+                status="never_run",
+                last_product_count=0,
+                error_message=None
+            ))
+
+    return statuses
+
+
 @router.get("/status", response_model=List[ScraperStatusResponse])
-async def get_scraper_status(db: Session = Depends(get_db)):
+def get_scraper_status(db: Session = Depends(get_db)):
     """
     Get status and metadata for all configured scrapers.
 
@@ -388,66 +673,31 @@ async def get_scraper_status(db: Session = Depends(get_db)):
     - Current status (success/failed/never_run)
     - Error messages if any
 
-    Useful for monitoring scraper health and scheduling.
+    Useful for monitoring scraper health and scheduling. Dashboards poll
+    this, so results are cached briefly and dropped when a run finishes.
     """
-    statuses = []
-
-    for config in ScraperRegistry.get_all().values():
-        try:
-            # Find dispensary in database
-            dispensary = db.query(Dispensary).filter(
-                Dispensary.name == config.dispensary_name
-            ).first()
-
-            if dispensary:
-                # Get most recent price update as proxy for last scraper run
-                latest_price = db.query(Price).filter(
-                    Price.dispensary_id == dispensary.id
-                ).order_by(desc(Price.last_updated)).first()
-
-                if latest_price:
-                    # Count products from this dispensary
-                    product_count = db.query(Price).filter(
-                        Price.dispensary_id == dispensary.id
-                    ).count()
-
-                    statuses.append(ScraperStatusResponse(
-                        name=config.id,
-                        last_run=latest_price.last_updated,
-                        status="success",
-                        last_product_count=product_count,
-                        error_message=None
-                    ))
-                else:
-                    statuses.append(ScraperStatusResponse(
-                        name=config.id,
-                        last_run=None,
-                        status="never_run",
-                        last_product_count=0,
-                        error_message=None
-                    ))
-            else:
-                statuses.append(ScraperStatusResponse(
-                    name=config.id,
-                    last_run=None,
-                    status="never_run",
-                    last_product_count=0,
-                    error_message="Dispensary not found in database"
-                ))
-        except Exception as e:
-            statuses.append(ScraperStatusResponse(
+    try:
+        return _status_cache.get_or_set(
+            ScraperRegistry.version(),
+            lambda: (_load_scraper_statuses(db), None)
+        )
+    except SQLAlchemyError as e:
+        # Not cached, so statuses recover as soon as the database does
+        db.rollback()
+        return [
+            ScraperStatusResponse(
                 name=config.id,
                 last_run=None,
                 status="failed",
                 last_product_count=0,
                 error_message=str(e)
-            ))
-
-    return statuses
+            )
+            for config in ScraperRegistry.get_all().values()
+        ]
 
 
 @router.get("/products/recent/{scraper_id}", response_model=List[RecentProductResponse])
-async def get_recent_products(
+def get_recent_products(
     scraper_id: str,
     limit: int = 20,
     db: Session = Depends(get_db)
@@ -473,54 +723,35 @@ async def get_recent_products(
             detail=f"Scraper '{scraper_id}' not found"
         )
 
-    # Find dispensary
-    dispensary = db.query(Dispensary).filter(
-        Dispensary.name == config.dispensary_name
-    ).first()
+    dispensary_id = _dispensary_id(db, config.dispensary_name)
 
-    if not dispensary:
+    if not dispensary_id:
         raise HTTPException(
             status_code=404,
             detail=f"Dispensary '{config.dispensary_name}' not found in database"
         )
 
-    # Get recent products with prices from this dispensary
-    recent_prices = db.query(Price).filter(
-        Price.dispensary_id == dispensary.id
-    ).order_by(desc(Price.last_updated)).limit(limit).all()
-
-    if not recent_prices:
-        return []
-
-    # Build response with product details
-    results = []
-    for price in recent_prices:
-        product = price.product
-        brand = product.brand
-
-        results.append(RecentProductResponse(
-            product_id=product.id,
-            name=product.name,
-            brand=brand.name if brand else "Unknown",
-            product_type=product.product_type,
-            thc_percentage=product.thc_percentage,
-            price=price.amount,
-            dispensary=dispensary.name,
-            in_stock=price.in_stock,
-            created_at=product.created_at
-        ))
-
-    return results
-
-
-# ========== Backwards Compatibility Endpoints ==========
-
-@router.post("/run/wholesomeco")
-async def run_wholesomeco_legacy(db: Session = Depends(get_db)):
-    """
-    Legacy endpoint for running WholesomeCo scraper.
-
-    Deprecated: Use POST /run/wholesomeco instead.
-    """
-    runner = ScraperRunner(db)
-    return await runner.run_wholesomeco()
+    # Get recent products with prices from this dispensary, projecting just
+    # the response columns instead of loading full Price/Product/Brand rows
+    rows = db.execute(
+        select(
+            Product.id.label("product_id"),
+            Product.name.label("name"),
+            func.coalesce(Brand.name, "Unknown").label("brand"),
+            Product.product_type.label("product_type"),
+            Product.thc_percentage.label("thc_percentage"),
+            Price.amount.label("price"),
+            Price.in_stock.label("in_stock"),
+            Product.created_at.label("created_at"),
+        )
+        .join(Product, Product.id == Price.product_id)
+        .outerjoin(Brand, Brand.id == Product.brand_id)
+        .where(Price.dispensary_id == dispensary_id)
+        .order_by(desc(Price.last_updated))
+        .limit(limit)
+    ).mappings()
+
+    return [
+        RecentProductResponse.model_construct(dispensary=config.dispensary_name, **row)
+        for row in rows
+    ]
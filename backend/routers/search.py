@@ -1,16 +1,35 @@
 """Product search and autocomplete endpoints with fuzzy matching"""
-from fastapi import APIRouter, Query, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from fastapi import APIRouter, Query, Depends, HTTPException, Response
+from sqlalchemy.orm import Session, contains_eager, joinedload, load_only
+from sqlalchemy import case, distinct, func, or_
 from database import get_db
 from models import Product, Brand, Price, Dispensary
-from rapidfuzz import fuzz
+from services.response_cache import TTLCache
+from rapidfuzz import fuzz, process
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
+import orjson
 
 router = APIRouter(prefix="/api/products", tags=["products", "search"])
 
+# Most candidates re-scored with rapidfuzz: the best trigram matches on
+# PostgreSQL, the names matching the most query words elsewhere
+SEARCH_CANDIDATE_LIMIT = 200
 
-@router.get("/search")
+# Search and autocomplete responses, pre-encoded as JSON and keyed on the
+# normalized query and filters. Scraper runs clear them; the TTL bounds
+# staleness from writes that don't (scheduled runs, admin edits).
+_search_cache = TTLCache(maxsize=512, ttl=60)
+_autocomplete_cache = TTLCache(maxsize=512, ttl=300)
+
+
+def clear_search_caches() -> None:
+    """Drop cached search and autocomplete responses after products or prices change"""
+    _search_cache.clear()
+    _autocomplete_cache.clear()
+
+
+@router.get("/search", response_model=List[Dict[str, Any]])
 async def search_products(
     q: str = Query(..., min_length=2, description="Search query for product names or brands"),
     product_type: Optional[str] = Query(None, description="Filter by product type (Flower, Concentrate, Edible, etc.)"),
@@ -23,12 +42,15 @@ async def search_products(
     sort_by: str = Query("relevance", pattern="^(relevance|price_low|price_high|thc|cbd)$", description="Sort order"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
     db: Session = Depends(get_db)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Search products with fuzzy matching and filtering.
 
-    Uses ILIKE pre-filtering to narrow candidates, then WRatio multi-strategy
-    fuzzy scoring with an exact-substring bonus for precise relevancy.
+    On PostgreSQL, pg_trgm picks and ranks candidates (word ILIKE or trigram
+    similarity on product/brand name, served by GIN trigram indexes);
+    elsewhere an ILIKE pre-filter narrows them. Candidates are then scored
+    with WRatio multi-strategy fuzzy matching and an exact-substring bonus
+    for precise relevancy.
 
     Args:
         q: Search query string (minimum 2 characters)
@@ -46,24 +68,99 @@ async def search_products(
     Returns:
         List of product dictionaries with pricing and relevance info
     """
-
     query_lower = q.strip().lower()
+    product_type = product_type.lower() if product_type else None
+
+    # Results are served from the response cache (pre-encoded JSON)
+    def render():
+        results = _search_products(
+            db, query_lower, product_type, min_price, max_price,
+            min_thc, max_thc, min_cbd, max_cbd, sort_by, limit
+        )
+        return orjson.dumps(results), None
+
+    key = (query_lower, product_type, min_price, max_price,
+           min_thc, max_thc, min_cbd, max_cbd, sort_by, limit)
+    content = _search_cache.get_or_set(key, render)
+    return Response(content=content, media_type="application/json")
+
+
+def _search_products(
+    db: Session,
+    query_lower: str,
+    product_type: Optional[str],
+    min_price: Optional[float],
+    max_price: Optional[float],
+    min_thc: Optional[float],
+    max_thc: Optional[float],
+    min_cbd: Optional[float],
+    max_cbd: Optional[float],
+    sort_by: str,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """Run a product search (uncached); arguments as for search_products, query lowercased"""
 
-    # Pre-filter: only load products whose name contains at least one query word.
-    # This dramatically reduces the candidate pool before expensive fuzzy matching.
-    # Falls back to all products if the pre-filter yields no candidates (handles
-    # plural/singular mismatches like "gummies" vs "gummy").
     words = [w for w in query_lower.split() if len(w) >= 2]
-    base_query = (
-        db.query(Product)
-        .options(joinedload(Product.brand))
-        .filter(Product.is_master.is_(True))
+    # Only the columns scoring and the response read are loaded
+    base_query = db.query(Product).filter(Product.is_master.is_(True)).options(
+        load_only(
+            Product.name, Product.name_lower, Product.product_type,
+            Product.thc_percentage, Product.cbd_percentage, Product.brand_id,
+        )
     )
-    if words:
+    brand_columns = (Brand.name, Brand.name_lower)
+
+    # Attribute filters run in SQL so filtered-out products are never scored.
+    # Comparisons against NULL are false, so products missing a value are
+    # excluded by any bound on it.
+    if product_type:
+        base_query = base_query.filter(func.lower(Product.product_type) == product_type)
+    if min_thc is not None:
+        base_query = base_query.filter(Product.thc_percentage >= min_thc)
+    if max_thc is not None:
+        base_query = base_query.filter(Product.thc_percentage <= max_thc)
+    if min_cbd is not None:
+        base_query = base_query.filter(Product.cbd_percentage >= min_cbd)
+    if max_cbd is not None:
+        base_query = base_query.filter(Product.cbd_percentage <= max_cbd)
+
+    if db.get_bind().dialect.name == "postgresql":
+        # `%` is pg_trgm's similarity match, so typos and plural/singular
+        # mismatches are caught here without a fallback to every product
+        products = (
+            base_query
+            .join(Product.brand)
+            .options(contains_eager(Product.brand).load_only(*brand_columns))
+            .filter(or_(
+                *(Product.name.ilike(f"%{w}%") for w in words),
+                Product.name.op("%")(query_lower),
+                Brand.name.op("%")(query_lower),
+            ))
+            .order_by((
+                func.similarity(Product.name, query_lower) * 0.8
+                + func.similarity(Brand.name, query_lower) * 0.2
+            ).desc())
+            .limit(SEARCH_CANDIDATE_LIMIT)
+            .all()
+        )
+    elif words:
+        # Pre-filter: only load products whose name contains at least one query word.
+        # This dramatically reduces the candidate pool before expensive fuzzy matching.
+        # Falls back to all products if the pre-filter yields no candidates (handles
+        # plural/singular mismatches like "gummies" vs "gummy").
+        # Names matching more of the query words are kept first when the
+        # pre-filter would otherwise hand thousands of rows to the scorer.
+        base_query = base_query.options(joinedload(Product.brand).load_only(*brand_columns))
         ilike_filters = []
         for w in words:
             ilike_filters.append(Product.name.ilike(f"%{w}%"))
-        filtered_query = base_query.filter(or_(*ilike_filters))
+        matched_words = sum(case((f, 1), else_=0) for f in ilike_filters)
+        filtered_query = (
+            base_query
+            .filter(or_(*ilike_filters))
+            .order_by(matched_words.desc())
+            .limit(SEARCH_CANDIDATE_LIMIT)
+        )
         products = filtered_query.all()
 
         # Fallback: if ILIKE pre-filter is too strict (e.g. plural/singular mismatch),
@@ -71,21 +168,36 @@ async def search_products(
         if not products:
             products = base_query.all()
     else:
-        products = base_query.all()
+        products = base_query.options(joinedload(Product.brand).load_only(*brand_columns)).all()
+
+    if not products:
+        return []
+
+    # Score each product using WRatio (best-of multiple fuzzy strategies),
+    # which picks the best of ratio, partial_ratio, token_sort_ratio and
+    # token_set_ratio per comparison. process.extract scores the whole list
+    # inside rapidfuzz, and each distinct brand name is scored only once.
+    # name_lower is generated by the database, so nothing is lowercased per request.
+    name_scores = [0.0] * len(products)
+    for _, score, index in process.extract(
+        query_lower, [product.name_lower for product in products],
+        scorer=fuzz.WRatio, limit=None
+    ):
+        name_scores[index] = score / 100.0
+
+    brand_names = list({product.brand.name_lower for product in products if product.brand})
+    brand_scores = {
+        brand_name: score / 100.0
+        for brand_name, score, _ in process.extract(
+            query_lower, brand_names, scorer=fuzz.WRatio, limit=None
+        )
+    }
 
-    # Score each product using WRatio (best-of multiple fuzzy strategies)
     scored_products = []
 
-    for product in products:
-        product_name_lower = product.name.lower()
-
-        # WRatio automatically picks the best of ratio, partial_ratio,
-        # token_sort_ratio, and token_set_ratio per comparison
-        name_score = fuzz.WRatio(query_lower, product_name_lower) / 100.0
-        brand_score = (
-            fuzz.WRatio(query_lower, product.brand.name.lower()) / 100.0
-            if product.brand else 0.0
-        )
+    for product, name_score in zip(products, name_scores):
+        product_name_lower = product.name_lower
+        brand_score = brand_scores.get(product.brand.name_lower, 0.0) if product.brand else 0.0
 
         # Weighted relevance: 80% product name, 20% brand name
         relevance_score = (name_score * 0.8) + (brand_score * 0.2)
@@ -101,62 +213,56 @@ async def search_products(
     # Sort by relevance initially
     scored_products.sort(key=lambda x: x[1], reverse=True)
 
-    # Apply filters and gather price data
-    filtered = []
-    for product, score in scored_products:
-        # Filter by product type (case-insensitive)
-        if product_type:
-            if product.product_type.lower() != product_type.lower():
-                continue
-
-        # Filter by THC percentage
-        if min_thc is not None and (product.thc_percentage is None or product.thc_percentage < min_thc):
-            continue
-        if max_thc is not None and (product.thc_percentage is None or product.thc_percentage > max_thc):
-            continue
-
-        # Filter by CBD percentage
-        if min_cbd is not None and (product.cbd_percentage is None or product.cbd_percentage < min_cbd):
-            continue
-        if max_cbd is not None and (product.cbd_percentage is None or product.cbd_percentage > max_cbd):
-            continue
-
-        # Get prices across all variants for this parent product
-        variant_ids = [
-            v.id for v in
-            db.query(Product.id).filter(Product.master_product_id == product.id).all()
-        ]
-        price_product_ids = variant_ids if variant_ids else [product.id]
-        prices = db.query(Price).filter(
-            Price.product_id.in_(price_product_ids),
-            Price.in_stock == True
-        ).all()
-
-        # Skip products with no prices
-        if not prices:
-            continue
-
-        # Filter by price range if specified
-        if min_price is not None or max_price is not None:
-            valid_prices = [
-                p for p in prices
-                if (min_price is None or p.amount >= min_price) and
-                   (max_price is None or p.amount <= max_price)
-            ]
-            # Don't skip product entirely, just use filtered prices
-            prices = valid_prices
-
-        # Skip products with no valid prices after all filtering
-        if not prices:
-            continue
-
-        filtered.append((product, score, prices))
+    # Load variants, then aggregate in-stock prices per scored product, in
+    # two queries rather than two per product
+    scored_ids = [product.id for product, _ in scored_products]
+    variants_by_master: Dict[str, List[Any]] = defaultdict(list)
+    price_stats: Dict[str, Any] = {}
+    if scored_ids:
+        for variant in db.query(
+            Product.id, Product.master_product_id, Product.weight, Product.is_master
+        ).filter(Product.master_product_id.in_(scored_ids)):
+            variants_by_master[variant.master_product_id].append(variant)
+
+        # Prices live on the variants; a product without variants holds its own
+        price_product_ids = [
+            variant.id
+            for product_id in scored_ids
+            for variant in variants_by_master.get(product_id, ())
+        ] + [product_id for product_id in scored_ids if product_id not in variants_by_master]
+
+        # Grouped by parent so a dispensary stocking several sizes counts once
+        parent_id = func.coalesce(Product.master_product_id, Product.id)
+        stats_query = (
+            db.query(
+                parent_id.label("product_id"),
+                func.min(Price.amount).label("min_price"),
+                func.max(Price.amount).label("max_price"),
+                func.count(distinct(Price.dispensary_id)).label("dispensary_count"),
+            )
+            .join(Product, Product.id == Price.product_id)
+            .filter(Price.product_id.in_(price_product_ids), Price.in_stock == True)
+            .group_by(parent_id)
+        )
+        # Price range filters drop individual prices, not whole products
+        if min_price is not None:
+            stats_query = stats_query.filter(Price.amount >= min_price)
+        if max_price is not None:
+            stats_query = stats_query.filter(Price.amount <= max_price)
+        price_stats = {row.product_id: row for row in stats_query}
+
+    # Skip products with no (in-range) in-stock prices
+    filtered = [
+        (product, score, price_stats[product.id])
+        for product, score in scored_products
+        if product.id in price_stats
+    ]
 
     # Apply sorting
     if sort_by == "price_low":
-        filtered.sort(key=lambda x: min(p.amount for p in x[2]))
+        filtered.sort(key=lambda x: x[2].min_price)
     elif sort_by == "price_high":
-        filtered.sort(key=lambda x: min(p.amount for p in x[2]), reverse=True)
+        filtered.sort(key=lambda x: x[2].min_price, reverse=True)
     elif sort_by == "thc":
         filtered.sort(key=lambda x: x[0].thc_percentage or 0, reverse=True)
     elif sort_by == "cbd":
@@ -165,17 +271,11 @@ async def search_products(
 
     # Build response data
     results = []
-    for product, score, prices in filtered[:limit]:
-        min_price_val = min(p.amount for p in prices)
-        max_price_val = max(p.amount for p in prices)
-
+    for product, score, stats in filtered[:limit]:
         # Collect available weights from variants
-        variants = db.query(Product).filter(
-            Product.master_product_id == product.id,
-            Product.is_master == False
-        ).all()
         available_weights = sorted(set(
-            v.weight for v in variants if v.weight
+            v.weight for v in variants_by_master.get(product.id, ())
+            if v.weight and not v.is_master
         ))
 
         results.append({
@@ -186,9 +286,9 @@ async def search_products(
             "thc": product.thc_percentage,
             "cbd": product.cbd_percentage,
             "type": product.product_type,
-            "min_price": float(min_price_val),
-            "max_price": float(max_price_val),
-            "dispensary_count": len(set(p.dispensary_id for p in prices)),
+            "min_price": float(stats.min_price),
+            "max_price": float(stats.max_price),
+            "dispensary_count": stats.dispensary_count,
             "available_weights": available_weights,
             "relevance_score": round(score, 2)
         })
@@ -196,16 +296,17 @@ async def search_products(
     return results
 
 
-@router.get("/autocomplete")
+@router.get("/autocomplete", response_model=List[Dict[str, Any]])
 async def autocomplete_products(
     q: str = Query(..., min_length=2, description="Autocomplete query"),
     limit: int = Query(10, ge=1, le=20, description="Maximum suggestions"),
     db: Session = Depends(get_db)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Autocomplete endpoint for search suggestions.
 
-    Uses fast ILIKE prefix matching for quick suggestions.
+    Names starting with the query come first (an indexed prefix scan);
+    names containing it elsewhere fill any remaining slots.
 
     Args:
         q: Query string (minimum 2 characters)
@@ -215,21 +316,52 @@ async def autocomplete_products(
     Returns:
         List of product suggestions with id, name, and brand
     """
+    def render():
+        return orjson.dumps(_autocomplete_products(db, q, limit)), None
 
-    # Use ILIKE for fast prefix matching (case-insensitive)
-    query_pattern = f"%{q}%"
+    # Matching is case-insensitive, so case variants share an entry
+    content = _autocomplete_cache.get_or_set((q.lower(), limit), render)
+    return Response(content=content, media_type="application/json")
 
-    products = (
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (escape char: backslash)"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _autocomplete_products(db: Session, q: str, limit: int) -> List[Dict[str, Any]]:
+    """Look up autocomplete suggestions (uncached)"""
+
+    term = _escape_like(q.lower())
+    prefix_pattern = f"{term}%"
+    base_query = (
         db.query(Product)
         .options(joinedload(Product.brand))
-        .filter(
-            Product.is_master == True,
-            Product.name.ilike(query_pattern)
-        )
+        .filter(Product.is_master == True)
+    )
+
+    # Prefix matches first: a range scan on the name_lower pattern index
+    products = (
+        base_query
+        .filter(Product.name_lower.like(prefix_pattern, escape="\\"))
+        .order_by(Product.name_lower)
         .limit(limit)
         .all()
     )
 
+    # Fill remaining slots with mid-name matches (trigram index on PostgreSQL)
+    if len(products) < limit:
+        products += (
+            base_query
+            .filter(
+                Product.name.ilike(f"%{term}%", escape="\\"),
+                ~Product.name_lower.like(prefix_pattern, escape="\\")
+            )
+            .order_by(Product.name_lower)
+            .limit(limit - len(products))
+            .all()
+        )
+
     suggestions = [
         {
             "id": str(product.id),
@@ -3,7 +3,8 @@ User profile and review history endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from sqlalchemy import select
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 
 from database import get_db
@@ -25,18 +26,22 @@ class ReviewResponse(BaseModel):
     value_rating: int
     comment: str
     upvotes: int
-    created_at: str
+    created_at: datetime
 
     class Config:
         from_attributes = True
 
 
+# Validates a whole page of review rows in one pydantic-core call
+_review_list_adapter = TypeAdapter(list[ReviewResponse])
+
+
 class UserProfileResponse(BaseModel):
     """User profile response model (own profile only — includes email)"""
     id: str
     email: str
     username: str
-    created_at: str
+    created_at: datetime
     review_count: int
 
     class Config:
@@ -48,7 +53,7 @@ class PublicUserProfileResponse(BaseModel):
     and this endpoint is unauthenticated."""
     id: str
     username: str
-    created_at: str
+    created_at: datetime
     review_count: int
 
     class Config:
@@ -60,11 +65,35 @@ class UserProfileUpdateRequest(BaseModel):
     username: str | None = None
 
 
+# Helper functions
+def _list_user_reviews(db: Session, user_id: str, limit: int, skip: int) -> list[ReviewResponse]:
+    """A user's reviews, newest first, with product names joined in the same query"""
+    rows = db.execute(
+        select(
+            Review.id,
+            Review.product_id,
+            Product.name.label("product_name"),
+            Review.rating,
+            Review.effects_rating,
+            Review.taste_rating,
+            Review.value_rating,
+            Review.comment,
+            Review.upvotes,
+            Review.created_at,
+        )
+        .join(Product, Review.product_id == Product.id)
+        .where(Review.user_id == user_id)
+        .order_by(Review.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    return _review_list_adapter.validate_python(rows, from_attributes=True)
+
+
 # Endpoints
 @router.get("/me", response_model=UserProfileResponse)
 async def get_user_profile(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
 ) -> dict:
     """
     Get current authenticated user's profile
@@ -73,19 +102,16 @@ async def get_user_profile(
 
     Args:
         current_user: Current authenticated user from JWT token
-        db: Database session
 
     Returns:
         User profile with statistics
     """
-    review_count = db.query(Review).filter(Review.user_id == current_user.id).count()
-
     return {
-        "id": str(current_user.id),
+        "id": current_user.id,
         "email": current_user.email,
         "username": current_user.username,
-        "created_at": current_user.created_at.isoformat(),
-        "review_count": review_count,
+        "created_at": current_user.created_at,
+        "review_count": current_user.review_count,
     }
 
 
@@ -129,14 +155,12 @@ async def update_user_profile(
     db.commit()
     db.refresh(current_user)
 
-    review_count = db.query(Review).filter(Review.user_id == current_user.id).count()
-
     return {
-        "id": str(current_user.id),
+        "id": current_user.id,
         "email": current_user.email,
         "username": current_user.username,
-        "created_at": current_user.created_at.isoformat(),
-        "review_count": review_count,
+        "created_at": current_user.created_at,
+        "review_count": current_user.review_count,
     }
 
 
@@ -146,7 +170,7 @@ async def get_user_reviews(
     db: Session = Depends(get_db),
     limit: int = 50,
     skip: int = 0,
-) -> list:
+) -> list[ReviewResponse]:
     """
     Get user's review history
 
@@ -162,32 +186,7 @@ async def get_user_reviews(
     Returns:
         List of user's reviews with product details
     """
-    reviews = (
-        db.query(Review)
-        .join(Product, Review.product_id == Product.id)
-        .filter(Review.user_id == current_user.id)
-        .order_by(Review.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
-    result = []
-    for review in reviews:
-        result.append({
-            "id": str(review.id),
-            "product_id": str(review.product_id),
-            "product_name": review.product.name,
-            "rating": review.rating,
-            "effects_rating": review.effects_rating,
-            "taste_rating": review.taste_rating,
-            "value_rating": review.value_rating,
-            "comment": review.comment,
-            "upvotes": review.upvotes,
-            "created_at": review.created_at.isoformat(),
-        })
-
-    return result
+    return _list_user_reviews(db, current_user.id, limit, skip)
 
 
 @router.get("/{user_id}", response_model=PublicUserProfileResponse)
@@ -217,13 +216,11 @@ async def get_public_user_profile(
             detail="User not found",
         )
 
-    review_count = db.query(Review).filter(Review.user_id == user_id).count()
-
     return {
-        "id": str(user.id),
+        "id": user.id,
         "username": user.username,
-        "created_at": user.created_at.isoformat(),
-        "review_count": review_count,
+        "created_at": user.created_at,
+        "review_count": user.review_count,
     }
 
 
@@ -233,7 +230,7 @@ async def get_public_user_reviews(
     db: Session = Depends(get_db),
     limit: int = 50,
     skip: int = 0,
-) -> list:
+) -> list[ReviewResponse]:
     """
     Get public review history for a user
 
@@ -258,29 +255,4 @@ async def get_public_user_reviews(
             detail="User not found",
         )
 
-    reviews = (
-        db.query(Review)
-        .join(Product, Review.product_id == Product.id)
-        .filter(Review.user_id == user_id)
-        .order_by(Review.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
-    result = []
-    for review in reviews:
-        result.append({
-            "id": str(review.id),
-            "product_id": str(review.product_id),
-            "product_name": review.product.name,
-            "rating": review.rating,
-            "effects_rating": review.effects_rating,
-            "taste_rating": review.taste_rating,
-            "value_rating": review.value_rating,
-            "comment": review.comment,
-            "upvotes": review.upvotes,
-            "created_at": review.created_at.isoformat(),
-        })
-
-    return result
+    return _list_user_reviews(db, user_id, limit, skip)
@@ -1,14 +1,27 @@
-"""Watchlist endpoints for managing user's watched products"""
+"""
+Watchlist endpoints for managing user's watched products
+
+The endpoints only do sync SQLAlchemy work, so they are plain ``def`` and
+run in FastAPI's threadpool rather than on the event loop.
+"""
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import Float, func, literal, select
 from pydantic import BaseModel
 from typing import Optional
-from database import get_db
-from models import Watchlist, Product, Price, User
+from database import dialect_insert, get_db
+from models import Watchlist, Product, User
 from routers.auth import get_current_user
+from services.response_cache import TTLCache
 
 router = APIRouter(prefix="/api/watchlist", tags=["watchlist"])
 
+# "Is this product watched?" is asked on every product page render. Answers
+# are keyed per user and product and tagged with the user id, so adding or
+# removing a watch drops that user's cached answers; the TTL bounds staleness
+# from writes made elsewhere (product merges).
+_check_cache = TTLCache(maxsize=4096, ttl=30)
+
 
 class WatchlistAdd(BaseModel):
     product_id: str
@@ -29,56 +42,54 @@ class WatchlistResponse(BaseModel):
 
 
 @router.post("/add")
-async def add_to_watchlist(
+def add_to_watchlist(
     data: WatchlistAdd,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Add product to user's watchlist with alert preferences"""
 
-    # Verify product exists
-    product = db.query(Product).filter(Product.id == data.product_id).first()
-    if not product:
-        raise HTTPException(status_code=404, detail="Product not found")
-
-    # Resolve variant to parent - watchlist always tracks parent products
-    if not product.is_master and product.master_product_id:
-        parent = db.query(Product).filter(Product.id == product.master_product_id).first()
-        if parent:
-            product = parent
-            data.product_id = product.id
-
-    # Check if already in watchlist
-    existing = db.query(Watchlist).filter(
-        Watchlist.user_id == current_user.id,
-        Watchlist.product_id == data.product_id
-    ).first()
+    # Resolve variant to parent (the watchlist always tracks parent products)
+    # and insert in one statement: INSERT ... SELECT FROM products yields no
+    # row for an unknown product, and the (user_id, product_id) unique
+    # constraint turns a duplicate into a no-op
+    source = select(
+        literal(current_user.id),
+        func.coalesce(Product.master_product_id, Product.id),
+        literal(data.alert_on_stock),
+        literal(data.alert_on_price_drop),
+        literal(data.price_drop_threshold, Float),
+    ).where(Product.id == data.product_id)
+    stmt = (
+        dialect_insert(db, Watchlist)
+        .from_select(
+            ["user_id", "product_id", "alert_on_stock", "alert_on_price_drop", "price_drop_threshold"],
+            source,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "product_id"])
+        .returning(Watchlist.id, Watchlist.product_id)
+    )
+    inserted = db.execute(stmt).one_or_none()
 
-    if existing:
+    if inserted is None:
+        # Only the failure path pays for a second lookup to tell the cases apart
+        db.rollback()
+        if db.scalar(select(Product.id).where(Product.id == data.product_id)) is None:
+            raise HTTPException(status_code=404, detail="Product not found")
         raise HTTPException(status_code=400, detail="Product already in watchlist")
 
-    # Create watchlist item
-    watchlist_item = Watchlist(
-        user_id=current_user.id,
-        product_id=data.product_id,
-        alert_on_stock=data.alert_on_stock,
-        alert_on_price_drop=data.alert_on_price_drop,
-        price_drop_threshold=data.price_drop_threshold
-    )
-
-    db.add(watchlist_item)
     db.commit()
-    db.refresh(watchlist_item)
+    _check_cache.invalidate_tag(current_user.id)
 
     return {
         "status": "added",
-        "watchlist_id": watchlist_item.id,
-        "product_id": watchlist_item.product_id
+        "watchlist_id": inserted.id,
+        "product_id": inserted.product_id
     }
 
 
 @router.delete("/remove/{product_id}")
-async def remove_from_watchlist(
+def remove_from_watchlist(
     product_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -95,53 +106,81 @@ async def remove_from_watchlist(
 
     db.delete(item)
     db.commit()
+    _check_cache.invalidate_tag(current_user.id)
 
     return {"status": "removed", "product_id": product_id}
 
 
 @router.get("/", response_model=list[WatchlistResponse])
-async def get_watchlist(
+def get_watchlist(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's full watchlist with product details"""
 
-    items = db.query(Watchlist).filter(Watchlist.user_id == current_user.id).all()
+    # Product name and type come from a join in the same query, rather than
+    # lazy-loading each watched product one row at a time
+    rows = db.execute(
+        select(
+            Watchlist.id,
+            Watchlist.product_id,
+            Product.name.label("product_name"),
+            Product.product_type,
+            Watchlist.alert_on_stock,
+            Watchlist.alert_on_price_drop,
+            Watchlist.price_drop_threshold,
+            Watchlist.created_at,
+        )
+        .join(Product, Product.id == Watchlist.product_id)
+        .where(Watchlist.user_id == current_user.id)
+    )
 
+    # Rows come straight from the database, so responses are built with
+    # model_construct rather than validated field by field
     return [
-        WatchlistResponse(
-            id=item.id,
-            product_id=item.product_id,
-            product_name=item.product.name,
-            product_type=item.product.product_type,
-            alert_on_stock=item.alert_on_stock,
-            alert_on_price_drop=item.alert_on_price_drop,
-            price_drop_threshold=item.price_drop_threshold,
-            created_at=item.created_at.isoformat() if item.created_at else ""
+        WatchlistResponse.model_construct(
+            id=row.id,
+            product_id=row.product_id,
+            product_name=row.product_name,
+            product_type=row.product_type,
+            alert_on_stock=row.alert_on_stock,
+            alert_on_price_drop=row.alert_on_price_drop,
+            price_drop_threshold=row.price_drop_threshold,
+            created_at=row.created_at.isoformat() if row.created_at else ""
         )
-        for item in items
+        for row in rows
     ]
 
 
 @router.get("/check/{product_id}")
-async def check_watchlist(
+def check_watchlist(
     product_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Check if a specific product is in user's watchlist"""
 
-    item = db.query(Watchlist).filter(
-        Watchlist.user_id == current_user.id,
-        Watchlist.product_id == product_id
-    ).first()
-
-    return {
-        "is_watched": item is not None,
-        "watchlist_id": item.id if item else None,
-        "alert_settings": {
-            "alert_on_stock": item.alert_on_stock if item else None,
-            "alert_on_price_drop": item.alert_on_price_drop if item else None,
-            "price_drop_threshold": item.price_drop_threshold if item else None
-        } if item else None
-    }
+    def load():
+        item = db.execute(
+            select(
+                Watchlist.id,
+                Watchlist.alert_on_stock,
+                Watchlist.alert_on_price_drop,
+                Watchlist.price_drop_threshold,
+            ).where(
+                Watchlist.user_id == current_user.id,
+                Watchlist.product_id == product_id
+            )
+        ).first()
+
+        return {
+            "is_watched": item is not None,
+            "watchlist_id": item.id if item else None,
+            "alert_settings": {
+                "alert_on_stock": item.alert_on_stock,
+                "alert_on_price_drop": item.alert_on_price_drop,
+                "price_drop_threshold": item.price_drop_threshold
+            } if item else None
+        }, current_user.id
+
+    return _check_cache.get_or_set((current_user.id, product_id), load)
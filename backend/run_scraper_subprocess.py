@@ -1,72 +1,115 @@
 """
 Subprocess entry point for running scrapers.
 
-This script is executed in a separate process to run a single scraper.
+This script is executed in a separate process to run one or more scrapers.
 It uses asyncio.run() which provides a clean event loop that works with Playwright.
+Several scraper ids run concurrently in the one process, so a batch pays the
+interpreter start-up and scraper imports once rather than once per scraper.
+
+With --worker it instead stays up and runs scrapers sent to it on stdin, so the
+API can reuse one process across runs (see services/scraper_subprocess.py).
+
+Usage: python run_scraper_subprocess.py <scraper_id> [<scraper_id> ...]
+       python run_scraper_subprocess.py --worker
 """
 import sys
+import atexit
 import asyncio
+import importlib
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path so we can import from services
 sys.path.insert(0, str(Path(__file__).parent))
 
 from database import SessionLocal
 from services.scraper_runner import ScraperRunner
+from services.scrapers.base_scraper import shared_browser
+
+# Module that registers each scraper. Only the modules for the scrapers
+# being run are imported (see import_scrapers), so a one-off run doesn't pay
+# for every scraper's dependencies — keep in sync with main.py
+SCRAPER_MODULES = {
+    "wholesomeco": "services.scrapers.playwright_scraper",
+    "curaleaf-lehi": "services.scrapers.curaleaf_scraper",
+    "curaleaf-provo": "services.scrapers.curaleaf_scraper",
+    "curaleaf-springville": "services.scrapers.curaleaf_scraper",
+    "curaleaf-payson": "services.scrapers.curaleaf_scraper",
+    "curaleaf-park-city": "services.scrapers.curaleaf_park_city_scraper",
+    "beehive-brigham-city": "services.scrapers.beehive_farmacy_scraper",
+    "beehive-slc": "services.scrapers.beehive_farmacy_scraper",
+    "zion-medicinal": "services.scrapers.zion_medicinal_scraper",
+    "dragonfly-slc": "services.scrapers.dragonfly_wellness_scraper",
+    "dragonfly-price": "services.scrapers.dragonfly_price_scraper",
+    "bloc-south-jordan": "services.scrapers.bloc_pharmacy_scraper",
+    "bloc-st-george": "services.scrapers.bloc_pharmacy_scraper",
+    "flower-shop-logan": "services.scrapers.flower_shop_scraper",
+    "flower-shop-ogden": "services.scrapers.flower_shop_scraper",
+    "the-forest-murray": "services.scrapers.the_forest_scraper",
+}
 
-# Import all scrapers to trigger self-registration via decorators
-# This must happen before any scraper execution — keep in sync with main.py
-from services.scrapers.playwright_scraper import (  # noqa: F401
-    WholesomeCoScraper,
-)
-from services.scrapers.curaleaf_scraper import (  # noqa: F401
-    CuraleafScraper,
-    CuraleafProvoScraper,
-    CuraleafSpringvilleScraper,
-    CuraleafPaysonScraper,
-)
-from services.scrapers.beehive_farmacy_scraper import (  # noqa: F401
-    BeehiveFarmacyBrighamScraper,
-    BeehiveFarmacySLCScraper,
-)
-from services.scrapers.zion_medicinal_scraper import ZionMedicinalScraper  # noqa: F401
-from services.scrapers.dragonfly_wellness_scraper import DragonFlyWellnessSLCScraper  # noqa: F401
-from services.scrapers.bloc_pharmacy_scraper import (  # noqa: F401
-    BlocPharmacySouthJordanScraper,
-    BlocPharmacyStGeorgeScraper,
-)
-from services.scrapers.flower_shop_scraper import (  # noqa: F401
-    FlowerShopLoganScraper,
-    FlowerShopOgdenScraper,
-)
-from services.scrapers.the_forest_scraper import TheForestMurrayScraper  # noqa: F401
-from services.scrapers.dragonfly_price_scraper import DragonFlyWellnessPriceScraper  # noqa: F401
-from services.scrapers.curaleaf_park_city_scraper import CuraleafParkCityScraper  # noqa: F401
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
-async def run_scraper(scraper_id: str):
+def configure_logging() -> QueueListener:
+    """
+    Send log records through a queue to a background thread that writes stderr.
+
+    Scrapers log from inside the event loop that drives Playwright; with a
+    plain StreamHandler every record is a blocking write to a pipe the parent
+    process may be slow to drain. Here the loop only enqueues. The returned
+    listener is stopped at exit so queued records are flushed.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+    # Playwright's driver chatter isn't useful in scraper output
+    logging.getLogger('playwright').setLevel(logging.WARNING)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def import_scrapers(scraper_ids: List[str]) -> None:
+    """
+    Import the modules that register the given scrapers.
+
+    Unknown IDs are skipped; ScraperRunner reports them as unknown scrapers.
+    """
+    for scraper_id in scraper_ids:
+        module = SCRAPER_MODULES.get(scraper_id)
+        if module:
+            importlib.import_module(module)
+
+
+async def run_scraper(scraper_id: str, browser=None):
     """
     Run a scraper with its own database session.
 
     Args:
         scraper_id: The scraper ID to run
+        browser: Shared Playwright browser for the scraper to open a context in
 
     Returns:
         dict with scraper results
     """
+    import_scrapers([scraper_id])
     db = SessionLocal()
     try:
         logger.info(f"Starting scraper: {scraper_id}")
 
-        runner = ScraperRunner(db, triggered_by="subprocess")
+        runner = ScraperRunner(db, triggered_by="subprocess", browser=browser)
         result = await runner.run_by_id(scraper_id)
 
         logger.info(f"Scraper '{scraper_id}' completed: {result.get('status')}")
@@ -84,13 +127,126 @@ async def run_scraper(scraper_id: str):
         logger.info(f"Database session closed for scraper '{scraper_id}'")
 
 
+async def run_scrapers(scraper_ids: List[str]) -> dict:
+    """
+    Run several scrapers concurrently with one shared database session.
+
+    Browser-based scrapers share one Chromium, each in its own context,
+    rather than launching a browser apiece.
+
+    Args:
+        scraper_ids: The scraper IDs to run
+
+    Returns:
+        dict mapping scraper IDs to their results
+    """
+    import_scrapers(scraper_ids)
+    db = SessionLocal()
+    try:
+        logger.info(f"Starting scrapers: {', '.join(scraper_ids)}")
+
+        async with shared_browser() as browser:
+            runner = ScraperRunner(db, triggered_by="subprocess", browser=browser)
+            results = await runner.run_many(scraper_ids)
+
+        for scraper_id, result in results.items():
+            logger.info(f"Scraper '{scraper_id}' completed: {result.get('status')}")
+
+        return results
+
+    finally:
+        db.close()
+
+
+async def serve_jobs():
+    """
+    Worker mode: run the scrapers sent on stdin until stdin is closed.
+
+    Each input line is a JSON job {"job", "scraper_id", "timeout"}. When a job
+    finishes, one JSON line {"job", "status", "message"} is written to stdout;
+    logging goes to stderr, so stdout carries only these results. Jobs run
+    concurrently; the parent bounds how many it sends at once. One Chromium
+    is launched for the life of the worker and every job opens a context in it.
+    """
+    loop = asyncio.get_running_loop()
+    running = set()
+
+    async def run_job(job: dict):
+        try:
+            await asyncio.wait_for(
+                run_scraper(job["scraper_id"], browser), timeout=job["timeout"]
+            )
+            reply = {"status": "success", "message": "Scraper completed successfully"}
+        except asyncio.TimeoutError:
+            reply = {
+                "status": "timeout",
+                "message": f"Scraper timed out after {job['timeout']} seconds"
+            }
+        except Exception as e:
+            reply = {"status": "error", "message": str(e)}
+
+        sys.stdout.write(json.dumps({"job": job["job"], **reply}) + "\n")
+        sys.stdout.flush()
+
+    async with shared_browser() as browser:
+        logger.info("Scraper worker ready")
+        while True:
+            # Read stdin off the event loop; Windows can't poll pipes with asyncio
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            task = asyncio.create_task(run_job(json.loads(line)))
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        # The parent closed stdin: finish what's in flight, then exit
+        if running:
+            await asyncio.gather(*running)
+    logger.info("Scraper worker stopped")
+
+
+def use_uvloop() -> None:
+    """
+    Run asyncio.run() on uvloop when it is installed.
+
+    uvloop doesn't support Windows, where the default Proactor loop (needed
+    for Playwright's driver subprocess) is left in place.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Main entry point for subprocess scraper execution."""
+    configure_logging()
+    use_uvloop()
+
     if len(sys.argv) < 2:
-        logger.error("Usage: python run_scraper_subprocess.py <scraper_id>")
+        logger.error("Usage: python run_scraper_subprocess.py <scraper_id> [<scraper_id> ...]")
         sys.exit(1)
 
-    scraper_id = sys.argv[1]
+    if sys.argv[1:] == ["--worker"]:
+        asyncio.run(serve_jobs())
+        sys.exit(0)
+
+    scraper_ids = sys.argv[1:]
+    if len(scraper_ids) > 1:
+        try:
+            results = asyncio.run(run_scrapers(scraper_ids))
+        except Exception as e:
+            logger.error(f"Fatal error running scrapers {scraper_ids}: {e}", exc_info=True)
+            sys.exit(1)
+
+        # Fail the process if any scraper in the batch errored
+        failed = [sid for sid, result in results.items() if result.get("status") == "error"]
+        sys.exit(1 if failed else 0)
+
+    scraper_id = scraper_ids[0]
 
     try:
         # Run the scraper using asyncio.run() which provides a clean event loop
@@ -73,10 +73,13 @@ if __name__ == "__main__":
     else:
         reload = reload_env
 
+    # "auto" picks uvloop when it is installed (requirements.txt, not on
+    # Windows) and otherwise the asyncio loop, keeping the Proactor policy above
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
         reload=reload,
+        loop="auto",
         log_level="info"
     )
@@ -16,25 +16,27 @@ from models import Product, Price, ScraperFlag, ScraperRun
 from sqlalchemy import func
 
 
-def has_weight_in_name(name: str) -> bool:
-    """Check if a product name contains weight information."""
-    if not name:
-        return False
+# Weights in names: "3.5g", "1oz", "1/8 oz", "100mg", etc. {b} is the word
+# boundary escape, which PostgreSQL spells \y rather than \b
+WEIGHT_PATTERN = (
+    r'(?i)\s+\d+(?:\.\d+)?\s*(?:g|gram|grams|oz|ounce|mg|milligram|ml){b}|'
+    r'\s+\d+\s*/\s*\d+\s*(?:oz|ounce){b}'
+)
 
-    # Pattern to match weights: "3.5g", "1oz", "1/8 oz", "100mg", etc.
-    weight_pattern = re.compile(
-        r'\s+\d+(?:\.\d+)?\s*(?:g|gram|grams|oz|ounce|mg|milligram|ml)\b|'
-        r'\s+\d+\s*/\s*\d+\s*(?:oz|ounce)\b',
-        re.IGNORECASE
-    )
+# Seed data uses predictable IDs like "prod-001", "prod-002"
+SEED_ID_PATTERN = r'^prod-\d{3}'
+_SEED_ID_RE = re.compile(SEED_ID_PATTERN)
 
-    return bool(weight_pattern.search(name))
 
+def weight_in_name(db):
+    """SQL predicate matching product names that contain weight information."""
+    boundary = r'\y' if db.get_bind().dialect.name == 'postgresql' else r'\b'
+    return Product.name.regexp_match(WEIGHT_PATTERN.format(b=boundary))
 
-def is_seed_data(product: Product) -> bool:
+
+def is_seed_data(product) -> bool:
     """Determine if a product is from seed data (manually created)."""
-    # Seed data uses predictable IDs like "prod-001", "prod-002"
-    return product.id.startswith('prod-') and re.match(r'prod-\d{3}', product.id)
+    return bool(_SEED_ID_RE.match(product.id))
 
 
 def audit_products():
@@ -48,43 +50,62 @@ def audit_products():
         print()
 
         # Overall statistics
-        total_products = db.query(Product).count()
-        total_parents = db.query(Product).filter(Product.is_master == True).count()
-        total_variants = db.query(Product).filter(Product.is_master == False).count()
+        # Every product count in the report comes from one grouped query:
+        # (is_master, is seed data, weight in name) -> count. The regexes run
+        # in the database, so the audit never loads the products table
+        is_seed = Product.id.regexp_match(SEED_ID_PATTERN)
+        has_weight = weight_in_name(db)
+        buckets = [
+            (is_master, bool(seed), bool(weight), count)
+            for is_master, seed, weight, count in db.query(
+                Product.is_master, is_seed, has_weight, func.count(Product.id)
+            ).group_by(Product.is_master, is_seed, has_weight)
+        ]
+        total_products = sum(count for *_, count in buckets)
+        total_parents = sum(count for is_master, *_, count in buckets if is_master is True)
+        total_variants = sum(count for is_master, *_, count in buckets if is_master is False)
 
         print(f"Total Products: {total_products}")
         print(f"  - Parent products: {total_parents}")
         print(f"  - Variant products: {total_variants}")
         print()
 
-        # Check for weights in names
-        parents_with_weights = []
-        variants_with_weights = []
-
-        all_products = db.query(Product).all()
-        for product in all_products:
-            if has_weight_in_name(product.name):
-                if product.is_master:
-                    parents_with_weights.append(product)
-                else:
-                    variants_with_weights.append(product)
+        def weight_counts(master):
+            """(seed, scraped) counts of products with weights in names"""
+            seed = sum(
+                count for is_master, seed, weight, count in buckets
+                if is_master is master and weight and seed
+            )
+            scraped = sum(
+                count for is_master, seed, weight, count in buckets
+                if is_master is master and weight and not seed
+            )
+            return seed, scraped
+
+        def weight_examples(master):
+            """The first 10 products with weights in names; only these are loaded"""
+            return db.query(Product.id, Product.name, Product.master_product_id).filter(
+                Product.is_master == master, has_weight
+            ).limit(10).all()
+
+        parent_seed_count, parent_scraped_count = weight_counts(True)
+        parents_with_weights = parent_seed_count + parent_scraped_count
+        variant_seed_count, variant_scraped_count = weight_counts(False)
+        variants_with_weights = variant_seed_count + variant_scraped_count
 
         # Parent products with weights in names (PROBLEMATIC)
         print("=" * 70)
         print("PARENT Products with Weights in Names (PROBLEMATIC):")
         print("=" * 70)
-        print(f"Count: {len(parents_with_weights)}")
+        print(f"Count: {parents_with_weights}")
         print()
 
         if parents_with_weights:
-            seed_count = sum(1 for p in parents_with_weights if is_seed_data(p))
-            scraped_count = len(parents_with_weights) - seed_count
-
-            print(f"  - From seed data: {seed_count}")
-            print(f"  - From scrapers: {scraped_count}")
+            print(f"  - From seed data: {parent_seed_count}")
+            print(f"  - From scrapers: {parent_scraped_count}")
             print()
             print("Examples:")
-            for product in parents_with_weights[:10]:
+            for product in weight_examples(True):
                 origin = "SEED" if is_seed_data(product) else "SCRAPED"
                 print(f"  [{origin}] {product.id}: '{product.name}'")
         else:
@@ -95,23 +116,25 @@ def audit_products():
         print("=" * 70)
         print("VARIANT Products with Weights in Names:")
         print("=" * 70)
-        print(f"Count: {len(variants_with_weights)}")
+        print(f"Count: {variants_with_weights}")
         print()
 
         if variants_with_weights:
-            seed_count = sum(1 for v in variants_with_weights if is_seed_data(v))
-            scraped_count = len(variants_with_weights) - seed_count
-
-            print(f"  - From seed data: {seed_count}")
-            print(f"  - From scrapers: {scraped_count}")
+            print(f"  - From seed data: {variant_seed_count}")
+            print(f"  - From scrapers: {variant_scraped_count}")
             print()
             print("Note: Variants inherit names from parents. If parent has weight in name,")
             print("      variants will too. Check parent products first.")
             print()
             print("Examples:")
-            for variant in variants_with_weights[:10]:
-                parent = db.query(Product).filter(Product.id == variant.master_product_id).first()
-                parent_name = parent.name if parent else "UNKNOWN"
+            examples = weight_examples(False)
+            # Parent names for all examples in one IN query
+            parent_ids = {v.master_product_id for v in examples if v.master_product_id}
+            parent_names = dict(
+                db.query(Product.id, Product.name).filter(Product.id.in_(parent_ids)).all()
+            ) if parent_ids else {}
+            for variant in examples:
+                parent_name = parent_names.get(variant.master_product_id, "UNKNOWN")
                 origin = "SEED" if is_seed_data(variant) else "SCRAPED"
                 print(f"  [{origin}] {variant.id}: '{variant.name}' (parent: '{parent_name}')")
         else:
@@ -124,23 +147,23 @@ def audit_products():
         print("=" * 70)
 
         # Count scraped products
-        scraped_parents = [p for p in all_products if p.is_master and not is_seed_data(p)]
-        scraped_variants = [p for p in all_products if not p.is_master and not is_seed_data(p)]
-
-        print(f"Total Scraped Products: {len(scraped_parents) + len(scraped_variants)}")
-        print(f"  - Parents: {len(scraped_parents)}")
-        print(f"  - Variants: {len(scraped_variants)}")
+        scraped_parents = sum(
+            count for is_master, seed, _, count in buckets if is_master is True and not seed
+        )
+        scraped_variants = sum(
+            count for is_master, seed, _, count in buckets if is_master is False and not seed
+        )
+
+        print(f"Total Scraped Products: {scraped_parents + scraped_variants}")
+        print(f"  - Parents: {scraped_parents}")
+        print(f"  - Variants: {scraped_variants}")
         print()
 
         # Prices associated with scraped products
-        scraped_variant_ids = [v.id for v in scraped_variants]
-        if scraped_variant_ids:
-            scraped_prices = db.query(Price).filter(
-                Price.product_id.in_(scraped_variant_ids)
-            ).count()
-            print(f"Prices on scraped variants: {scraped_prices}")
-        else:
-            print(f"Prices on scraped variants: 0")
+        scraped_prices = db.query(Price).join(
+            Product, Product.id == Price.product_id
+        ).filter(Product.is_master == False, ~is_seed).count()
+        print(f"Prices on scraped variants: {scraped_prices}")
 
         # ScraperFlags
         total_flags = db.query(ScraperFlag).count()
@@ -158,7 +181,7 @@ def audit_products():
         print("Recommendations:")
         print("=" * 70)
 
-        if len(parents_with_weights) > 0:
+        if parents_with_weights > 0:
             print("⚠️  Parent products with weights in names detected!")
             print("   → Run purge_scraped_data.py to clean the database")
             print("   → Then re-run scrapers with the fixed pipeline")
@@ -166,9 +189,9 @@ def audit_products():
             print("✓ No parent products with weights in names")
             print("  → Database is clean!")
 
-        if len(scraped_parents) > 0 or len(scraped_variants) > 0:
+        if scraped_parents > 0 or scraped_variants > 0:
             print()
-            print(f"ℹ️  Found {len(scraped_parents) + len(scraped_variants)} scraped products")
+            print(f"ℹ️  Found {scraped_parents + scraped_variants} scraped products")
             print("   → These will be deleted when running purge_scraped_data.py")
             print("   → Seed data will be preserved")
 
@@ -25,6 +25,8 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import func, select
+
 from database import SessionLocal
 from models import Product, Price, Brand, Promotion, ScraperFlag
 
@@ -36,12 +38,15 @@ def clear_scraped_data():
         print("Clearing scraped data from database...")
         print()
 
-        # Count records before deletion
-        product_count = db.query(Product).count()
-        price_count = db.query(Price).count()
-        brand_count = db.query(Brand).count()
-        promo_count = db.query(Promotion).count()
-        flag_count = db.query(ScraperFlag).count()
+        # Count records before deletion, every table in one round trip. The
+        # counts are exact (not pg_class estimates) since they decide whether
+        # there is anything to delete
+        product_count, price_count, brand_count, promo_count, flag_count = db.execute(
+            select(*(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in (Product, Price, Brand, Promotion, ScraperFlag)
+            ))
+        ).one()
 
         print(f"Current database state:")
         print(f"   Products: {product_count}")
@@ -60,25 +65,29 @@ def clear_scraped_data():
 
         print("Deleting records...")
 
-        # Delete in order to respect foreign key constraints
+        # Delete in order to respect foreign key constraints. The session is
+        # discarded afterwards, so bulk deletes skip syncing it
+        # (synchronize_session=False) and no objects are evaluated in Python.
+        # TRUNCATE ... CASCADE is not used: it would also wipe the reviews and
+        # watchlists this script preserves.
         # 1. Delete Prices (references Product and Dispensary)
-        deleted = db.query(Price).delete()
+        deleted = db.query(Price).delete(synchronize_session=False)
         print(f"   [OK] Deleted {deleted} Price records")
 
         # 2. Delete ScraperFlags (references Product)
-        deleted = db.query(ScraperFlag).delete()
+        deleted = db.query(ScraperFlag).delete(synchronize_session=False)
         print(f"   [OK] Deleted {deleted} ScraperFlag records")
 
         # 3. Delete Products (master and variants)
-        deleted = db.query(Product).delete()
+        deleted = db.query(Product).delete(synchronize_session=False)
         print(f"   [OK] Deleted {deleted} Product records")
 
         # 4. Delete Brands (no longer referenced)
-        deleted = db.query(Brand).delete()
+        deleted = db.query(Brand).delete(synchronize_session=False)
         print(f"   [OK] Deleted {deleted} Brand records")
 
         # 5. Delete Promotions
-        deleted = db.query(Promotion).delete()
+        deleted = db.query(Promotion).delete(synchronize_session=False)
         print(f"   [OK] Deleted {deleted} Promotion records")
 
         # Commit all deletions
@@ -19,6 +19,8 @@ Options:
     --scroll: Enable infinite scroll (optional, default: false)
     --wait-for: CSS selector to wait for (default: .product)
     --output: Output directory (optional, default: discovery_output/)
+    --no-cache: Always call the LLM instead of reusing a cached analysis of
+                identical screenshot/HTML (cache lives in <output>/llm_cache)
 
 LLM Options:
     --llm glm       Use GLM (user has subscription) - $0.01 per analysis
@@ -119,6 +121,11 @@ async def main():
         default="discovery_output",
         help="Output directory for discovery files (default: discovery_output/)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the LLM analysis cache and always call the provider"
+    )
 
     args = parser.parse_args()
 
@@ -161,7 +168,8 @@ async def main():
     print(f"   Estimated Cost: ${provider.get_cost_estimate():.2f}")
     print("")
 
-    explorer = PlaywrightDiscoveryExplorer(headless=True)
+    cache_path = None if args.no_cache else str(Path(args.output) / "llm_cache")
+    explorer = PlaywrightDiscoveryExplorer(headless=True, cache_path=cache_path)
 
     try:
         result = await explorer.discover(
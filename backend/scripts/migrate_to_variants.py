@@ -17,10 +17,15 @@ Safe to run multiple times (idempotent).
 """
 import sys
 import os
+import uuid
+from collections import defaultdict
+from functools import lru_cache
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import bindparam, delete, func, insert, select, update
+
 from database import SessionLocal
 from models import Product, Price, Review, Watchlist, Brand
 from services.normalization.weight_parser import parse_weight, extract_weight_from_name
@@ -30,6 +35,57 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parents streamed, and variants inserted, per batch in phase 1
+PHASE1_BATCH_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def _extract_weight(name):
+    """
+    extract_weight_from_name, memoized for the run.
+
+    Phase 1 names new variants after their parents and phase 3 parses those
+    same names again, so each distinct name is parsed once.
+    """
+    return extract_weight_from_name(name)
+
+
+def move_ids(db, model, ids, **values):
+    """Bulk-UPDATE the given rows of `model` to `values` in one statement."""
+    if ids:
+        db.execute(
+            update(model)
+            .where(model.id.in_(ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def delete_ids(db, model, ids):
+    """Bulk-DELETE the given rows of `model` in one statement."""
+    if ids:
+        db.execute(
+            delete(model)
+            .where(model.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def insert_variants(db, new_variants, price_moves):
+    """
+    Insert queued variants in one executemany, then move each parent's prices
+    to its new variant in another.
+    """
+    if not new_variants:
+        return
+    db.execute(insert(Product), new_variants)
+    db.execute(
+        Price.__table__.update()
+        .where(Price.__table__.c.product_id == bindparam("parent_id"))
+        .values(product_id=bindparam("variant_id")),
+        price_moves
+    )
+
 
 def phase1_create_variants(db):
     """
@@ -38,73 +94,75 @@ def phase1_create_variants(db):
     """
     logger.info("=== Phase 1: Create variants from existing master products ===")
 
+    # Which parents already have variants, and how many prices each product
+    # has, are fetched up front rather than queried per parent
+    parents_with_variants = {
+        master_product_id for (master_product_id,) in
+        db.query(Product.master_product_id)
+        .filter(
+            Product.is_master == False,
+            Product.master_product_id.isnot(None)
+        )
+        .distinct()
+    }
+    price_counts = dict(
+        db.query(Price.product_id, func.count(Price.id)).group_by(Price.product_id)
+    )
+
+    # Stream parents in batches instead of loading them all at once
     parents = (
         db.query(Product)
         .filter(Product.is_master == True)
-        .all()
+        .enable_eagerloads(False)
+        .yield_per(PHASE1_BATCH_SIZE)
     )
 
     created = 0
     skipped = 0
+    new_variants = []
+    price_moves = []
 
     for parent in parents:
-        # Check if this parent already has variants
-        existing_variants = (
-            db.query(Product)
-            .filter(
-                Product.master_product_id == parent.id,
-                Product.is_master == False
-            )
-            .count()
-        )
-        if existing_variants > 0:
-            skipped += 1
-            continue
-
-        # Check if this parent has any prices
-        prices = (
-            db.query(Price)
-            .filter(Price.product_id == parent.id)
-            .all()
-        )
-        if not prices:
+        # Skip parents that already have variants or have no prices
+        if parent.id in parents_with_variants or not price_counts.get(parent.id):
             skipped += 1
             continue
 
         # Try to extract weight from product name
-        clean_name, weight_label, weight_grams = extract_weight_from_name(parent.name)
-
-        # Create variant
-        variant = Product(
-            name=parent.name,
-            product_type=parent.product_type,
-            brand_id=parent.brand_id,
-            thc_percentage=parent.thc_percentage,
-            cbd_percentage=parent.cbd_percentage,
-            is_master=False,
-            master_product_id=parent.id,
-            weight=weight_label,
-            weight_grams=weight_grams,
-            normalization_confidence=1.0
-        )
-        db.add(variant)
-        db.flush()
-
-        # Move all prices from parent to variant
-        for price in prices:
-            price.product_id = variant.id
+        clean_name, weight_label, weight_grams = _extract_weight(parent.name)
+
+        # Queue the variant and the move of the parent's prices to it
+        variant_id = str(uuid.uuid4())
+        new_variants.append({
+            "id": variant_id,
+            "name": parent.name,
+            "product_type": parent.product_type,
+            "brand_id": parent.brand_id,
+            "thc_percentage": parent.thc_percentage,
+            "cbd_percentage": parent.cbd_percentage,
+            "is_master": False,
+            "master_product_id": parent.id,
+            "weight": weight_label,
+            "weight_grams": weight_grams,
+            "normalization_confidence": 1.0,
+        })
+        price_moves.append({"parent_id": parent.id, "variant_id": variant_id})
 
         # If we extracted a weight from the name, clean up the parent name
         if weight_label and clean_name != parent.name:
             parent.name = clean_name
 
         created += 1
-        logger.info(
-            f"  Created variant for '{parent.name}' "
-            f"(weight={weight_label}, moved {len(prices)} prices)"
+        logger.debug(
+            "  Created variant for '%s' (weight=%s, moved %d prices)",
+            parent.name, weight_label, price_counts[parent.id]
         )
 
-    db.flush()
+        if len(new_variants) >= PHASE1_BATCH_SIZE:
+            insert_variants(db, new_variants, price_moves)
+            new_variants, price_moves = [], []
+
+    insert_variants(db, new_variants, price_moves)
     logger.info(f"Phase 1 complete: {created} variants created, {skipped} skipped")
     return created
 
@@ -126,128 +184,150 @@ def phase2_deduplicate(db):
     merged = 0
     processed_ids = set()
 
-    for i, product_a in enumerate(parents):
-        if product_a.id in processed_ids:
-            continue
-
-        for product_b in parents[i + 1:]:
-            if product_b.id in processed_ids:
-                continue
-            if product_b.brand_id != product_a.brand_id:
+    # Only same-brand products can merge, so compare within brand buckets
+    # rather than every pair of parents (each keeps created_at order)
+    brand_buckets = defaultdict(list)
+    for product in parents:
+        brand_buckets[product.brand_id].append(product)
+
+    # Normalize each name once rather than once per pair it is scored in
+    features = {
+        product.id: ProductMatcher.preprocess(product.name, thc=product.thc_percentage)
+        for product in parents
+    }
+
+    for bucket in brand_buckets.values():
+        for i, product_a in enumerate(bucket):
+            if product_a.id in processed_ids:
                 continue
 
-            # Score similarity
-            score, match_type = ProductMatcher.score_match(
-                scraped_name=product_b.name,
-                master_name=product_a.name,
-                scraped_brand="",  # Same brand, skip brand scoring
-                master_brand="",
-                scraped_thc=product_b.thc_percentage,
-                master_thc=product_a.thc_percentage
-            )
-
-            if match_type == "auto_merge":
-                logger.info(
-                    f"  Merging '{product_b.name}' into '{product_a.name}' "
-                    f"(score={score:.0%})"
+            for product_b in bucket[i + 1:]:
+                if product_b.id in processed_ids:
+                    continue
+                # Skip pairs whose name lengths alone rule out a merge
+                if not ProductMatcher.could_reach(
+                    features[product_b.id], features[product_a.id],
+                    ProductMatcher.AUTO_MERGE_THRESHOLD
+                ):
+                    continue
+
+                # Score similarity
+                # Same brand, so brands are left empty to skip brand scoring
+                score, match_type = ProductMatcher.score_prepared(
+                    features[product_b.id], features[product_a.id]
                 )
 
-                # Move product_b's variants under product_a
-                b_variants = (
-                    db.query(Product)
-                    .filter(
-                        Product.master_product_id == product_b.id,
-                        Product.is_master == False
+                if match_type == "auto_merge":
+                    # Kept at INFO: merges delete products, and this is their record
+                    logger.info(
+                        "  Merging '%s' into '%s' (score=%.0f%%)",
+                        product_b.name, product_a.name, score * 100
                     )
-                    .all()
-                )
-                for variant in b_variants:
-                    variant.master_product_id = product_a.id
-
-                # Move any direct prices from product_b to product_a's variants
-                b_prices = (
-                    db.query(Price)
-                    .filter(Price.product_id == product_b.id)
-                    .all()
-                )
-                if b_prices:
-                    # Find or create a default variant for product_a
-                    default_variant = (
-                        db.query(Product)
-                        .filter(
-                            Product.master_product_id == product_a.id,
+
+                    # Rows are moved with bulk UPDATEs and conflict losers removed
+                    # with bulk DELETEs (losers first, so moved rows never collide
+                    # with a unique constraint); only the columns needed to
+                    # resolve conflicts are read
+
+                    # Move product_b's variants under product_a
+                    db.execute(
+                        update(Product)
+                        .where(
+                            Product.master_product_id == product_b.id,
                             Product.is_master == False
                         )
-                        .first()
+                        .values(master_product_id=product_a.id)
+                        .execution_options(synchronize_session=False)
                     )
-                    if default_variant:
-                        for price in b_prices:
-                            # Check for conflict
-                            existing = (
-                                db.query(Price)
-                                .filter(
-                                    Price.product_id == default_variant.id,
-                                    Price.dispensary_id == price.dispensary_id
-                                )
-                                .first()
-                            )
-                            if not existing:
-                                price.product_id = default_variant.id
-                            else:
-                                db.delete(price)
 
-                # Move reviews (handle unique constraint conflicts)
-                b_reviews = (
-                    db.query(Review)
-                    .filter(Review.product_id == product_b.id)
-                    .all()
-                )
-                for review in b_reviews:
-                    existing = (
-                        db.query(Review)
-                        .filter(
-                            Review.user_id == review.user_id,
-                            Review.product_id == product_a.id
-                        )
-                        .first()
+                    # Move any direct prices from product_b to product_a's variants
+                    b_prices = (
+                        db.query(Price.id, Price.dispensary_id)
+                        .filter(Price.product_id == product_b.id)
+                        .all()
                     )
-                    if not existing:
-                        review.product_id = product_a.id
-                    else:
-                        # Keep the review with higher rating
-                        if review.rating > existing.rating:
-                            db.delete(existing)
-                            review.product_id = product_a.id
-                        else:
-                            db.delete(review)
-
-                # Move watchlist entries (skip conflicts)
-                b_watchlists = (
-                    db.query(Watchlist)
-                    .filter(Watchlist.product_id == product_b.id)
-                    .all()
-                )
-                for wl in b_watchlists:
-                    existing = (
-                        db.query(Watchlist)
-                        .filter(
-                            Watchlist.user_id == wl.user_id,
-                            Watchlist.product_id == product_a.id
+                    if b_prices:
+                        # Find or create a default variant for product_a
+                        default_variant_id = db.scalar(
+                            select(Product.id)
+                            .where(
+                                Product.master_product_id == product_a.id,
+                                Product.is_master == False
+                            )
+                            .limit(1)
                         )
-                        .first()
+                        if default_variant_id:
+                            # Dispensaries already priced on the variant (conflicts)
+                            priced_dispensaries = {
+                                dispensary_id for (dispensary_id,) in
+                                db.query(Price.dispensary_id)
+                                .filter(Price.product_id == default_variant_id)
+                            }
+                            moved, dropped = [], []
+                            for price_id, dispensary_id in b_prices:
+                                if dispensary_id not in priced_dispensaries:
+                                    moved.append(price_id)
+                                    priced_dispensaries.add(dispensary_id)
+                                else:
+                                    dropped.append(price_id)
+                            delete_ids(db, Price, dropped)
+                            move_ids(db, Price, moved, product_id=default_variant_id)
+
+                    # Move reviews (handle unique constraint conflicts)
+                    b_reviews = (
+                        db.query(Review.id, Review.user_id, Review.rating)
+                        .filter(Review.product_id == product_b.id)
+                        .all()
                     )
-                    if not existing:
-                        wl.product_id = product_a.id
-                    else:
-                        db.delete(wl)
-
-                # Mark product_b as merged (convert to variant or delete)
-                # Delete it since its data has been moved
-                db.delete(product_b)
-                processed_ids.add(product_b.id)
-                merged += 1
-
-    db.flush()
+                    if b_reviews:
+                        # user_id -> (review id, rating) of product_a's reviews
+                        a_reviews = {
+                            user_id: (review_id, rating) for review_id, user_id, rating in
+                            db.query(Review.id, Review.user_id, Review.rating)
+                            .filter(Review.product_id == product_a.id)
+                        }
+                        moved, dropped = [], []
+                        for review_id, user_id, rating in b_reviews:
+                            existing = a_reviews.get(user_id)
+                            if not existing:
+                                moved.append(review_id)
+                            # Keep the review with higher rating
+                            elif rating > existing[1]:
+                                dropped.append(existing[0])
+                                moved.append(review_id)
+                            else:
+                                dropped.append(review_id)
+                        delete_ids(db, Review, dropped)
+                        move_ids(db, Review, moved, product_id=product_a.id)
+
+                    # Move watchlist entries (skip conflicts)
+                    b_watchlists = (
+                        db.query(Watchlist.id, Watchlist.user_id)
+                        .filter(Watchlist.product_id == product_b.id)
+                        .all()
+                    )
+                    if b_watchlists:
+                        watching_users = {
+                            user_id for (user_id,) in
+                            db.query(Watchlist.user_id)
+                            .filter(Watchlist.product_id == product_a.id)
+                        }
+                        moved, dropped = [], []
+                        for watchlist_id, user_id in b_watchlists:
+                            if user_id not in watching_users:
+                                moved.append(watchlist_id)
+                                watching_users.add(user_id)
+                            else:
+                                dropped.append(watchlist_id)
+                        delete_ids(db, Watchlist, dropped)
+                        move_ids(db, Watchlist, moved, product_id=product_a.id)
+
+                    # Mark product_b as merged (convert to variant or delete)
+                    # Delete it since its data has been moved
+                    db.delete(product_b)
+                    processed_ids.add(product_b.id)
+                    merged += 1
+
     logger.info(f"Phase 2 complete: {merged} products merged")
     return merged
 
@@ -269,34 +349,33 @@ def phase3_parse_weights(db):
 
     updated = 0
     for variant in variants:
-        clean_name, weight_label, weight_grams = extract_weight_from_name(variant.name)
+        clean_name, weight_label, weight_grams = _extract_weight(variant.name)
         if weight_label:
             variant.weight = weight_label
             variant.weight_grams = weight_grams
             updated += 1
-            logger.info(f"  Parsed weight '{weight_label}' from '{variant.name}'")
+            logger.debug("  Parsed weight '%s' from '%s'", weight_label, variant.name)
 
-    db.flush()
     logger.info(f"Phase 3 complete: {updated} weights parsed")
     return updated
 
 
 def print_stats(db):
     """Print current database statistics."""
-    parents = db.query(Product).filter(Product.is_master == True).count()
-    variants = db.query(Product).filter(Product.is_master == False).count()
-    prices_on_parents = (
-        db.query(Price)
-        .join(Product)
-        .filter(Product.is_master == True)
-        .count()
+    # is_master -> count, one grouped query per table
+    products = dict(
+        db.query(Product.is_master, func.count(Product.id)).group_by(Product.is_master)
     )
-    prices_on_variants = (
-        db.query(Price)
+    prices = dict(
+        db.query(Product.is_master, func.count(Price.id))
+        .select_from(Price)
         .join(Product)
-        .filter(Product.is_master == False)
-        .count()
+        .group_by(Product.is_master)
     )
+    parents = products.get(True, 0)
+    variants = products.get(False, 0)
+    prices_on_parents = prices.get(True, 0)
+    prices_on_variants = prices.get(False, 0)
     total_reviews = db.query(Review).count()
 
     logger.info("=== Database Statistics ===")
@@ -313,6 +392,8 @@ def main():
         logger.info("Starting product variant migration...")
         print_stats(db)
 
+        # Phases don't flush; the next phase's queries autoflush and the
+        # single commit writes whatever is left
         phase1_create_variants(db)
         phase2_deduplicate(db)
         phase3_parse_weights(db)
@@ -12,19 +12,74 @@ Options:
     --yes        Skip confirmation prompt and proceed with deletion
 """
 import sys
-import re
 import argparse
 sys.path.insert(0, '.')
 
 from database import SessionLocal
-from models import Product, Price, ScraperFlag, Brand
-from sqlalchemy import and_
+from models import (
+    Product, Price, Review, Watchlist, PriceAlert, Promotion, ScraperFlag, Brand
+)
+from sqlalchemy import delete, func, select, update
 
+# IDs per DELETE ... WHERE id IN (...), kept under driver parameter limits
+DELETE_BATCH_SIZE = 1000
 
-def is_seed_data(product: Product) -> bool:
-    """Determine if a product is from seed data (manually created)."""
-    # Seed data uses predictable IDs like "prod-001", "prod-002"
-    return product.id.startswith('prod-') and re.match(r'prod-\d{3}', product.id)
+
+# Seed data uses predictable IDs like "prod-001", "prod-002"
+SEED_ID_PATTERN = r'^prod-\d{3}'
+
+
+def batches(ids: list):
+    """Yield `ids` in slices of DELETE_BATCH_SIZE."""
+    for start in range(0, len(ids), DELETE_BATCH_SIZE):
+        yield ids[start:start + DELETE_BATCH_SIZE]
+
+
+# Columns referencing products whose rows are deleted with the product. Bulk
+# DELETEs bypass the ORM cascades, so these are removed explicitly; review
+# deletes still keep users.review_count right through the reviews triggers.
+PRODUCT_DEPENDENTS = (
+    Price.product_id,
+    Review.product_id,
+    Watchlist.product_id,
+    PriceAlert.product_id,
+    Promotion.product_id,
+    ScraperFlag.matched_product_id,
+)
+
+
+def delete_products(db, ids) -> int:
+    """
+    Bulk-delete the given products in batches of IDs, each batch after the
+    rows that reference it.
+
+    Each batch is committed on its own, together with its dependent rows, so
+    a purge that fails part-way leaves no dangling references behind. The
+    session is discarded after the purge, so it is not synchronized.
+    Returns the number of products deleted.
+    """
+    deleted = 0
+    for batch in batches(ids):
+        for column in PRODUCT_DEPENDENTS:
+            db.execute(
+                delete(column.class_)
+                .where(column.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+        # Detach any surviving variants from parents being deleted
+        db.execute(
+            update(Product)
+            .where(Product.master_product_id.in_(batch))
+            .values(master_product_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        deleted += db.execute(
+            delete(Product)
+            .where(Product.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+    return deleted
 
 
 def purge_scraped_data(dry_run: bool = False, skip_confirmation: bool = False):
@@ -43,64 +98,63 @@ def purge_scraped_data(dry_run: bool = False, skip_confirmation: bool = False):
         print("=" * 70)
         print()
 
-        # Identify scraped products
-        all_products = db.query(Product).all()
-        scraped_parents = []
-        scraped_variants = []
-        seed_parents = []
-        seed_variants = []
-
-        for product in all_products:
-            if is_seed_data(product):
-                if product.is_master:
-                    seed_parents.append(product)
-                else:
-                    seed_variants.append(product)
-            else:
-                if product.is_master:
-                    scraped_parents.append(product)
-                else:
-                    scraped_variants.append(product)
+        # Classify products in SQL: seed data is only counted, and only the
+        # columns needed of scraped products are loaded
+        is_seed = Product.id.regexp_match(SEED_ID_PATTERN)
+        seed_counts = dict(
+            db.query(Product.is_master, func.count(Product.id))
+            .filter(is_seed)
+            .group_by(Product.is_master)
+        )
+        # Stream scraped IDs, keeping only the ID strings
+        scraped_parent_ids = []
+        scraped_variant_ids = []
+        for product_id, is_master in (
+            db.query(Product.id, Product.is_master)
+            .filter(~is_seed)
+            .execution_options(stream_results=True)
+            .yield_per(2000)
+        ):
+            (scraped_parent_ids if is_master else scraped_variant_ids).append(product_id)
 
         # Count associated data
-        scraped_variant_ids = [v.id for v in scraped_variants]
-        scraped_parent_ids = [p.id for p in scraped_parents]
-        all_scraped_ids = scraped_variant_ids + scraped_parent_ids
-
-        if scraped_variant_ids:
-            scraped_prices = db.query(Price).filter(
-                Price.product_id.in_(scraped_variant_ids)
-            ).all()
-        else:
-            scraped_prices = []
-
-        all_flags = db.query(ScraperFlag).all()
+        # Prices on scraped products, parents and variants alike, are matched
+        # by subquery, so no product IDs are sent to count or delete them
+        on_scraped_product = Price.product_id.in_(select(Product.id).where(~is_seed))
+        price_count = db.scalar(
+            select(func.count()).select_from(Price).where(on_scraped_product)
+        )
+        flag_count = db.scalar(select(func.count()).select_from(ScraperFlag))
 
         print("Analysis:")
         print("-" * 70)
         print(f"Seed Data (WILL BE PRESERVED):")
-        print(f"  - Parent products: {len(seed_parents)}")
-        print(f"  - Variant products: {len(seed_variants)}")
+        print(f"  - Parent products: {seed_counts.get(True, 0)}")
+        print(f"  - Variant products: {seed_counts.get(False, 0)}")
         print()
         print(f"Scraped Data (WILL BE DELETED):")
-        print(f"  - Parent products: {len(scraped_parents)}")
-        print(f"  - Variant products: {len(scraped_variants)}")
-        print(f"  - Prices on scraped variants: {len(scraped_prices)}")
-        print(f"  - ScraperFlags: {len(all_flags)}")
+        print(f"  - Parent products: {len(scraped_parent_ids)}")
+        print(f"  - Variant products: {len(scraped_variant_ids)}")
+        print(f"  - Prices on scraped products: {price_count}")
+        print(f"  - ScraperFlags: {flag_count}")
         print()
 
-        if len(scraped_parents) == 0 and len(scraped_variants) == 0:
+        if len(scraped_parent_ids) == 0 and len(scraped_variant_ids) == 0:
             print("✓ No scraped data found. Nothing to delete.")
             print()
             return
 
         # Show examples
-        if scraped_parents:
+        if scraped_parent_ids:
             print("Examples of scraped parent products to be deleted:")
-            for product in scraped_parents[:5]:
-                print(f"  - {product.id}: '{product.name}'")
-            if len(scraped_parents) > 5:
-                print(f"  ... and {len(scraped_parents) - 5} more")
+            examples = (
+                db.query(Product.id, Product.name)
+                .filter(Product.id.in_(scraped_parent_ids[:5]))
+            )
+            for product_id, name in examples:
+                print(f"  - {product_id}: '{name}'")
+            if len(scraped_parent_ids) > 5:
+                print(f"  ... and {len(scraped_parent_ids) - 5} more")
             print()
 
         # Confirmation
@@ -118,10 +172,10 @@ def purge_scraped_data(dry_run: bool = False, skip_confirmation: bool = False):
             print("=" * 70)
             print()
             print("The following would be deleted:")
-            print(f"  - {len(scraped_parents)} scraped parent products")
-            print(f"  - {len(scraped_variants)} scraped variant products")
-            print(f"  - {len(scraped_prices)} prices")
-            print(f"  - {len(all_flags)} scraper flags")
+            print(f"  - {len(scraped_parent_ids)} scraped parent products")
+            print(f"  - {len(scraped_variant_ids)} scraped variant products")
+            print(f"  - {price_count} prices")
+            print(f"  - {flag_count} scraper flags")
             print()
             print("Run without --dry-run to actually delete this data.")
             return
@@ -134,36 +188,36 @@ def purge_scraped_data(dry_run: bool = False, skip_confirmation: bool = False):
         print()
 
         # Delete prices first (foreign key constraint)
-        if scraped_prices:
-            print(f"Deleting {len(scraped_prices)} prices...")
-            for price in scraped_prices:
-                db.delete(price)
-            db.commit()
-            print(f"  ✓ Deleted {len(scraped_prices)} prices")
+        if price_count:
+            print(f"Deleting {price_count} prices...")
+            deleted = db.execute(
+                delete(Price)
+                .where(on_scraped_product)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            print(f"  ✓ Deleted {deleted} prices")
 
         # Delete scraper flags
-        if all_flags:
-            print(f"Deleting {len(all_flags)} scraper flags...")
-            for flag in all_flags:
-                db.delete(flag)
-            db.commit()
-            print(f"  ✓ Deleted {len(all_flags)} scraper flags")
+        if flag_count:
+            print(f"Deleting {flag_count} scraper flags...")
+            deleted = db.execute(
+                delete(ScraperFlag).execution_options(synchronize_session=False)
+            ).rowcount
+            print(f"  ✓ Deleted {deleted} scraper flags")
+
+        db.commit()
 
         # Delete variant products
-        if scraped_variants:
-            print(f"Deleting {len(scraped_variants)} scraped variant products...")
-            for variant in scraped_variants:
-                db.delete(variant)
-            db.commit()
-            print(f"  ✓ Deleted {len(scraped_variants)} variant products")
+        if scraped_variant_ids:
+            print(f"Deleting {len(scraped_variant_ids)} scraped variant products...")
+            deleted = delete_products(db, scraped_variant_ids)
+            print(f"  ✓ Deleted {deleted} variant products")
 
         # Delete parent products
-        if scraped_parents:
-            print(f"Deleting {len(scraped_parents)} scraped parent products...")
-            for parent in scraped_parents:
-                db.delete(parent)
-            db.commit()
-            print(f"  ✓ Deleted {len(scraped_parents)} parent products")
+        if scraped_parent_ids:
+            print(f"Deleting {len(scraped_parent_ids)} scraped parent products...")
+            deleted = delete_products(db, scraped_parent_ids)
+            print(f"  ✓ Deleted {deleted} parent products")
 
         print()
         print("=" * 70)
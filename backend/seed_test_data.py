@@ -308,10 +308,9 @@ def seed_data():
                 id="review-001",
                 user_id="user-001",
                 product_id="prod-001",
-                rating=5,
                 effects_rating=5,
                 taste_rating=4,
-                value_rating=4,
+                value_rating=5,
                 comment="Great strain for relaxation! Smooth smoke.",
                 upvotes=12
             ),
@@ -319,7 +318,6 @@ def seed_data():
                 id="review-002",
                 user_id="user-002",
                 product_id="prod-001",
-                rating=4,
                 effects_rating=4,
                 taste_rating=5,
                 value_rating=3,
@@ -330,7 +328,6 @@ def seed_data():
                 id="review-003",
                 user_id="user-001",
                 product_id="prod-002",
-                rating=5,
                 effects_rating=5,
                 taste_rating=4,
                 value_rating=5,
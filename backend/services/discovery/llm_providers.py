@@ -113,8 +113,9 @@ Please return your analysis as a JSON object with this exact structure:
 Return ONLY the JSON object, no additional text.
 """
 
-        # Generate analysis
-        response = model.generate_content([
+        # Generate analysis; the async call keeps the event loop free while
+        # the model works instead of blocking it for the whole request
+        response = await model.generate_content_async([
             {
                 "mime_type": "image/png",
                 "data": base64.b64encode(image_data).decode()
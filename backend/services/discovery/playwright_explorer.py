@@ -6,13 +6,16 @@ screenshots/HTML for LLM analysis.
 """
 
 from playwright.async_api import async_playwright, Page
+from dataclasses import asdict
 from typing import Optional
 from pathlib import Path
 from datetime import datetime
+import hashlib
 import re
 import json
+import shelve
 
-from services.discovery.models import DiscoveryResult
+from services.discovery.models import DiscoveryResult, LLMAnalysisResult
 from services.discovery.llm_providers import LLMProvider
 
 
@@ -34,8 +37,15 @@ class PlaywrightDiscoveryExplorer:
         explorer.save_discovery(result, "discovery_output")
     """
 
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, cache_path: Optional[str] = None):
+        """
+        Args:
+            headless: Run the browser without a window
+            cache_path: Shelve file for caching LLM analyses keyed by the hash
+                of screenshot, HTML, provider and prompt; None disables caching
+        """
         self.headless = headless
+        self.cache_path = cache_path
 
     async def discover(
         self,
@@ -60,6 +70,8 @@ class PlaywrightDiscoveryExplorer:
         Returns:
             DiscoveryResult with field maps and analysis
         """
+        # The browser is only needed to capture the page; it is closed before
+        # the (slow) LLM analysis rather than held open for it
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=self.headless)
             page = await browser.new_page()
@@ -100,32 +112,65 @@ class PlaywrightDiscoveryExplorer:
                 Path(html_path).write_text(html_content, encoding='utf-8')
                 print(f"[INFO] Saved HTML: {html_path}")
 
-                # Analyze with LLM
-                print(f"[INFO] Analyzing with {llm_provider.__class__.__name__}")
-                llm_result = await llm_provider.analyze_screenshot(
-                    screenshot_path=screenshot_path,
-                    html_content=html_content,
-                    prompt=self._get_analysis_prompt()
-                )
-
-                # Create discovery result
-                return DiscoveryResult(
-                    url=url,
-                    dispensary_name=name,
-                    timestamp=datetime.utcnow(),
-                    screenshot_path=screenshot_path,
-                    html_path=html_path,
-                    field_map=llm_result.field_map,
-                    css_selectors=llm_result.css_selectors,
-                    extraction_patterns=llm_result.extraction_patterns,
-                    edge_cases=llm_result.edge_cases,
-                    llm_provider=llm_provider.__class__.__name__,
-                    analysis_cost=llm_provider.get_cost_estimate()
-                )
-
             finally:
                 await browser.close()
 
+        # Analyze with LLM
+        print(f"[INFO] Analyzing with {llm_provider.__class__.__name__}")
+        llm_result = await self._analyze(
+            llm_provider, screenshot_path, html_content, self._get_analysis_prompt()
+        )
+
+        # Create discovery result
+        return DiscoveryResult(
+            url=url,
+            dispensary_name=name,
+            timestamp=datetime.utcnow(),
+            screenshot_path=screenshot_path,
+            html_path=html_path,
+            field_map=llm_result.field_map,
+            css_selectors=llm_result.css_selectors,
+            extraction_patterns=llm_result.extraction_patterns,
+            edge_cases=llm_result.edge_cases,
+            llm_provider=llm_provider.__class__.__name__,
+            analysis_cost=llm_provider.get_cost_estimate()
+        )
+
+    async def _analyze(
+        self,
+        llm_provider: LLMProvider,
+        screenshot_path: str,
+        html_content: str,
+        prompt: str
+    ) -> LLMAnalysisResult:
+        """Run the LLM analysis, reusing a cached result for identical input."""
+        if not self.cache_path:
+            return await llm_provider.analyze_screenshot(
+                screenshot_path=screenshot_path,
+                html_content=html_content,
+                prompt=prompt
+            )
+
+        digest = hashlib.blake2b(Path(screenshot_path).read_bytes())
+        for part in (html_content, llm_provider.__class__.__name__, prompt):
+            digest.update(b"\0" + part.encode("utf-8"))
+        key = digest.hexdigest()
+
+        Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+        with shelve.open(self.cache_path) as cache:
+            if key in cache:
+                print("[INFO] Using cached LLM analysis")
+                return LLMAnalysisResult(**cache[key])
+
+        llm_result = await llm_provider.analyze_screenshot(
+            screenshot_path=screenshot_path,
+            html_content=html_content,
+            prompt=prompt
+        )
+        with shelve.open(self.cache_path) as cache:
+            cache[key] = asdict(llm_result)
+        return llm_result
+
     async def _dismiss_age_gate(self, page: Page, selector: str):
         """Dismiss age gate using CSS selector."""
         try:
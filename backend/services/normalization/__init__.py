@@ -1,10 +1,11 @@
 """Normalization services package"""
-from .matcher import ProductMatcher
+from .matcher import MatchFeatures, ProductMatcher
 from .scorer import ConfidenceScorer
 from .flag_processor import ScraperFlagProcessor
 from .weight_parser import parse_weight, extract_weight_from_name
 
 __all__ = [
+    "MatchFeatures",
     "ProductMatcher",
     "ConfidenceScorer",
     "ScraperFlagProcessor",
@@ -7,13 +7,21 @@ Confidence thresholds:
 - <65%: Create new product entry (data quality checked separately)
 """
 from rapidfuzz import fuzz
-from typing import Tuple, Optional, List
+from typing import NamedTuple, Tuple, Optional, List
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
 
+class MatchFeatures(NamedTuple):
+    """A product's matching inputs, normalized once by ProductMatcher.preprocess"""
+    name: str           # Original name, for logging
+    sorted_name: str    # Normalized name with tokens sorted (token_sort_ratio form)
+    sorted_brand: str   # Normalized brand with tokens sorted
+    thc: Optional[float]
+
+
 class ProductMatcher:
     """Matches scraped products to existing master products using fuzzy matching"""
 
@@ -54,27 +62,53 @@ class ProductMatcher:
             - confidence_score: 0.0 to 1.0
             - match_type: "auto_merge" | "review_flag" | "new_product"
         """
-        # Normalize names for comparison
-        normalized_scraped_name = cls.normalize_product_name(scraped_name)
-        normalized_master_name = cls.normalize_product_name(master_name)
-        normalized_scraped_brand = cls.normalize_brand_name(scraped_brand)
-        normalized_master_brand = cls.normalize_brand_name(master_brand)
+        return cls.score_prepared(
+            cls.preprocess(scraped_name, scraped_brand, scraped_thc),
+            cls.preprocess(master_name, master_brand, master_thc)
+        )
+
+    @classmethod
+    def preprocess(
+        cls,
+        name: str,
+        brand: str = "",
+        thc: Optional[float] = None
+    ) -> MatchFeatures:
+        """
+        Normalize and token-sort a product's name and brand for scoring.
 
+        Compute this once per product when scoring it against many others,
+        then compare with score_prepared.
+        """
+        return MatchFeatures(
+            name=name,
+            sorted_name=" ".join(sorted(cls.normalize_product_name(name).split())),
+            sorted_brand=" ".join(sorted(cls.normalize_brand_name(brand).split())),
+            thc=thc
+        )
+
+    @classmethod
+    def score_prepared(
+        cls,
+        scraped: MatchFeatures,
+        master: MatchFeatures
+    ) -> Tuple[float, str]:
+        """
+        score_match for products already run through preprocess.
+
+        Returns:
+            Tuple of (confidence_score, match_type), as score_match
+        """
         # Name similarity (75% weight)
-        # Use token_sort_ratio for word order independence
-        name_similarity = fuzz.token_sort_ratio(
-            normalized_scraped_name,
-            normalized_master_name
-        ) / 100.0
+        # Token-sorted ratio for word order independence; equivalent to
+        # token_sort_ratio on the normalized names
+        name_similarity = fuzz.ratio(scraped.sorted_name, master.sorted_name) / 100.0
 
         # Brand similarity (25% weight)
-        brand_similarity = fuzz.token_sort_ratio(
-            normalized_scraped_brand,
-            normalized_master_brand
-        ) / 100.0
+        brand_similarity = fuzz.ratio(scraped.sorted_brand, master.sorted_brand) / 100.0
 
         # THC similarity (0% weight — disabled)
-        thc_similarity = cls._calculate_thc_similarity(scraped_thc, master_thc)
+        thc_similarity = cls._calculate_thc_similarity(scraped.thc, master.thc)
 
         # Calculate weighted confidence score
         confidence = (
@@ -93,12 +127,38 @@ class ProductMatcher:
 
         logger.debug(
             f"Match score: {confidence:.3f} ({match_type}) - "
-            f"'{scraped_name}' vs '{master_name}' "
+            f"'{scraped.name}' vs '{master.name}' "
             f"[name={name_similarity:.2f}, brand={brand_similarity:.2f}]"
         )
 
         return confidence, match_type
 
+    @classmethod
+    def could_reach(
+        cls,
+        scraped: MatchFeatures,
+        master: MatchFeatures,
+        threshold: float
+    ) -> bool:
+        """
+        Cheap check whether score_prepared could reach `threshold`.
+
+        Name similarity is bounded by name lengths alone: the ratio is at most
+        2 * shorter / (sum of lengths). THC is assumed to match, so a False
+        answer is exact and the pair can be skipped without scoring.
+        """
+        total = len(scraped.sorted_name) + len(master.sorted_name)
+        if not total:
+            return True
+        name_bound = 2 * min(len(scraped.sorted_name), len(master.sorted_name)) / total
+        brand_similarity = fuzz.ratio(scraped.sorted_brand, master.sorted_brand) / 100.0
+        best = (
+            name_bound * cls.NAME_WEIGHT +
+            brand_similarity * cls.BRAND_WEIGHT +
+            cls.THC_WEIGHT
+        )
+        return best >= threshold
+
     @classmethod
     def find_best_match(
         cls,
@@ -143,14 +203,16 @@ class ProductMatcher:
         best_score = 0.0
         best_type = "new_product"
 
+        # The scraped product is normalized once, not once per candidate
+        scraped = cls.preprocess(scraped_name, scraped_brand, scraped_thc)
         for candidate in search_pool:
-            score, match_type = cls.score_match(
-                scraped_name,
-                candidate.get("name", ""),
-                scraped_brand,
-                candidate.get("brand", ""),
-                scraped_thc,
-                candidate.get("thc_percentage")
+            score, match_type = cls.score_prepared(
+                scraped,
+                cls.preprocess(
+                    candidate.get("name", ""),
+                    candidate.get("brand", ""),
+                    candidate.get("thc_percentage")
+                )
             )
 
             if score > best_score and score >= min_threshold:
@@ -188,7 +188,11 @@ class ConfidenceScorer:
             # Only create an audit flag for TRUE cross-dispensary merges.
             # If the matched product already has a price at this dispensary,
             # this is a routine price refresh — no admin review needed.
-            existing_price_at_dispensary = (
+            # The runner's candidates already know which dispensaries price
+            # each master (including prices it hasn't inserted yet), so only
+            # fall back to the database when the set doesn't say so.
+            best_match_disp_ids = best_match.setdefault("dispensary_ids", set())
+            existing_price_at_dispensary = dispensary_id in best_match_disp_ids or (
                 db.query(Price)
                 .join(Product, Price.product_id == Product.id)
                 .filter(
@@ -197,6 +201,9 @@ class ConfidenceScorer:
                 )
                 .first()
             )
+            # This variant gets a price here, so later products in the run
+            # see the master as already priced at this dispensary
+            best_match_disp_ids.add(dispensary_id)
             if not existing_price_at_dispensary:
                 audit_flag = ScraperFlag(
                     original_name=name_for_matching,
@@ -0,0 +1,86 @@
+"""
+In-process TTL cache for hot, read-mostly API responses.
+
+Entries expire after a fixed TTL and the least recently used entry is evicted
+once the cache is full. Each entry can carry a tag (e.g. a product id) so a
+write can drop every cached response derived from that row. Concurrent misses
+for the same key are collapsed into a single computation (single-flight).
+
+The cache lives in one process: with several workers each keeps its own copy,
+and the TTL bounds how stale a worker that didn't see the write can be.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _tag, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, tag: Any = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, tag, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], tuple[Any, Any]]) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        ``compute`` returns ``(value, tag)``; the tag is often only known once
+        the value has been loaded. Only one caller computes a given key at a
+        time; the others wait and then read the freshly cached value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                value = self.get(key)
+                if value is None:
+                    # If compute raises, nothing is stored
+                    value, tag = compute()
+                    self.set(key, value, tag=tag)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+        return value
+
+    def invalidate_tag(self, tag: Any) -> None:
+        """Drop every entry stored with ``tag``"""
+        with self._lock:
+            stale = [key for key, (_, entry_tag, _) in self._entries.items() if entry_tag == tag]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
@@ -14,15 +14,23 @@ Usage:
     results = await runner.run_all()
 """
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+import asyncio
 import logging
 
+import aiohttp
+from sqlalchemy import case, or_, select
 from sqlalchemy.orm import Session
 
-from models import Product, Price, Dispensary, ScraperRun
+from config import settings
+from database import dialect_insert
+from models import Brand, Product, Price, Dispensary, ScraperRun
 from services.normalization.scorer import ConfidenceScorer
 from services.scrapers.registry import ScraperRegistry
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,16 +42,26 @@ class ScraperRunner:
     any registered scraper by its ID.
     """
 
-    def __init__(self, db: Session, triggered_by: str = "manual"):
+    def __init__(
+        self,
+        db: Session,
+        triggered_by: str = "manual",
+        http_session: Optional[aiohttp.ClientSession] = None,
+        browser: Optional["Browser"] = None
+    ):
         """
         Initialize the scraper runner.
 
         Args:
             db: SQLAlchemy database session
             triggered_by: Who triggered the run ("scheduler", "manual", or admin user id)
+            http_session: Shared HTTP session to hand to scrapers (optional)
+            browser: Shared Playwright browser to hand to scrapers (optional)
         """
         self.db = db
         self.triggered_by = triggered_by
+        self.http_session = http_session
+        self.browser = browser
 
     async def run_by_id(self, scraper_id: str) -> Dict[str, Any]:
         """
@@ -101,6 +119,8 @@ class ScraperRunner:
             logger.info(f"Scraper module: {config.scraper_class.__module__}")
             logger.info(f"Scraper name: {config.scraper_class.__name__}")
             scraper = config.scraper_class(dispensary_id=scraper_id)
+            scraper.http_session = self.http_session
+            scraper.browser = self.browser
             logger.info(f"Scraper instantiated successfully: {scraper}")
             logger.info(f"Calling scrape_products()...")
             products = await scraper.scrape_products()
@@ -146,46 +166,58 @@ class ScraperRunner:
                     else:
                         raise
 
-            # 3. Pre-load master product candidates for fuzzy matching
+            # 3. Pre-load master product candidates for fuzzy matching.
+            # Rows are streamed as plain columns with the brand joined in,
+            # rather than loading every master as an ORM object and then
+            # lazy-loading its brand one master at a time.
             from collections import defaultdict
             from sqlalchemy.orm import aliased as _aliased
 
-            master_products = (
-                self.db.query(Product)
-                .filter(Product.is_master.is_(True))
-                .all()
-            )
+            master_ids = select(Product.id).where(Product.is_master.is_(True))
 
             # Build a map of master_product_id → set of dispensary_ids it already has prices at.
             # Used by ConfidenceScorer to restrict near-miss flags to cross-dispensary pairs only.
-            master_ids = [m.id for m in master_products]
             _VariantAlias = _aliased(Product)
-            _disp_rows = (
-                self.db.query(_VariantAlias.master_product_id, Price.dispensary_id)
+            _disp_rows = self.db.execute(
+                select(_VariantAlias.master_product_id, Price.dispensary_id)
                 .join(Price, Price.product_id == _VariantAlias.id)
-                .filter(
+                .where(
                     _VariantAlias.master_product_id.in_(master_ids),
                     _VariantAlias.is_master.is_(False),
                 )
                 .distinct()
-                .all()
-            )
+            ).yield_per(1000)
             _product_disp_ids: dict = defaultdict(set)
             for _pid, _did in _disp_rows:
                 _product_disp_ids[_pid].add(_did)
 
+            master_rows = self.db.execute(
+                select(
+                    Product.id,
+                    Product.name,
+                    Brand.name,
+                    Product.product_type,
+                    Product.thc_percentage,
+                )
+                .outerjoin(Brand, Brand.id == Product.brand_id)
+                .where(Product.is_master.is_(True))
+            ).yield_per(1000)
             candidates = [
                 {
-                    "id": m.id,
-                    "name": m.name,
-                    "brand": m.brand.name if m.brand else "",
-                    "product_type": m.product_type,
-                    "thc_percentage": m.thc_percentage,
-                    "dispensary_ids": _product_disp_ids.get(m.id, set()),
+                    "id": m_id,
+                    "name": m_name,
+                    "brand": m_brand or "",
+                    "product_type": m_type,
+                    "thc_percentage": m_thc,
+                    "dispensary_ids": _product_disp_ids.get(m_id, set()),
                 }
-                for m in master_products
+                for m_id, m_name, m_brand, m_type, m_thc in master_rows
             ]
 
+            # Scraped prices, keyed by product, are upserted in one batch
+            # after the loop instead of being looked up one by one
+            staged_prices: Dict[str, Dict[str, Any]] = {}
+
             # 4. Process each product through ConfidenceScorer
             processed_count = 0
             flags_created = 0
@@ -206,18 +238,15 @@ class ScraperRunner:
                         flags_created += 1
 
                     if product_id:
-                        product = self.db.query(Product).filter(
-                            Product.id == product_id
-                        ).first()
-                        if product:
-                            self._update_price(
-                                product,
-                                dispensary,
-                                scraped.price,
-                                scraped.in_stock,
-                                scraped.url
-                            )
-                            processed_count += 1
+                        self._stage_price(
+                            product_id,
+                            dispensary.id,
+                            scraped.price,
+                            scraped.in_stock,
+                            scraped.url,
+                            staged_prices
+                        )
+                        processed_count += 1
 
                     savepoint.commit()  # Commit this product's changes
 
@@ -230,7 +259,11 @@ class ScraperRunner:
                     savepoint.rollback()
                     continue
 
-            # 5. Complete run log and commit all changes
+            # 5. Insert new prices and update changed ones in one upsert
+            if staged_prices:
+                self._upsert_prices(list(staged_prices.values()))
+
+            # 6. Complete run log and commit all changes
             run_log.complete(
                 status="success",
                 products_found=len(products),
@@ -274,24 +307,53 @@ class ScraperRunner:
 
     async def run_all(self) -> Dict[str, Any]:
         """
-        Run all enabled scrapers and save results to database.
+        Run all enabled scrapers concurrently and save results to database.
 
         Returns:
             Dict mapping scraper IDs to their results
         """
-        results = {}
+        return await self.run_many([config.id for config in ScraperRegistry.get_enabled()])
 
-        for config in ScraperRegistry.get_enabled():
-            try:
-                result = await self.run_by_id(config.id)
-                results[config.id] = result
-            except Exception as e:
-                logger.error(f"Failed to run {config.name}: {e}")
-                results[config.id] = {
+    async def run_many(self, scraper_ids: List[str]) -> Dict[str, Any]:
+        """
+        Run the given scrapers concurrently and save results to database.
+
+        Scrapers spend most of their time waiting on remote sites, so they
+        are fanned out with at most settings.max_concurrent_scrapers in
+        flight. The runs share this runner's session safely: run_by_id only
+        yields to the event loop while scraping, and its database work
+        between those points runs to a commit without interleaving.
+
+        Args:
+            scraper_ids: IDs of the scrapers to run
+
+        Returns:
+            Dict mapping scraper IDs to their results
+        """
+        semaphore = asyncio.Semaphore(settings.max_concurrent_scrapers)
+
+        async def _run_one(scraper_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_by_id(scraper_id)
+
+        outcomes = await asyncio.gather(
+            *(_run_one(scraper_id) for scraper_id in scraper_ids),
+            return_exceptions=True
+        )
+
+        # A failing scraper is reported in its own entry without
+        # cancelling the others
+        results = {}
+        for scraper_id, outcome in zip(scraper_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to run {scraper_id}: {outcome}")
+                results[scraper_id] = {
                     "status": "error",
-                    "error": str(e),
-                    "scraper_id": config.id
+                    "error": str(outcome),
+                    "scraper_id": scraper_id
                 }
+            else:
+                results[scraper_id] = outcome
 
         return results
 
@@ -329,56 +391,78 @@ class ScraperRunner:
 
         return dispensary
 
-    def _update_price(
+    def _stage_price(
         self,
-        product: Product,
-        dispensary: Dispensary,
+        product_id: str,
+        dispensary_id: str,
         amount: float,
         in_stock: bool,
-        product_url: Optional[str] = None
+        product_url: Optional[str],
+        staged_prices: Dict[str, Dict[str, Any]]
     ) -> None:
         """
-        Update or create price record for a product at a dispensary.
+        Stage a product's price at a dispensary for the end-of-run upsert.
+
+        Keyed by product, so a product scraped twice keeps its last price.
 
         Args:
-            product: Product database record
-            dispensary: Dispensary database record
+            product_id: Product database ID
+            dispensary_id: Dispensary database ID
             amount: Price amount
             in_stock: Whether the product is in stock
             product_url: Direct link to product page at dispensary
+            staged_prices: Price rows to upsert, by product ID
         """
-        # First check in session (for newly added but uncommitted prices)
-        for obj in self.db.new:
-            if isinstance(obj, Price):
-                if obj.product_id == product.id and obj.dispensary_id == dispensary.id:
-                    # Price already added to session, update it
-                    if obj.amount != amount or obj.in_stock != in_stock or obj.product_url != product_url:
-                        obj.amount = amount
-                        obj.in_stock = in_stock
-                        obj.product_url = product_url
-                        obj.last_updated = datetime.utcnow()
-                    return
-
-        # Check in database
-        price = self.db.query(Price).filter(
-            Price.product_id == product.id,
-            Price.dispensary_id == dispensary.id
-        ).first()
+        staged_prices[product_id] = {
+            "product_id": product_id,
+            "dispensary_id": dispensary_id,
+            "amount": amount,
+            "in_stock": in_stock,
+            "product_url": product_url
+        }
+
+    def _upsert_prices(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert or update prices on (product_id, dispensary_id) in one statement.
+
+        Mirrors Price.update_price for rows that already exist: a changed
+        amount records the previous price and the percentage change. Rows
+        whose amount, stock and URL are unchanged are left untouched, so
+        their last_updated keeps pointing at the last real change.
 
-        if price:
-            # Update existing price if changed
-            if price.amount != amount or price.in_stock != in_stock or price.product_url != product_url:
-                price.update_price(amount)
-                price.in_stock = in_stock
-                price.product_url = product_url
-                price.last_updated = datetime.utcnow()
-        else:
-            # Create new price record
-            new_price = Price(
-                product_id=product.id,
-                dispensary_id=dispensary.id,
-                amount=amount,
-                in_stock=in_stock,
-                product_url=product_url
+        Args:
+            rows: Price column values, at most one per product
+        """
+        stmt = dialect_insert(self.db, Price)
+        new = stmt.excluded
+        now = datetime.utcnow()
+        amount_changed = Price.amount != new.amount
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Price.product_id, Price.dispensary_id],
+            set_={
+                # Every right-hand side sees the row as it was before the update
+                "previous_price": case(
+                    (amount_changed, Price.amount), else_=Price.previous_price
+                ),
+                "price_change_percentage": case(
+                    (amount_changed & (Price.amount != 0),
+                     (new.amount - Price.amount) / Price.amount * 100),
+                    (amount_changed, 0),
+                    else_=Price.price_change_percentage
+                ),
+                "price_change_date": case(
+                    (amount_changed, now), else_=Price.price_change_date
+                ),
+                "amount": new.amount,
+                "in_stock": new.in_stock,
+                "product_url": new.product_url,
+                "last_updated": now,
+            },
+            where=or_(
+                amount_changed,
+                Price.in_stock.is_distinct_from(new.in_stock),
+                Price.product_url.is_distinct_from(new.product_url),
             )
-            self.db.add(new_price)
+        )
+        self.db.execute(stmt, rows)
@@ -4,13 +4,21 @@ Subprocess wrapper for running scrapers in isolated processes.
 This module provides a way to run Playwright-based scrapers in separate subprocesses
 to avoid event loop conflicts with FastAPI/uvicorn. Each scraper runs with its own
 asyncio.run() context, which works perfectly with Playwright.
+
+By default every run spawns a fresh process. With SCRAPER_PERSISTENT_WORKER
+enabled, runs are sent to one long-lived worker process instead, so the
+interpreter start-up and scraper imports are paid once rather than per run.
 """
 import sys
+import json
 import asyncio
+import itertools
 import logging
 import subprocess
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from config import settings
 
@@ -28,6 +36,138 @@ def _get_semaphore() -> asyncio.Semaphore:
     return _scraper_semaphore
 
 
+# Extra time the worker gets to report its own timeout before it is
+# presumed wedged and killed
+WORKER_GRACE_SECONDS = 30
+
+
+def _scraper_command(*args: str) -> list:
+    """Command line for run_scraper_subprocess.py with the running interpreter"""
+    backend_dir = Path(__file__).parent.parent
+    return [sys.executable, str(backend_dir / "run_scraper_subprocess.py"), *args]
+
+
+class ScraperWorker:
+    """
+    A long-lived ``run_scraper_subprocess.py --worker`` process.
+
+    Jobs are written to the worker's stdin as JSON lines and a reader thread
+    matches the JSON result lines on its stdout back to the waiting callers.
+    Everything is blocking I/O on threads, like subprocess.run, because the
+    server's event loop may not support asyncio subprocesses (Windows).
+
+    If the worker exits, its outstanding jobs fail and the next job starts a
+    new one. A job that outlives its timeout plus WORKER_GRACE_SECONDS means
+    the worker is wedged, so it is killed; other jobs running in it fail too.
+    """
+
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Tuple[subprocess.Popen, Future]] = {}
+        self._job_ids = itertools.count(1)
+
+    def _start(self) -> subprocess.Popen:
+        """Return the running worker, starting one if needed (lock held)"""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                _scraper_command("--worker"),
+                cwd=str(Path(__file__).parent.parent),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+            logger.info(f"Started scraper worker (pid {self._process.pid})")
+            threading.Thread(
+                target=self._read_results, args=(self._process,), daemon=True
+            ).start()
+        return self._process
+
+    def _read_results(self, process: subprocess.Popen) -> None:
+        """Resolve each job as its result line arrives; fail the rest on exit"""
+        for line in process.stdout:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # stray output from a scraper, not a result line
+            if not isinstance(result, dict):
+                continue
+            with self._lock:
+                entry = self._pending.pop(result.get("job"), None)
+            if entry:
+                entry[1].set_result(result)
+
+        returncode = process.wait()
+        logger.warning(f"Scraper worker (pid {process.pid}) exited with code {returncode}")
+        with self._lock:
+            orphaned = [job for job, (owner, _) in self._pending.items() if owner is process]
+            futures = [self._pending.pop(job)[1] for job in orphaned]
+        for future in futures:
+            future.set_exception(RuntimeError(f"Scraper worker exited with code {returncode}"))
+
+    def run(self, scraper_id: str, timeout: int) -> dict:
+        """Run one scraper in the worker and block until its result line arrives"""
+        future: Future = Future()
+        with self._lock:
+            process = self._start()
+            job = next(self._job_ids)
+            self._pending[job] = (process, future)
+            try:
+                process.stdin.write(
+                    json.dumps({"job": job, "scraper_id": scraper_id, "timeout": timeout}) + "\n"
+                )
+                process.stdin.flush()
+            except OSError as e:
+                self._pending.pop(job, None)
+                future.set_exception(RuntimeError(f"Scraper worker unavailable: {e}"))
+
+        try:
+            return future.result(timeout=timeout + WORKER_GRACE_SECONDS)
+        except FutureTimeoutError:
+            logger.error(f"Scraper worker didn't report '{scraper_id}' in time; killing it")
+            process.kill()
+            return {
+                "status": "timeout",
+                "message": f"Scraper timed out after {timeout} seconds"
+            }
+        except RuntimeError as e:
+            return {"status": "error", "message": str(e)}
+
+    def stop(self) -> None:
+        """Close the worker's stdin; it finishes in-flight jobs and exits"""
+        with self._lock:
+            process, self._process = self._process, None
+        if process and process.poll() is None:
+            process.stdin.close()
+
+
+_worker = ScraperWorker()
+
+
+def _run_in_worker(scraper_id: str, timeout: int) -> dict:
+    """run_scraper_subprocess's path when the persistent worker is enabled"""
+    logger.info(f"Sending scraper '{scraper_id}' to worker with {timeout}s timeout")
+    result = _worker.run(scraper_id, timeout)
+
+    if result["status"] == "success":
+        logger.info(f"Scraper '{scraper_id}' completed successfully")
+    else:
+        logger.error(f"Scraper '{scraper_id}' finished with {result['status']}: {result['message']}")
+        _mark_stuck_runs_as_error(scraper_id, result["message"])
+
+    return {
+        "status": result["status"],
+        "scraper_id": scraper_id,
+        "message": result["message"]
+    }
+
+
+def stop_scraper_worker() -> None:
+    """Shut down the persistent scraper worker, if one is running"""
+    _worker.stop()
+
+
 def run_scraper_subprocess(scraper_id: str, timeout: int = 600) -> dict:
     """
     Run a scraper in a separate subprocess with timeout protection.
@@ -43,20 +183,14 @@ def run_scraper_subprocess(scraper_id: str, timeout: int = 600) -> dict:
         subprocess.TimeoutExpired: If scraper exceeds timeout
         subprocess.CalledProcessError: If scraper process fails
     """
-    # Get the path to the Python interpreter in the venv
-    venv_python = Path(sys.executable)
+    if settings.scraper_persistent_worker:
+        return _run_in_worker(scraper_id, timeout)
 
     # Get the backend directory
     backend_dir = Path(__file__).parent.parent
 
     # Build the command to run the scraper script
-    scraper_script = backend_dir / "run_scraper_subprocess.py"
-
-    cmd = [
-        str(venv_python),
-        str(scraper_script),
-        scraper_id
-    ]
+    cmd = _scraper_command(scraper_id)
 
     logger.info(f"Starting scraper '{scraper_id}' in subprocess with {timeout}s timeout")
     logger.debug(f"Command: {' '.join(cmd)}")
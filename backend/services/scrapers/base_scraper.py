@@ -16,12 +16,19 @@ Usage:
     result = await scraper.run()
 """
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Dict, Any
 import logging
 import asyncio
 
+import aiohttp
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +67,72 @@ class ScrapedPromotion:
     recurring_day: Optional[str] = None  # "monday", "friday", etc.
 
 
+# Statuses worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Upper bound on a single backoff sleep, however long Retry-After asks for
+MAX_RETRY_DELAY = 60.0
+
+
+# How long to wait for a browser or context to close before giving up on it
+BROWSER_CLOSE_TIMEOUT = 10.0
+
+
+async def _close_quietly(closeable: Any, what: str) -> None:
+    """Close a Playwright browser or context without letting a hung close block the run"""
+    try:
+        await asyncio.wait_for(closeable.close(), timeout=BROWSER_CLOSE_TIMEOUT)
+    except Exception:
+        logger.warning(f"{what}.close() did not complete cleanly — continuing")
+
+
+@asynccontextmanager
+async def shared_browser(headless: bool = True) -> AsyncIterator[Optional["Browser"]]:
+    """
+    Launch one Chromium for several scrapers in this process to share.
+
+    Assign the yielded browser to each scraper's ``browser`` attribute; each
+    scrape then opens its own context in it instead of launching a browser.
+    Yields None when Playwright isn't installed or the browser can't start,
+    in which case scrapers fall back to launching their own.
+    """
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        yield None
+        return
+
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=headless)
+        except Exception as e:
+            logger.warning(f"Could not launch shared browser: {e}")
+            browser = None
+
+        try:
+            yield browser
+        finally:
+            if browser is not None:
+                await _close_quietly(browser, "browser")
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class BaseScraper(ABC):
     """
     Base class for all dispensary scrapers.
@@ -76,12 +149,115 @@ class BaseScraper(ABC):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self._last_run: Optional[datetime] = None
         self._last_result: Optional[Dict] = None
+        # App-wide HTTP session, injected by callers running inside the API
+        # process so runs reuse keep-alive connections and the DNS cache
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        # Shared Playwright browser, injected by callers running several
+        # scrapers in one process so each scrape opens a context, not a browser
+        self.browser: Optional["Browser"] = None
 
     @property
     def name(self) -> str:
         """Human-readable scraper name"""
         return self.__class__.__name__
 
+    @asynccontextmanager
+    async def http_client(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        HTTP session to use for this scrape.
+
+        Yields the injected app-wide session when there is one; otherwise
+        (standalone and subprocess runs) opens a session for the block.
+        """
+        if self.http_session is not None and not self.http_session.closed:
+            yield self.http_session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
+    @asynccontextmanager
+    async def browser_context(
+        self,
+        headless: bool = True,
+        **context_options: Any
+    ) -> AsyncIterator["BrowserContext"]:
+        """
+        Playwright browser context to use for this scrape.
+
+        Opens a context in the injected shared browser when there is one;
+        otherwise launches a Chromium of its own for the block. Either way
+        the context, with its cookies and storage, belongs to this scrape
+        alone and is closed when the block exits.
+
+        Args:
+            headless: Run a self-launched browser headless (a shared browser
+                was launched by its owner)
+            **context_options: Passed to Browser.new_context (user_agent, viewport, ...)
+        """
+        if self.browser is not None and self.browser.is_connected():
+            context = await self.browser.new_context(**context_options)
+            try:
+                yield context
+            finally:
+                await _close_quietly(context, "context")
+            return
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=headless)
+            try:
+                yield await browser.new_context(**context_options)
+            finally:
+                await _close_quietly(browser, "browser")
+
+    @asynccontextmanager
+    async def request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        max_attempts: int = 4,
+        initial_delay: float = 1.0,
+        **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Issue an HTTP request, backing off on 429 and 5xx responses.
+
+        Waits for the server's Retry-After when it sends one, otherwise
+        doubles the delay each attempt. The last response is yielded
+        whatever its status, so callers keep their own status handling.
+
+        Args:
+            session: Session from http_client()
+            method: HTTP method
+            url: Request URL
+            max_attempts: Total attempts before giving up
+            initial_delay: First backoff delay (seconds)
+            **kwargs: Passed through to session.request()
+        """
+        for attempt in range(max_attempts):
+            response = await session.request(method, url, **kwargs)
+            if response.status not in RETRY_STATUSES or attempt == max_attempts - 1:
+                break
+
+            delay = _retry_after_seconds(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = initial_delay * (2 ** attempt)
+            delay = min(delay, MAX_RETRY_DELAY)
+            response.release()
+
+            self.logger.warning(
+                f"HTTP {response.status} from {url}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            await asyncio.sleep(delay)
+
+        try:
+            yield response
+        finally:
+            response.release()
+
     @abstractmethod
     async def scrape_products(self) -> List[ScrapedProduct]:
         """
@@ -102,6 +278,20 @@ class BaseScraper(ABC):
         """
         pass
 
+    async def iter_products(self) -> AsyncIterator[ScrapedProduct]:
+        """
+        Yield scraped products one at a time.
+
+        The default runs scrape_products() and yields its results. Scrapers
+        that page through a remote catalog can override this to yield each
+        page's products as soon as they are parsed.
+
+        Yields:
+            ScrapedProduct objects representing current inventory
+        """
+        for product in await self.scrape_products():
+            yield product
+
     async def run(self) -> Dict[str, Any]:
         """
         Execute full scrape and return results.
@@ -233,7 +233,7 @@ class BeehiveFarmacyBaseScraper(BaseScraper):
            specific data-testid selectors + price-text heuristics.
         """
         try:
-            from playwright.async_api import async_playwright
+            import playwright.async_api  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Playwright is required: pip install playwright && "
@@ -252,16 +252,14 @@ class BeehiveFarmacyBaseScraper(BaseScraper):
             f"{len(urls_to_scrape)} URL(s) to visit"
         )
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1280, "height": 800},
-            )
+        async with self.browser_context(
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1280, "height": 800},
+        ) as context:
             page = await context.new_page()
             page.set_default_timeout(60_000)
 
@@ -387,8 +385,6 @@ class BeehiveFarmacyBaseScraper(BaseScraper):
                     f"Error loading Dutchie page: {e}", exc_info=True
                 )
                 raise
-            finally:
-                await browser.close()
 
         # -----------------------------------------------------------------------
         # Parse results
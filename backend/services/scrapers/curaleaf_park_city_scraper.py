@@ -471,7 +471,7 @@ class CuraleafParkCityScraper(BaseScraper):
         page count from total/pageSize and fetch each page in sequence.
         """
         try:
-            from playwright.async_api import async_playwright
+            import playwright.async_api  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Playwright is required: pip install playwright && "
@@ -482,16 +482,14 @@ class CuraleafParkCityScraper(BaseScraper):
 
         logger.info("Starting Curaleaf Park City scrape (%s)", _STORE_URL)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1280, "height": 800},
-            )
+        async with self.browser_context(
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1280, "height": 800},
+        ) as context:
             page = await context.new_page()
             page.set_default_timeout(60_000)
 
@@ -521,8 +519,6 @@ class CuraleafParkCityScraper(BaseScraper):
                     "Fatal error scraping Curaleaf Park City: %s", exc, exc_info=True
                 )
                 raise
-            finally:
-                await browser.close()
 
         logger.info(
             "Curaleaf Park City: scraped %d products total", len(all_products)
@@ -4,7 +4,6 @@ Curaleaf Utah Scraper
 Scrapes Curaleaf dispensary locations in Utah using Playwright browser automation.
 Handles age gate verification, infinite scroll, and product extraction.
 """
-import asyncio
 import logging
 from typing import List, TYPE_CHECKING
 
@@ -86,11 +85,9 @@ class CuraleafScraper(PlaywrightScraper):
         all_products = []
         logger.info(f"Scraping Curaleaf {self.location} using Playwright ({self.menu_url})")
 
-        browser = None
         try:
-            async with await self._get_playwright() as p:
-                browser = await p.chromium.launch(headless=self.headless)
-                page = await browser.new_page()
+            async with self.browser_context(headless=self.headless) as context:
+                page = await context.new_page()
                 page.set_default_timeout(60000)  # 60 second timeout for all operations
 
                 # Dismiss age gate first — it now navigates directly to /age-gate and handles the redirect
@@ -169,7 +166,7 @@ class CuraleafScraper(PlaywrightScraper):
                             except Exception:
                                 pass
                             try:
-                                page = await browser.new_page()
+                                page = await context.new_page()
                                 page.set_default_timeout(60000)
                                 await self._dismiss_age_gate(page)
                             except Exception as recovery_err:
@@ -186,21 +183,9 @@ class CuraleafScraper(PlaywrightScraper):
             # Re-raise so the caller sees the error
             raise
 
-        finally:
-            if browser:
-                try:
-                    await asyncio.wait_for(browser.close(), timeout=10.0)
-                except Exception:
-                    logger.warning(f"browser.close() did not complete cleanly for Curaleaf {self.location} — continuing")
-
         logger.info(f"Returning {len(all_products)} products from Curaleaf scraper")
         return all_products
 
-    async def _get_playwright(self):
-        """Get async_playwright context"""
-        from playwright.async_api import async_playwright
-        return async_playwright()
-
     async def _dismiss_age_gate(self, page: "Page"):
         """
         Dismiss Curaleaf's age verification page.
@@ -250,8 +250,8 @@ class DragonFlyWellnessPriceScraper(BaseScraper):
             ),
         }
 
-        async with session.post(
-            _APPSYNC_ENDPOINT, json=payload, headers=headers
+        async with self.request(
+            session, "POST", _APPSYNC_ENDPOINT, json=payload, headers=headers
         ) as resp:
             resp.raise_for_status()
             return await resp.json()
@@ -347,7 +347,7 @@ class DragonFlyWellnessPriceScraper(BaseScraper):
         page = 0
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.http_client() as session:
                 while True:
                     page += 1
                     logger.info(
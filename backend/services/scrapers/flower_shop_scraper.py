@@ -46,8 +46,6 @@ import logging
 import re
 from typing import List, Optional
 
-from playwright.async_api import async_playwright
-
 from .base_scraper import BaseScraper, ScrapedProduct, ScrapedPromotion
 from .registry import register_scraper
 
@@ -136,75 +134,69 @@ class FlowerShopBaseScraper(BaseScraper):
         """
         all_products: List[ScrapedProduct] = []
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
+        async with self.browser_context(
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            )
+        ) as context:
+            page = await context.new_page()
+
+            # Shared dict: current_kind → list of raw product dicts captured
+            captured: dict = {}
+            current_kind: list = [None]  # mutable cell for closure
+
+            async def handle_response(response):
+                if "dmerch.iheartjane.com/v2/multi" not in response.url:
+                    return
+                try:
+                    data = await response.json()
+                    for pl in data.get("placements", []):
+                        # Only capture the per-category table — skip featured/top rows
+                        if (
+                            pl.get("placement") == "menu_inline_table"
+                            and pl.get("products")
+                            and current_kind[0]
+                        ):
+                            kind = current_kind[0]
+                            captured.setdefault(kind, []).extend(pl["products"])
+                except Exception as exc:
+                    logger.debug(
+                        f"[{self.location_name}] Could not parse multi response: {exc}"
                     )
-                )
-                page = await context.new_page()
 
-                # Shared dict: current_kind → list of raw product dicts captured
-                captured: dict = {}
-                current_kind: list = [None]  # mutable cell for closure
+            page.on("response", handle_response)
 
-                async def handle_response(response):
-                    if "dmerch.iheartjane.com/v2/multi" not in response.url:
-                        return
-                    try:
-                        data = await response.json()
-                        for pl in data.get("placements", []):
-                            # Only capture the per-category table — skip featured/top rows
-                            if (
-                                pl.get("placement") == "menu_inline_table"
-                                and pl.get("products")
-                                and current_kind[0]
-                            ):
-                                kind = current_kind[0]
-                                captured.setdefault(kind, []).extend(pl["products"])
-                    except Exception as exc:
-                        logger.debug(
-                            f"[{self.location_name}] Could not parse multi response: {exc}"
-                        )
+            for kind in _KINDS:
+                current_kind[0] = kind
+                url = f"{self.BASE_URL}/{self.location_slug}/menu/{kind}"
+                try:
+                    await page.goto(url, wait_until="domcontentloaded", timeout=25000)
+                except Exception:
+                    pass  # Timeout is fine — we just need the API response
 
-                page.on("response", handle_response)
+                await page.wait_for_timeout(5000)
 
-                for kind in _KINDS:
-                    current_kind[0] = kind
-                    url = f"{self.BASE_URL}/{self.location_slug}/menu/{kind}"
+                kind_raw = captured.get(kind, [])
+                kind_products: List[ScrapedProduct] = []
+                for raw_item in kind_raw:
                     try:
-                        await page.goto(url, wait_until="domcontentloaded", timeout=25000)
-                    except Exception:
-                        pass  # Timeout is fine — we just need the API response
-
-                    await page.wait_for_timeout(5000)
-
-                    kind_raw = captured.get(kind, [])
-                    kind_products: List[ScrapedProduct] = []
-                    for raw_item in kind_raw:
-                        try:
-                            parsed = self._parse_product(raw_item, kind)
-                            kind_products.extend(parsed)
-                        except Exception as exc:
-                            logger.warning(
-                                f"[{self.location_name}] Failed to parse product: {exc}",
-                                exc_info=True,
-                            )
-                            continue
-
-                    all_products.extend(kind_products)
-                    logger.info(
-                        f"[{self.location_name}] {kind}: {len(kind_products)} products"
-                    )
+                        parsed = self._parse_product(raw_item, kind)
+                        kind_products.extend(parsed)
+                    except Exception as exc:
+                        logger.warning(
+                            f"[{self.location_name}] Failed to parse product: {exc}",
+                            exc_info=True,
+                        )
+                        continue
 
-                await page.close()
+                all_products.extend(kind_products)
+                logger.info(
+                    f"[{self.location_name}] {kind}: {len(kind_products)} products"
+                )
 
-            finally:
-                await browser.close()
+            await page.close()
 
         logger.info(
             f"[{self.location_name}] Total scraped: {len(all_products)} products"
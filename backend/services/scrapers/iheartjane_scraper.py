@@ -71,8 +71,10 @@ class IHeartJaneScraper(BaseScraper):
         logger.info(f"Scraping {self.dispensary_name} from {url}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
+            async with self.http_client() as session:
+                async with self.request(
+                    session,
+                    "GET",
                     url,
                     headers=self.HEADERS,
                     timeout=aiohttp.ClientTimeout(total=self.TIMEOUT.total_seconds())
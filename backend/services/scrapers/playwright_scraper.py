@@ -85,14 +85,10 @@ class PlaywrightScraper(BaseScraper):
             f"Scraping {self.dispensary_name} using Playwright ({self.menu_url})"
         )
 
-        browser = None
         try:
-            async with async_playwright() as p:
-                # Launch browser (Chromium recommended for speed)
-                browser = await p.chromium.launch(headless=self.headless)
-
-                # Create a new page/context
-                page = await browser.new_page()
+            # Shared browser if one was injected, else a Chromium of our own
+            async with self.browser_context(headless=self.headless) as context:
+                page = await context.new_page()
 
                 # Set timeout for page operations
                 page.set_default_timeout(30000)  # 30 seconds
@@ -117,10 +113,6 @@ class PlaywrightScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error scraping {self.dispensary_name}: {e}", exc_info=True)
 
-        finally:
-            if browser:
-                await browser.close()
-
         return products
 
     async def _wait_for_products(self, page: "Page"):
@@ -323,11 +315,9 @@ class WholesomeCoScraper(PlaywrightScraper):
         products = []
         logger.info(f"Scraping WholesomeCo using Playwright ({self.menu_url})")
 
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=self.headless)
-                page = await browser.new_page()
+            async with self.browser_context(headless=self.headless) as context:
+                page = await context.new_page()
                 page.set_default_timeout(30000)
 
                 # Navigate to the shop page
@@ -358,10 +348,6 @@ class WholesomeCoScraper(PlaywrightScraper):
             # Re-raise so the caller sees the error
             raise
 
-        finally:
-            if browser:
-                await browser.close()
-
         logger.info(f"Returning {len(products)} products from WholesomeCo scraper")
         return products
 
@@ -35,6 +35,8 @@ logger = logging.getLogger(__name__)
 # Module-level storage (natural singleton)
 _scrapers: Dict[str, "ScraperConfig"] = {}
 _lock = threading.Lock()
+# Bumped on every change so callers can cache data derived from the registry
+_version = 0
 
 
 @dataclass(frozen=True)
@@ -102,12 +104,14 @@ class ScraperRegistry:
         Raises:
             ValueError: If scraper ID is invalid
         """
+        global _version
         with _lock:
             if config.id in _scrapers:
                 logger.warning(
                     f"Scraper '{config.id}' already registered. Overwriting."
                 )
             _scrapers[config.id] = config
+            _version += 1
             logger.info(f"Registered scraper: {config.id} ({config.name})")
 
     @classmethod
@@ -146,6 +150,19 @@ class ScraperRegistry:
         """
         return [c for c in _scrapers.values() if c.enabled]
 
+    @classmethod
+    def version(cls) -> int:
+        """
+        Get the registry version.
+
+        The version changes whenever a scraper is registered or the
+        registry is cleared, so it can key caches built from get_all().
+
+        Returns:
+            Monotonically increasing registry version
+        """
+        return _version
+
     @classmethod
     def is_enabled(cls, scraper_id: str) -> bool:
         """
@@ -167,8 +184,10 @@ class ScraperRegistry:
 
         Mainly intended for testing isolation.
         """
+        global _version
         with _lock:
             _scrapers.clear()
+            _version += 1
             logger.info("Cleared all scraper registrations")
 
 
@@ -3,8 +3,7 @@ import logging
 import re
 from typing import List, Optional, Any
 
-import aiohttp
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
 from services.scrapers.base_scraper import BaseScraper, ScrapedProduct, ScrapedPromotion
 from services.scrapers.registry import register_scraper
@@ -41,35 +40,29 @@ class WholesomeCoScraper(BaseScraper):
         products = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.http_client() as session:
                 # Add headers to look like a real browser
                 headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
                 }
                 
                 logger.info(f"Fetching {self.SHOP_URL}...")
-                async with session.get(self.SHOP_URL, headers=headers) as response:
+                async with self.request(session, "GET", self.SHOP_URL, headers=headers) as response:
                     if response.status != 200:
                         logger.error(f"Failed to fetch: {response.status}")
                         return products
 
                     html = await response.text()
 
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find all analytics divs that contain the payload
-            elements = soup.find_all('div', attrs={'data-analytics-rudderstack-payload-value': True})
-            
-            logger.info(f"Found {len(elements)} potential product elements")
+            payloads = self._extract_payloads(html)
 
-            for element in elements:
+            logger.info(f"Found {len(payloads)} potential product elements")
+
+            for raw_json in payloads:
                 try:
-                    # Extract JSON string
-                    raw_json = element.get('data-analytics-rudderstack-payload-value')
                     if not raw_json:
                         continue
-                        
+
                     data = json.loads(raw_json)
                     
                     # Verify it's a product by checking for required fields
@@ -121,6 +114,19 @@ class WholesomeCoScraper(BaseScraper):
         """
         return []
 
+    @staticmethod
+    def _extract_payloads(html: str) -> List[str]:
+        """
+        Pull the RudderStack JSON payloads out of the shop page.
+
+        Parsed with lxml (C) and an XPath that returns just the attribute
+        values, instead of building a BeautifulSoup tree of the whole page.
+        """
+        if not html.strip():
+            return []
+        tree = lxml_html.fromstring(html)
+        return tree.xpath('//div/@data-analytics-rudderstack-payload-value')
+
     def _map_category(self, category_data: Any) -> str:
         """Map WholesomeCo categories to our standard types"""
         category_str = ""
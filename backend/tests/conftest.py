@@ -3,6 +3,7 @@ Pytest fixtures and configuration for backend tests
 """
 import os
 import pytest
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -13,6 +14,12 @@ from database import Base, get_db
 from models import User
 from services.auth_service import hash_password, create_access_token
 from routers.auth import _limiter as auth_limiter
+from routers.reviews import _first_page_cache as review_page_cache
+from routers.scrapers import _status_cache as scraper_status_cache, clear_dispensary_cache
+from routers.search import clear_search_caches
+from routers.watchlist import _check_cache as watchlist_check_cache
+from services.scrapers.base_scraper import BaseScraper
+from services.scrapers.registry import ScraperConfig, ScraperRegistry
 
 
 @pytest.fixture(autouse=True)
@@ -29,6 +36,25 @@ def _reset_rate_limiter():
     auth_limiter.reset()
 
 
+@pytest.fixture(autouse=True)
+def _reset_response_caches():
+    """
+    Response caches are module-level singletons too; clear them so a page
+    cached by one test is never served to another.
+    """
+    review_page_cache.clear()
+    scraper_status_cache.clear()
+    clear_dispensary_cache()
+    clear_search_caches()
+    watchlist_check_cache.clear()
+    yield
+    review_page_cache.clear()
+    scraper_status_cache.clear()
+    clear_dispensary_cache()
+    clear_search_caches()
+    watchlist_check_cache.clear()
+
+
 # Use in-memory SQLite database for tests
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
 
@@ -78,12 +104,14 @@ def test_app():
         scrapers, reviews, watchlist, notifications
     )
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
 
     # Create test app without lifespan
     test_app_instance = FastAPI(
         title="Utah Cannabis Aggregator API (Test)",
         description="REST API for testing",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
     )
 
     # Register routers
@@ -99,6 +127,8 @@ def test_app():
     test_app_instance.include_router(watchlist.router)
     test_app_instance.include_router(notifications.router)
 
+    test_app_instance.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Configure CORS
     test_app_instance.add_middleware(
         CORSMiddleware,
@@ -244,6 +274,48 @@ def auth_headers(authenticated_user):
     return {"Authorization": f"Bearer {token}"}
 
 
+class StubScraper(BaseScraper):
+    """Scraper that never touches the network; returns the class-level products"""
+
+    products = []
+
+    async def scrape_products(self):
+        return list(self.products)
+
+    async def scrape_promotions(self):
+        return []
+
+
+@pytest.fixture
+def fake_registry():
+    """
+    Swap the scraper registry for a known set of scrapers, restoring the
+    real registrations afterwards
+
+    Returns:
+        Function that registers a scraper by ID (StubScraper by default)
+    """
+    original = ScraperRegistry.get_all()
+    ScraperRegistry.clear()
+
+    def _register(scraper_id, **overrides):
+        fields = {
+            "id": scraper_id,
+            "name": scraper_id.title(),
+            "scraper_class": StubScraper,
+            "dispensary_name": f"{scraper_id.title()} Dispensary",
+            "dispensary_location": "Salt Lake City, UT",
+        }
+        fields.update(overrides)
+        ScraperRegistry.register(ScraperConfig(**fields))
+
+    yield _register
+
+    ScraperRegistry.clear()
+    for config in original.values():
+        ScraperRegistry.register(config)
+
+
 # Mock Supabase client for tests (avoids external API calls)
 @pytest.fixture(autouse=True)
 def mock_supabase(monkeypatch):
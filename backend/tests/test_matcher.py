@@ -186,6 +186,39 @@ class TestProductMatcher:
         assert best_match is None
         assert score == 0.0
 
+    def test_score_prepared_matches_score_match(self):
+        """Scoring preprocessed features gives the same result as score_match"""
+        pairs = [
+            ("Blue Dream 3.5g", "Dream Blue", "Tryke Inc.", "tryke", 22.0, None),
+            ("Gorilla Glue #4™", "GG4", "WholesomeCo", "Dragonfly", 24.5, 12.0),
+            ("", "OG Kush", "", "", None, None),
+        ]
+
+        for scraped_name, master_name, scraped_brand, master_brand, scraped_thc, master_thc in pairs:
+            expected = ProductMatcher.score_match(
+                scraped_name, master_name, scraped_brand, master_brand, scraped_thc, master_thc
+            )
+            prepared = ProductMatcher.score_prepared(
+                ProductMatcher.preprocess(scraped_name, scraped_brand, scraped_thc),
+                ProductMatcher.preprocess(master_name, master_brand, master_thc)
+            )
+            assert prepared == expected
+
+    def test_could_reach_never_rejects_a_reachable_score(self):
+        """could_reach is False only when score_prepared is below the threshold"""
+        names = ["OG", "OG Kush", "Blue Dream", "Dream Blue 3.5g", "Gorilla Glue #4", "GG4", ""]
+        threshold = ProductMatcher.AUTO_MERGE_THRESHOLD
+
+        for a in names:
+            for b in names:
+                fa, fb = ProductMatcher.preprocess(a), ProductMatcher.preprocess(b)
+                score, _ = ProductMatcher.score_prepared(fa, fb)
+                if not ProductMatcher.could_reach(fa, fb, threshold):
+                    assert score < threshold
+        assert not ProductMatcher.could_reach(
+            ProductMatcher.preprocess("OG"), ProductMatcher.preprocess("Gorilla Glue #4"), threshold
+        )
+
     def test_threshold_description(self):
         """get_threshold_description should return correct descriptions"""
         high = ProductMatcher.get_threshold_description(0.95)
@@ -213,6 +213,23 @@ class TestProductEndpoints:
         assert all("min_price" in r for r in related)
         assert all("max_price" in r for r in related)
 
+    def test_get_related_products_ranked_by_similarity(self, client, db_session):
+        """Related products are the closest same-type names, best first, above the cutoff"""
+        for name in ("Gorilla Glue #5", "Gorilla Glue Cookies", "Zkittlez", "Gorilla Glue #4 Shake"):
+            db_session.add(Product(
+                name=name, product_type="Flower", brand_id=self.brand.id, is_master=True
+            ))
+        db_session.commit()
+
+        response = client.get(f"/api/products/{self.product.id}/related?limit=2")
+
+        related = response.json()
+        assert len(related) == 2
+        assert "Zkittlez" not in [r["name"] for r in related]
+        scores = [r["similarity_score"] for r in related]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score >= 0.6 for score in scores)
+
     def test_get_related_products_not_found(self, client):
         """Test GET /api/products/{id}/related returns 404 for non-existent product"""
         fake_id = "00000000-0000-0000-0000-000000000000"
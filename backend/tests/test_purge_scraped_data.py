@@ -0,0 +1,109 @@
+"""
+Tests for scripts/purge_scraped_data.py
+"""
+import pytest
+
+from models import Brand, Dispensary, Price, Product, Review, User, Watchlist
+from scripts import purge_scraped_data
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def purge(db_session, monkeypatch):
+    """Run the purge against the test database"""
+    monkeypatch.setattr(purge_scraped_data, "SessionLocal", TestingSessionLocal)
+    return lambda: purge_scraped_data.purge_scraped_data(skip_confirmation=True)
+
+
+class TestPurgeScrapedData:
+    """Tests for deleting scraped products and the rows that reference them"""
+
+    def test_removes_rows_attached_to_scraped_parents(self, db_session, create_test_user, purge):
+        """Prices and reviews on a scraped parent go with it, and review counts follow"""
+        user = create_test_user()
+        db_session.add_all([
+            Brand(id="brand-1", name="Brand"),
+            Dispensary(id="disp-1", name="Dispensary", location="Salt Lake City"),
+            Product(id="prod-001", name="Seed", product_type="flower", brand_id="brand-1"),
+            Product(id="scraped-1", name="Scraped", product_type="flower", brand_id="brand-1"),
+        ])
+        db_session.flush()
+        db_session.add_all([
+            Price(id="price-1", product_id="scraped-1", dispensary_id="disp-1", amount=40.0),
+            Review(
+                id="review-1", user_id=user.id, product_id="scraped-1",
+                effects_rating=4, taste_rating=4, value_rating=4
+            ),
+            Watchlist(id="watch-1", user_id=user.id, product_id="scraped-1"),
+        ])
+        db_session.commit()
+        db_session.refresh(user)
+        assert user.review_count == 1
+
+        purge()
+
+        db_session.expire_all()
+        assert db_session.query(Product.id).all() == [("prod-001",)]
+        assert db_session.query(Price).count() == 0
+        assert db_session.query(Review).count() == 0
+        assert db_session.query(Watchlist).count() == 0
+        assert db_session.get(User, user.id).review_count == 0
+
+    def test_counts_prices_on_scraped_parents(self, db_session, purge, capsys):
+        """Prices on scraped parents are part of the reported price count"""
+        db_session.add_all([
+            Brand(id="brand-1", name="Brand"),
+            Dispensary(id="disp-1", name="Dispensary", location="Salt Lake City"),
+            Product(id="scraped-1", name="Parent", product_type="flower", brand_id="brand-1"),
+            Product(
+                id="scraped-2", name="Variant", product_type="flower", brand_id="brand-1",
+                is_master=False, master_product_id="scraped-1"
+            ),
+        ])
+        db_session.flush()
+        db_session.add_all([
+            Price(id="price-1", product_id="scraped-1", dispensary_id="disp-1", amount=40.0),
+            Price(id="price-2", product_id="scraped-2", dispensary_id="disp-1", amount=35.0),
+        ])
+        db_session.commit()
+
+        purge()
+
+        assert "Prices on scraped products: 2" in capsys.readouterr().out
+        db_session.expire_all()
+        assert db_session.query(Price).count() == 0
+
+    def test_commits_each_batch_with_its_dependents(self, db_session, create_test_user, purge, monkeypatch):
+        """A failure part-way leaves earlier batches fully purged and later ones untouched"""
+        user = create_test_user()
+        db_session.add_all([
+            Brand(id="brand-1", name="Brand"),
+            Product(id="scraped-1", name="First", product_type="flower", brand_id="brand-1"),
+            Product(id="scraped-2", name="Second", product_type="flower", brand_id="brand-1"),
+        ])
+        db_session.flush()
+        db_session.add_all([
+            Watchlist(id="watch-1", user_id=user.id, product_id="scraped-1"),
+            Watchlist(id="watch-2", user_id=user.id, product_id="scraped-2"),
+        ])
+        db_session.commit()
+        monkeypatch.setattr(purge_scraped_data, "DELETE_BATCH_SIZE", 1)
+
+        commits = []
+        real_commit = purge_scraped_data.SessionLocal.class_.commit
+
+        def failing_commit(session):
+            commits.append(session)
+            if len(commits) == 3:
+                raise RuntimeError("connection lost")
+            real_commit(session)
+
+        monkeypatch.setattr(purge_scraped_data.SessionLocal.class_, "commit", failing_commit)
+        with pytest.raises(RuntimeError):
+            purge()
+        monkeypatch.undo()
+
+        db_session.expire_all()
+        remaining = db_session.query(Product.id).all()
+        assert len(remaining) == 1
+        assert db_session.query(Watchlist.product_id).all() == remaining
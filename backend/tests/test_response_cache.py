@@ -0,0 +1,62 @@
+"""Tests for the in-process TTL response cache"""
+from services.response_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache get/set, expiry, eviction and tag invalidation"""
+
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", b"1")
+        assert cache.get("a") == b"1"
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("services.response_cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("a", b"1")
+
+        now[0] += 29
+        assert cache.get("a") == b"1"
+        now[0] += 2
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_tag(self):
+        cache = TTLCache(maxsize=8, ttl=60)
+        cache.set(("p1", "recent"), 1, tag="p1")
+        cache.set(("p1", "helpful"), 2, tag="p1")
+        cache.set(("p2", "recent"), 3, tag="p2")
+
+        cache.invalidate_tag("p1")
+
+        assert cache.get(("p1", "recent")) is None
+        assert cache.get(("p1", "helpful")) is None
+        assert cache.get(("p2", "recent")) == 3
+
+    def test_get_or_set_computes_once(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return b"page", "p1"
+
+        assert cache.get_or_set("k", compute) == b"page"
+        assert cache.get_or_set("k", compute) == b"page"
+        assert len(calls) == 1
+
+        cache.invalidate_tag("p1")
+        cache.get_or_set("k", compute)
+        assert len(calls) == 2
@@ -0,0 +1,488 @@
+"""
+Test suite for review endpoints (/api/reviews/*)
+"""
+import base64
+import json
+import pytest
+from fastapi import status
+from datetime import datetime, timedelta
+from models import Product, Review, Brand, User
+
+
+@pytest.mark.integration
+class TestGetProductReviews:
+    """Tests for GET /api/reviews/product/{product_id}"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Create a parent product, a variant, and a handful of reviewers"""
+        self.db = db_session
+
+        self.brand = Brand(name="Test Brand")
+        self.db.add(self.brand)
+        self.db.flush()
+
+        self.product = Product(
+            name="Blue Dream",
+            product_type="Flower",
+            brand_id=self.brand.id,
+            is_master=True,
+        )
+        self.db.add(self.product)
+        self.db.flush()
+
+        self.variant = Product(
+            name="Blue Dream",
+            product_type="Flower",
+            brand_id=self.brand.id,
+            is_master=False,
+            master_product_id=self.product.id,
+            weight="3.5g",
+        )
+        self.db.add(self.variant)
+        self.db.flush()
+
+        base_time = datetime(2026, 1, 1, 12, 0, 0)
+        self.reviews = []
+        for i in range(5):
+            user = User(email=f"reviewer{i}@example.com", username=f"reviewer{i}")
+            self.db.add(user)
+            self.db.flush()
+            review = Review(
+                user_id=user.id,
+                product_id=self.product.id,
+                effects_rating=(i % 5) + 1,
+                taste_rating=(i % 5) + 1,
+                value_rating=(i % 5) + 1,
+                upvotes=i % 2,
+                intention_type="medical",
+                intention_tag="pain" if i % 2 == 0 else "insomnia",
+                created_at=base_time + timedelta(days=i),
+                updated_at=base_time + timedelta(days=i),
+            )
+            self.db.add(review)
+            self.reviews.append(review)
+        self.db.commit()
+
+    def _collect_pages(self, client, sort_by, limit):
+        """Walk every page via next_cursor and return the review ids in order"""
+        ids = []
+        params = {"sort_by": sort_by, "limit": limit}
+        while True:
+            response = client.get(f"/api/reviews/product/{self.product.id}", params=params)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            assert len(data["items"]) <= limit
+            ids.extend(item["id"] for item in data["items"])
+            if data["next_cursor"] is None:
+                return ids
+            params["cursor"] = data["next_cursor"]
+
+    def test_first_page_and_cursor(self, client):
+        """First page is capped at limit and returns a cursor for the rest"""
+        response = client.get(
+            f"/api/reviews/product/{self.product.id}", params={"limit": 2}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["next_cursor"] is not None
+        # Most recent first
+        assert data["items"][0]["id"] == self.reviews[4].id
+        assert data["items"][0]["username"] == "reviewer4"
+
+    def test_last_page_has_no_cursor(self, client):
+        """A page that holds every remaining review returns next_cursor=None"""
+        response = client.get(
+            f"/api/reviews/product/{self.product.id}", params={"limit": 5}
+        )
+
+        data = response.json()
+        assert len(data["items"]) == 5
+        assert data["next_cursor"] is None
+
+    @pytest.mark.parametrize("sort_by", ["recent", "helpful", "rating_high"])
+    def test_pages_cover_all_reviews_in_order(self, client, sort_by):
+        """Walking the cursors yields the same order as one unpaginated page"""
+        paged = self._collect_pages(client, sort_by, limit=2)
+        single = self._collect_pages(client, sort_by, limit=100)
+
+        assert paged == single
+        assert sorted(paged) == sorted(r.id for r in self.reviews)
+
+    def test_variant_resolves_to_parent(self, client):
+        """Reviews requested through a variant come from the parent product"""
+        response = client.get(f"/api/reviews/product/{self.variant.id}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["items"]) == 5
+
+    def test_filter_by_intention_tag(self, client):
+        """intention_tag filter composes with pagination"""
+        response = client.get(
+            f"/api/reviews/product/{self.product.id}",
+            params={"intention_tag": "pain"},
+        )
+
+        items = response.json()["items"]
+        assert len(items) == 3
+        assert all(item["intention_tag"] == "pain" for item in items)
+
+    def test_page_probe_runs_no_count_query(self, client):
+        """Next-page detection uses LIMIT n+1, never a COUNT(*) over the product's reviews"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get(
+                f"/api/reviews/product/{self.product.id}", params={"limit": 2}
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()["next_cursor"] is not None
+        assert not any("count(" in sql for sql in statements)
+        page_queries = [sql for sql in statements if "from reviews" in sql]
+        assert len(page_queries) == 1
+        assert "limit" in page_queries[0]
+
+    def test_invalid_cursor(self, client):
+        """Garbage cursors, and cursors whose values don't fit their columns, are rejected with 400"""
+        response = client.get(
+            f"/api/reviews/product/{self.product.id}",
+            params={"cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        mistyped = [
+            ("helpful", [{"a": 1}, "2026-01-01T00:00:00", "x"]),
+            ("helpful", ["5", "2026-01-01T00:00:00", "x"]),
+            ("rating_high", [True, "2026-01-01T00:00:00", "x"]),
+            ("recent", ["2026-01-01T00:00:00", ["x"]]),
+            ("recent", [20260101, "x"]),
+        ]
+        for sort_by, values in mistyped:
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            response = client.get(
+                f"/api/reviews/product/{self.product.id}",
+                params={"sort_by": sort_by, "cursor": cursor},
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST, (sort_by, values)
+            assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.integration
+class TestCreateReview:
+    """Tests for POST /api/reviews/"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """Create a parent product with one variant"""
+        self.db = db_session
+
+        brand = Brand(name="Create Brand")
+        self.db.add(brand)
+        self.db.flush()
+
+        self.product = Product(
+            name="Sour Diesel", product_type="Flower", brand_id=brand.id, is_master=True
+        )
+        self.db.add(self.product)
+        self.db.flush()
+
+        self.variant = Product(
+            name="Sour Diesel",
+            product_type="Flower",
+            brand_id=brand.id,
+            is_master=False,
+            master_product_id=self.product.id,
+            weight="1g",
+        )
+        self.db.add(self.variant)
+        self.db.commit()
+
+    def _payload(self, product_id, **overrides):
+        payload = {
+            "product_id": product_id,
+            "effects_rating": 5,
+            "taste_rating": 4,
+            "value_rating": 3,
+            "intention_type": "medical",
+            "intention_tag": "pain",
+            "cultivation_date": "2026-01-15",
+            "comment": "Solid.",
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_create_review(self, client, authenticated_user, auth_headers):
+        """Creating a review stores it with the computed overall rating"""
+        user, _ = authenticated_user
+
+        response = client.post(
+            "/api/reviews/", json=self._payload(self.product.id), headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        review = self.db.query(Review).filter(Review.id == response.json()["id"]).one()
+        assert review.user_id == user.id
+        assert review.rating == 4
+        assert review.upvotes == 0
+        assert review.cultivation_date.date().isoformat() == "2026-01-15"
+
+    def test_variant_review_attaches_to_parent(self, client, auth_headers):
+        """Reviews submitted against a variant are stored on the parent"""
+        response = client.post(
+            "/api/reviews/", json=self._payload(self.variant.id), headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        review = self.db.query(Review).filter(Review.id == response.json()["id"]).one()
+        assert review.product_id == self.product.id
+        assert response.json()["product_id"] == self.product.id
+
+    def test_create_is_a_single_insert(self, client, auth_headers):
+        """Parent resolution and the duplicate guard ride along with the INSERT"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        payload = self._payload(self.variant.id)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.post("/api/reviews/", json=payload, headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        review_statements = [
+            sql for sql in statements if "reviews" in sql or "from products" in sql
+        ]
+        assert len(review_statements) == 1
+        assert review_statements[0].startswith("insert into reviews")
+
+    def test_duplicate_review_rejected(self, client, auth_headers):
+        """A second review of the same parent (even via a variant) is a 400"""
+        first = client.post(
+            "/api/reviews/", json=self._payload(self.product.id), headers=auth_headers
+        )
+        second = client.post(
+            "/api/reviews/", json=self._payload(self.variant.id), headers=auth_headers
+        )
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_400_BAD_REQUEST
+        assert self.db.query(Review).count() == 1
+
+    def test_unknown_product(self, client, auth_headers):
+        """Reviewing a product that does not exist is a 404"""
+        response = client.post(
+            "/api/reviews/", json=self._payload("no-such-product"), headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_invalid_intention(self, client, auth_headers):
+        """Tags that don't belong to the intention type are rejected"""
+        response = client.post(
+            "/api/reviews/",
+            json=self._payload(self.product.id, intention_tag="socializing"),
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_cultivation_date(self, client, auth_headers):
+        """Non-ISO cultivation dates fail request validation"""
+        response = client.post(
+            "/api/reviews/",
+            json=self._payload(self.product.id, cultivation_date="15/01/2026"),
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_requires_authentication(self, client):
+        """Anonymous users cannot post reviews"""
+        response = client.post("/api/reviews/", json=self._payload(self.product.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.integration
+class TestModifyReview:
+    """Tests for PUT, DELETE and POST .../upvote on /api/reviews/{id}"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, authenticated_user):
+        """Create one review owned by the authenticated user and one by someone else"""
+        self.db = db_session
+        user, _ = authenticated_user
+
+        brand = Brand(name="Vote Brand")
+        self.db.add(brand)
+        self.db.flush()
+        product = Product(name="OG Kush", product_type="Flower", brand_id=brand.id)
+        other = User(email="other@example.com", username="other")
+        self.db.add_all([product, other])
+        self.db.flush()
+
+        self.own_review = Review(
+            user_id=user.id, product_id=product.id,
+            effects_rating=4, taste_rating=4, value_rating=4, upvotes=2,
+        )
+        self.other_review = Review(
+            user_id=other.id, product_id=product.id,
+            effects_rating=3, taste_rating=3, value_rating=3,
+        )
+        self.db.add_all([self.own_review, self.other_review])
+        self.db.commit()
+
+    def test_upvote_increments(self, client, auth_headers):
+        """Each upvote adds one and returns the new count"""
+        first = client.post(f"/api/reviews/{self.own_review.id}/upvote", headers=auth_headers)
+        second = client.post(f"/api/reviews/{self.own_review.id}/upvote", headers=auth_headers)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.json()["upvotes"] == 3
+        assert second.json()["upvotes"] == 4
+        assert second.json()["review_id"] == self.own_review.id
+
+    def test_upvote_missing_review(self, client, auth_headers):
+        """Upvoting a review that doesn't exist is a 404"""
+        response = client.post("/api/reviews/missing/upvote", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_delete_own_review(self, client, auth_headers):
+        """Authors can delete their own review"""
+        response = client.delete(f"/api/reviews/{self.own_review.id}", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert self.db.query(Review).filter(Review.id == self.own_review.id).first() is None
+
+    def test_delete_other_users_review(self, client, auth_headers):
+        """Deleting someone else's review is forbidden and leaves it in place"""
+        response = client.delete(f"/api/reviews/{self.other_review.id}", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert self.db.query(Review).filter(Review.id == self.other_review.id).first() is not None
+
+    def test_delete_missing_review(self, client, auth_headers):
+        """Deleting a review that doesn't exist is a 404"""
+        response = client.delete("/api/reviews/missing", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_update_recomputes_rating(self, client, auth_headers):
+        """Changing one component rating recomputes the overall rating in place"""
+        response = client.put(
+            f"/api/reviews/{self.own_review.id}",
+            json={"effects_rating": 1, "comment": "Changed my mind"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        self.db.expire_all()
+        review = self.db.query(Review).filter(Review.id == self.own_review.id).one()
+        assert review.effects_rating == 1
+        assert review.taste_rating == 4
+        assert review.rating == 3  # round((1 + 4 + 4) / 3)
+        assert review.comment == "Changed my mind"
+
+    def test_update_partial_intention_uses_stored_type(self, client, auth_headers):
+        """Updating only the tag validates it against the stored intention type"""
+        self.own_review.intention_type = "mood"
+        self.own_review.intention_tag = "focus"
+        self.db.commit()
+
+        ok = client.put(
+            f"/api/reviews/{self.own_review.id}",
+            json={"intention_tag": "creativity"},
+            headers=auth_headers,
+        )
+        bad = client.put(
+            f"/api/reviews/{self.own_review.id}",
+            json={"intention_tag": "pain"},
+            headers=auth_headers,
+        )
+
+        assert ok.status_code == status.HTTP_200_OK
+        assert bad.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_update_other_users_review(self, client, auth_headers):
+        """Updating someone else's review is forbidden"""
+        response = client.put(
+            f"/api/reviews/{self.other_review.id}",
+            json={"comment": "hijacked"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_update_missing_review(self, client, auth_headers):
+        """Updating a review that doesn't exist is a 404"""
+        response = client.put("/api/reviews/missing", json={"comment": "x"}, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_writes_invalidate_cached_first_page(self, client, auth_headers):
+        """A cached first page reflects upvotes and deletes made after it was cached"""
+        url = f"/api/reviews/product/{self.own_review.product_id}"
+        before = {r["id"]: r["upvotes"] for r in client.get(url).json()["items"]}
+
+        client.post(f"/api/reviews/{self.own_review.id}/upvote", headers=auth_headers)
+        after_upvote = {r["id"]: r["upvotes"] for r in client.get(url).json()["items"]}
+
+        client.delete(f"/api/reviews/{self.own_review.id}", headers=auth_headers)
+        after_delete = [r["id"] for r in client.get(url).json()["items"]]
+
+        assert before[self.own_review.id] == 2
+        assert after_upvote[self.own_review.id] == 3
+        assert after_delete == [self.other_review.id]
+
+
+@pytest.mark.integration
+class TestStreamProductReviews:
+    """Tests for GET /api/reviews/product/{product_id}/stream"""
+
+    def test_streams_all_reviews_as_ndjson(self, client, db_session):
+        """Every review comes back, one JSON object per line, in sort order"""
+        brand = Brand(name="Stream Brand")
+        db_session.add(brand)
+        db_session.flush()
+        product = Product(name="Jack Herer", product_type="Flower", brand_id=brand.id)
+        db_session.add(product)
+        db_session.flush()
+        base_time = datetime(2026, 2, 1)
+        for i in range(3):
+            user = User(email=f"streamer{i}@example.com", username=f"streamer{i}")
+            db_session.add(user)
+            db_session.flush()
+            db_session.add(Review(
+                user_id=user.id, product_id=product.id,
+                effects_rating=3, taste_rating=3, value_rating=3,
+                created_at=base_time + timedelta(hours=i),
+            ))
+        db_session.commit()
+
+        response = client.get(f"/api/reviews/product/{product.id}/stream")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["username"] for r in rows] == ["streamer2", "streamer1", "streamer0"]
+        assert all(r["rating"] == 3 for r in rows)
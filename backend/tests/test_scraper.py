@@ -3,6 +3,8 @@ Tests for scraper functionality.
 
 Run with: pytest backend/tests/test_scraper.py -v
 """
+import json
+
 import pytest
 from datetime import datetime, timezone
 from services.scrapers.base_scraper import BaseScraper, ScrapedProduct, ScrapedPromotion
@@ -170,6 +172,106 @@ class TestBaseScraper:
         assert scraper.get_last_run() is not None
         assert isinstance(scraper.get_last_run(), datetime)
 
+    @pytest.mark.asyncio
+    async def test_http_client_uses_injected_session(self):
+        """An injected shared session is reused and left open"""
+        import aiohttp
+
+        scraper = MockScraper("test-dispensary")
+        async with aiohttp.ClientSession() as shared:
+            scraper.http_session = shared
+            async with scraper.http_client() as session:
+                assert session is shared
+            assert not shared.closed
+
+    @pytest.mark.asyncio
+    async def test_http_client_without_injected_session(self):
+        """Without a shared session, a private one is opened and closed"""
+        scraper = MockScraper("test-dispensary")
+        async with scraper.http_client() as session:
+            assert not session.closed
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_browser_context_uses_injected_browser(self):
+        """An injected shared browser gets a fresh context per scrape, closed afterwards"""
+
+        class FakeContext:
+            closed = False
+
+            async def close(self):
+                self.closed = True
+
+        class FakeBrowser:
+            def __init__(self):
+                self.contexts = []
+
+            def is_connected(self):
+                return True
+
+            async def new_context(self, **options):
+                context = FakeContext()
+                context.options = options
+                self.contexts.append(context)
+                return context
+
+        browser = FakeBrowser()
+        scraper = MockScraper("test-dispensary")
+        scraper.browser = browser
+
+        async with scraper.browser_context(viewport={"width": 1280, "height": 800}) as context:
+            assert not context.closed
+
+        assert browser.contexts == [context]
+        assert context.options == {"viewport": {"width": 1280, "height": 800}}
+        assert context.closed
+
+    @pytest.mark.asyncio
+    async def test_request_backs_off_on_rate_limit(self):
+        """429/5xx responses are retried, honouring Retry-After"""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        statuses = [429, 503, 200]
+        seen = []
+
+        async def handler(request):
+            status = statuses[len(seen)]
+            seen.append(status)
+            headers = {"Retry-After": "0"} if status == 429 else {}
+            return web.Response(status=status, text="ok", headers=headers)
+
+        app = web.Application()
+        app.router.add_get("/", handler)
+        scraper = MockScraper("test-dispensary")
+
+        async with TestServer(app) as server:
+            async with scraper.http_client() as session:
+                async with scraper.request(
+                    session, "GET", str(server.make_url("/")), initial_delay=0.01
+                ) as response:
+                    assert response.status == 200
+                    assert await response.text() == "ok"
+
+                seen.clear()
+                statuses[:] = [500, 500]
+                async with scraper.request(
+                    session, "GET", str(server.make_url("/")),
+                    max_attempts=2, initial_delay=0.01
+                ) as response:
+                    assert response.status == 500
+
+        assert seen == [500, 500]
+
+    def test_retry_after_parsing(self):
+        """Retry-After accepts delta-seconds and HTTP-dates"""
+        from services.scrapers.base_scraper import _retry_after_seconds
+
+        assert _retry_after_seconds("3") == 3.0
+        assert _retry_after_seconds(None) is None
+        assert _retry_after_seconds("garbage") is None
+        assert _retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
 
 class TestWholesomeCoScraper:
     """Test cases for WholesomeCoScraper"""
@@ -219,6 +321,23 @@ class TestWholesomeCoScraper:
         assert scraper._extract_unit_size("") is None
         assert scraper._extract_unit_size(None) is None
 
+    def test_extract_payloads(self):
+        """Test RudderStack payload extraction from shop HTML"""
+        html = """
+        <html><body>
+          <div data-controller="analytics"
+               data-analytics-rudderstack-payload-value='{"product_id":"p1","name":"Lemon &amp; Lime Gummy","price":16.0}'
+               hidden="hidden"></div>
+          <div class="product-card"><span>No payload</span></div>
+          <section><div data-analytics-rudderstack-payload-value='{"product_id":"p2","name":"Blue Dream","price":40.0}'></div></section>
+        </body></html>
+        """
+
+        payloads = WholesomeCoScraper._extract_payloads(html)
+
+        assert [json.loads(p)["name"] for p in payloads] == ["Lemon & Lime Gummy", "Blue Dream"]
+        assert WholesomeCoScraper._extract_payloads("") == []
+
     @pytest.mark.asyncio
     async def test_scraper_initialization(self):
         """Test scraper initialization"""
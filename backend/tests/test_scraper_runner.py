@@ -0,0 +1,226 @@
+"""
+Tests for ScraperRunner orchestration
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from config import settings
+from models import Brand, Price, Product, ScraperRun
+from services.scraper_runner import ScraperRunner
+from services.scrapers.base_scraper import ScrapedProduct
+from tests.conftest import StubScraper
+
+
+class _SlowScraper(StubScraper):
+    """Stub that waits on the "network" and tracks how many runs overlap"""
+
+    in_flight = 0
+    peak = 0
+
+    async def scrape_products(self):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+            return []
+        finally:
+            cls.in_flight -= 1
+
+
+class _BrokenScraper(StubScraper):
+    """Stub whose scrape always fails"""
+
+    async def scrape_products(self):
+        raise RuntimeError("site is down")
+
+
+@pytest.mark.integration
+class TestRunAll:
+    """Tests for ScraperRunner.run_all"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, monkeypatch):
+        self.db = db_session
+        monkeypatch.setattr(_SlowScraper, "in_flight", 0)
+        monkeypatch.setattr(_SlowScraper, "peak", 0)
+
+    async def test_runs_overlap_up_to_the_limit(self, fake_registry, monkeypatch):
+        """Enabled scrapers run concurrently, capped by max_concurrent_scrapers"""
+        monkeypatch.setattr(settings, "max_concurrent_scrapers", 2)
+        for scraper_id in ("one", "two", "three"):
+            fake_registry(scraper_id, scraper_class=_SlowScraper)
+        fake_registry("off", scraper_class=_SlowScraper, enabled=False)
+
+        results = await ScraperRunner(self.db).run_all()
+
+        assert set(results) == {"one", "two", "three"}
+        assert all(result["status"] == "warning" for result in results.values())
+        assert _SlowScraper.peak == 2
+        assert self.db.query(ScraperRun).count() == 3
+
+    async def test_failure_does_not_cancel_others(self, fake_registry):
+        """One failing scraper is reported without affecting the rest"""
+        fake_registry("slow", scraper_class=_SlowScraper)
+        fake_registry("broken", scraper_class=_BrokenScraper)
+
+        results = await ScraperRunner(self.db).run_all()
+
+        assert results["slow"]["status"] == "warning"
+        assert results["broken"]["status"] == "error"
+        assert results["broken"]["error"] == "site is down"
+
+
+    async def test_run_many_runs_only_the_given_scrapers(self, fake_registry, monkeypatch):
+        """A batch of scraper ids runs concurrently, leaving the rest alone"""
+        monkeypatch.setattr(settings, "max_concurrent_scrapers", 3)
+        for scraper_id in ("one", "two", "three"):
+            fake_registry(scraper_id, scraper_class=_SlowScraper)
+
+        results = await ScraperRunner(self.db).run_many(["one", "three"])
+
+        assert set(results) == {"one", "three"}
+        assert _SlowScraper.peak == 2
+        assert self.db.query(ScraperRun).count() == 2
+
+@pytest.mark.integration
+class TestRunById:
+    """Tests for saving a scrape's prices in ScraperRunner.run_by_id"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, fake_registry, monkeypatch):
+        self.db = db_session
+        self.monkeypatch = monkeypatch
+        fake_registry("stub")
+
+    def _scrape(self, *products):
+        self.monkeypatch.setattr(StubScraper, "products", list(products))
+
+    async def test_new_and_updated_prices(self):
+        """First run inserts prices; a re-run updates them and adds new products"""
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0, weight="3.5g"),
+            ScrapedProduct(name="Sour Diesel", brand="Tryke", category="Flower", price=35.0, weight="3.5g"),
+        )
+        first = await ScraperRunner(self.db).run_by_id("stub")
+
+        assert first["status"] == "success"
+        assert first["products_processed"] == 2
+        assert self.db.query(Price).count() == 2
+
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=38.0, weight="3.5g"),
+            ScrapedProduct(name="Sour Diesel", brand="Tryke", category="Flower", price=35.0, weight="3.5g"),
+            ScrapedProduct(name="Jack Herer", brand="Tryke", category="Flower", price=42.0, weight="3.5g"),
+        )
+        second = await ScraperRunner(self.db).run_by_id("stub")
+
+        assert second["products_processed"] == 3
+        prices = {
+            price.product.name: price for price in self.db.query(Price).all()
+        }
+        assert len(prices) == 3
+        assert prices["Blue Dream"].amount == 38.0
+        assert prices["Blue Dream"].previous_price == 40.0
+        assert prices["Blue Dream"].price_change_percentage == pytest.approx(-5.0)
+        assert prices["Blue Dream"].price_change_date is not None
+        assert prices["Sour Diesel"].previous_price is None
+        assert prices["Jack Herer"].amount == 42.0
+
+    async def test_unchanged_price_is_left_alone(self):
+        """Re-scraping an identical listing doesn't touch its row"""
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0, weight="3.5g"),
+        )
+        await ScraperRunner(self.db).run_by_id("stub")
+        before = self.db.query(Price).one()
+        stamp = datetime(2026, 1, 1)
+        before.last_updated = stamp
+        self.db.commit()
+
+        await ScraperRunner(self.db).run_by_id("stub")
+        self.db.expire_all()
+
+        price = self.db.query(Price).one()
+        assert price.last_updated == stamp
+        assert price.previous_price is None
+
+    async def test_prices_written_in_one_upsert(self):
+        """New and existing prices are saved by a single statement, with no price preload"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0, weight="3.5g"),
+        )
+        await ScraperRunner(self.db).run_by_id("stub")
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=38.0, weight="3.5g"),
+            ScrapedProduct(name="Sour Diesel", brand="Tryke", category="Flower", price=35.0, weight="3.5g"),
+        )
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await ScraperRunner(self.db).run_by_id("stub")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        price_writes = [
+            sql for sql in statements
+            if sql.startswith(("insert into prices", "update prices"))
+        ]
+        assert len(price_writes) == 1
+        assert "on conflict" in price_writes[0]
+        assert self.db.query(Price).count() == 2
+
+    async def test_product_scraped_twice_keeps_one_price(self):
+        """Duplicate listings in one scrape collapse to a single price row"""
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0, weight="3.5g"),
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=41.0, weight="3.5g"),
+        )
+
+        result = await ScraperRunner(self.db).run_by_id("stub")
+
+        assert result["status"] == "success"
+        prices = self.db.query(Price).all()
+        assert len(prices) == 1
+        assert prices[0].amount == 41.0
+
+    async def test_candidates_load_without_per_master_queries(self):
+        """Existing masters and their brands are preloaded in bulk, not lazily"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        for i in range(3):
+            brand = Brand(name=f"Preload Brand {i}")
+            self.db.add(brand)
+            self.db.flush()
+            self.db.add(Product(
+                name=f"Preload Strain {i}", product_type="Flower", brand_id=brand.id, is_master=True
+            ))
+        self.db.commit()
+        self._scrape(
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0, weight="3.5g"),
+        )
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await ScraperRunner(self.db).run_by_id("stub")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result["status"] == "success"
+        assert not any("where brands.id =" in sql for sql in statements)
@@ -0,0 +1,57 @@
+"""
+Tests for running scrapers out of process (services/scraper_subprocess.py)
+"""
+import time
+
+import pytest
+
+from services.scraper_subprocess import ScraperWorker
+
+
+@pytest.fixture
+def worker():
+    worker = ScraperWorker()
+    yield worker
+    worker.stop()
+
+
+class TestScraperWorker:
+    """Tests for the persistent run_scraper_subprocess.py --worker process"""
+
+    def test_reuses_one_process(self, worker):
+        """Consecutive jobs run in the same worker and report their outcome"""
+        first = worker.run("no-such-scraper", timeout=30)
+        pid = worker._process.pid
+        second = worker.run("no-such-scraper", timeout=30)
+
+        assert first["status"] == "error"
+        assert "Unknown scraper" in first["message"]
+        assert second["status"] == "error"
+        assert worker._process.pid == pid
+
+    def test_replaces_a_dead_worker(self, worker):
+        """A worker that exits is restarted for the next job"""
+        worker.run("no-such-scraper", timeout=30)
+        dead = worker._process
+        dead.kill()
+        dead.wait()
+        time.sleep(0.1)
+
+        result = worker.run("no-such-scraper", timeout=30)
+
+        assert result["status"] == "error"
+        assert worker._process is not dead
+
+
+class TestImportScrapers:
+    """Tests for importing only the scrapers a subprocess runs"""
+
+    def test_modules_register_their_scrapers(self):
+        """Every SCRAPER_MODULES entry registers the scraper ID it is listed under"""
+        from run_scraper_subprocess import SCRAPER_MODULES, import_scrapers
+        from services.scrapers.registry import ScraperRegistry
+
+        import_scrapers(list(SCRAPER_MODULES))
+
+        for scraper_id in SCRAPER_MODULES:
+            assert ScraperRegistry.get(scraper_id) is not None, scraper_id
@@ -0,0 +1,548 @@
+"""
+Test suite for scraper management endpoints (/scrapers/*)
+"""
+import pytest
+from fastapi import status
+from datetime import datetime, timedelta
+
+from models import Brand, Dispensary, Price, Product
+from services.scrapers.base_scraper import ScrapedProduct
+from tests.conftest import StubScraper
+
+
+@pytest.fixture
+def admin_headers(authenticated_user, db_session):
+    """Authorization headers for a user with admin privileges"""
+    user, token = authenticated_user
+    user.is_admin = True
+    db_session.commit()
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.integration
+class TestRegistryViews:
+    """Tests for the registry-derived /list, /dashboard and /test endpoints"""
+
+    def test_list_scrapers(self, client, admin_headers, fake_registry):
+        """Every registered scraper is listed"""
+        fake_registry("alpha", description="First")
+        fake_registry("beta", enabled=False)
+
+        response = client.get("/scrapers/list", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = {item["id"]: item for item in response.json()}
+        assert set(data) == {"alpha", "beta"}
+        assert data["alpha"]["description"] == "First"
+        assert data["beta"]["enabled"] is False
+
+    def test_list_enabled_only(self, client, admin_headers, fake_registry):
+        """enabled_only drops disabled scrapers from the list"""
+        fake_registry("alpha")
+        fake_registry("beta", enabled=False)
+
+        response = client.get(
+            "/scrapers/list", params={"enabled_only": True}, headers=admin_headers
+        )
+
+        assert [item["id"] for item in response.json()] == ["alpha"]
+
+    def test_list_reflects_new_registrations(self, client, admin_headers, fake_registry):
+        """Cached views are rebuilt when the registry changes"""
+        fake_registry("alpha")
+        first = client.get("/scrapers/list", headers=admin_headers)
+        dashboard_before = client.get("/scrapers/dashboard", headers=admin_headers)
+
+        fake_registry("gamma")
+        second = client.get("/scrapers/list", headers=admin_headers)
+        dashboard_after = client.get("/scrapers/dashboard", headers=admin_headers)
+
+        assert [item["id"] for item in first.json()] == ["alpha"]
+        assert [item["id"] for item in second.json()] == ["alpha", "gamma"]
+        assert "runScraper('gamma')" not in dashboard_before.text
+        assert "runScraper('gamma')" in dashboard_after.text
+
+    def test_dashboard_lists_scrapers(self, client, admin_headers, fake_registry):
+        """The dashboard renders a card per scraper"""
+        fake_registry("alpha", description="Alpha shop")
+
+        response = client.get("/scrapers/dashboard", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/html")
+        assert "Alpha shop" in response.text
+        assert "runScraper('alpha')" in response.text
+
+    def test_dashboard_gzip_negotiation(self, client, admin_headers, fake_registry):
+        """The dashboard is sent precompressed only to clients that accept gzip"""
+        fake_registry("alpha")
+
+        plain = client.get(
+            "/scrapers/dashboard", headers={**admin_headers, "Accept-Encoding": "identity"}
+        )
+        compressed = client.get(
+            "/scrapers/dashboard", headers={**admin_headers, "Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.text == plain.text
+
+    @pytest.mark.parametrize("path", ["/scrapers/list", "/scrapers/dashboard"])
+    def test_conditional_get(self, client, admin_headers, fake_registry, path):
+        """Registry views carry an ETag and answer a matching If-None-Match with 304"""
+        fake_registry("alpha")
+
+        first = client.get(path, headers=admin_headers)
+        etag = first.headers["etag"]
+        repeat = client.get(path, headers={**admin_headers, "If-None-Match": etag})
+        fake_registry("gamma")
+        changed = client.get(path, headers={**admin_headers, "If-None-Match": etag})
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.headers["cache-control"].startswith("private, max-age=300")
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+        assert repeat.content == b""
+        assert repeat.headers["etag"] == etag
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.headers["etag"] != etag
+
+    def test_dashboard_etag_per_encoding(self, client, admin_headers, fake_registry):
+        """Plain and gzipped dashboards are validated separately"""
+        fake_registry("alpha")
+
+        plain = client.get(
+            "/scrapers/dashboard", headers={**admin_headers, "Accept-Encoding": "identity"}
+        )
+        compressed = client.get(
+            "/scrapers/dashboard",
+            headers={**admin_headers, "Accept-Encoding": "gzip", "If-None-Match": plain.headers["etag"]}
+        )
+
+        assert compressed.status_code == status.HTTP_200_OK
+        assert compressed.headers["etag"] != plain.headers["etag"]
+
+    def test_unknown_scraper_lists_available(self, client, admin_headers, fake_registry):
+        """Testing an unknown scraper is a 404 naming the registered ones"""
+        fake_registry("alpha")
+
+        response = client.get("/scrapers/test/nope", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "['alpha']" in response.json()["detail"]
+
+    def test_scraper_returns_products(self, client, admin_headers, fake_registry, monkeypatch):
+        """A test run returns every scraped product without saving anything"""
+        monkeypatch.setattr(StubScraper, "products", [
+            ScrapedProduct(
+                name="Gorilla Glue #4", brand="Tryke", category="Flower", price=45.0,
+                thc_percentage=24.5, weight="3.5g", raw_data={"sku": "gg4"}
+            ),
+            ScrapedProduct(name="Blue Dream", brand="Tryke", category="Flower", price=40.0),
+        ])
+        fake_registry("alpha")
+
+        response = client.get(
+            "/scrapers/test/alpha", params={"include_raw": True}, headers=admin_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["scraper"] == "alpha"
+        assert data["products_found"] == 2
+        assert isinstance(data["duration"], float)
+        assert data["products"][0] == {
+            "name": "Gorilla Glue #4",
+            "brand": "Tryke",
+            "category": "Flower",
+            "price": 45.0,
+            "thc_percentage": 24.5,
+            "cbd_percentage": None,
+            "unit_size": "3.5g",
+            "raw_data": {"sku": "gg4"},
+        }
+
+    def test_raw_data_is_opt_in(self, client, admin_headers, fake_registry, monkeypatch):
+        """Raw payloads are left out unless include_raw is set"""
+        monkeypatch.setattr(StubScraper, "products", [
+            ScrapedProduct(
+                name="Blue Dream", brand="Tryke", category="Flower", price=40.0,
+                raw_data={"sku": "bd", "menu": ["x"] * 50}
+            ),
+        ])
+        fake_registry("alpha")
+
+        response = client.get("/scrapers/test/alpha", headers=admin_headers)
+
+        assert response.json()["products"][0]["raw_data"] is None
+        assert response.json()["products"][0]["name"] == "Blue Dream"
+
+    def test_large_test_run_is_gzipped(self, client, admin_headers, fake_registry, monkeypatch):
+        """Big scrape dumps are compressed for clients that accept gzip"""
+        monkeypatch.setattr(StubScraper, "products", [
+            ScrapedProduct(name=f"Strain {i}", brand="Tryke", category="Flower", price=40.0)
+            for i in range(200)
+        ])
+        fake_registry("alpha")
+
+        response = client.get(
+            "/scrapers/test/alpha", headers={**admin_headers, "Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["products_found"] == 200
+
+    def test_scraper_with_no_products(self, client, admin_headers, fake_registry):
+        """An empty scrape still produces a complete document"""
+        fake_registry("alpha")
+
+        response = client.get("/scrapers/test/alpha", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["products"] == []
+        assert response.json()["products_found"] == 0
+
+    def test_failing_scraper_is_500(self, client, admin_headers, fake_registry):
+        """A scraper that fails before producing anything gets a proper error"""
+
+        class _BrokenScraper(StubScraper):
+            async def scrape_products(self):
+                raise RuntimeError("site is down")
+
+        fake_registry("alpha", scraper_class=_BrokenScraper)
+
+        response = client.get("/scrapers/test/alpha", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "site is down" in response.json()["detail"]
+
+    def test_disabled_scraper_rejected(self, client, admin_headers, fake_registry):
+        """Disabled scrapers can't be test-run"""
+        fake_registry("alpha", enabled=False)
+
+        response = client.get("/scrapers/test/alpha", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_requires_admin(self, client, auth_headers):
+        """Non-admin users cannot reach the scraper router"""
+        response = client.get("/scrapers/list", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_each_route_registered_once(self):
+        """No path/method pair is declared twice (a later one would be unreachable)"""
+        from routers.scrapers import router
+
+        operations = [
+            (route.path, method) for route in router.routes for method in route.methods
+        ]
+
+        assert len(operations) == len(set(operations))
+        assert ("/scrapers/run/{scraper_id}", "POST") in operations
+        assert ("/scrapers/run/wholesomeco", "POST") not in operations
+
+
+@pytest.mark.integration
+class TestRunScraper:
+    """Tests for POST /scrapers/run/{scraper_id}"""
+
+    def test_run_starts_in_background(self, client, admin_headers, fake_registry, monkeypatch):
+        """The run is accepted at once, and one run per scraper is in flight at a time"""
+        import asyncio
+        import time
+        from routers import scrapers
+
+        calls = []
+
+        async def fake_subprocess(scraper_id, timeout):
+            calls.append(scraper_id)
+            await asyncio.sleep(0.3)
+            return {"status": "success"}
+
+        monkeypatch.setattr(scrapers, "run_scraper_subprocess_async", fake_subprocess)
+        fake_registry("alpha")
+
+        started = client.post("/scrapers/run/alpha", headers=admin_headers)
+        duplicate = client.post("/scrapers/run/alpha", headers=admin_headers)
+
+        deadline = time.monotonic() + 5
+        while "alpha" in scrapers._running_scrapers and time.monotonic() < deadline:
+            time.sleep(0.05)
+        again = client.post("/scrapers/run/alpha", headers=admin_headers)
+
+        assert started.status_code == status.HTTP_202_ACCEPTED
+        assert started.json()["status"] == "started"
+        assert duplicate.status_code == status.HTTP_409_CONFLICT
+        assert again.status_code == status.HTTP_202_ACCEPTED
+        assert calls[0] == "alpha"
+
+    def test_unknown_scraper(self, client, admin_headers, fake_registry):
+        """Running an unregistered scraper is a 404"""
+        fake_registry("alpha")
+
+        response = client.post("/scrapers/run/nope", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+class TestScraperStatus:
+    """Tests for GET /scrapers/status"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, fake_registry):
+        """Register three scrapers: one with prices, one without, one with no dispensary"""
+        self.db = db_session
+
+        fake_registry("stocked")
+        fake_registry("empty")
+        fake_registry("missing")
+
+        brand = Brand(name="Status Brand")
+        stocked = Dispensary(name="Stocked Dispensary")
+        empty = Dispensary(name="Empty Dispensary")
+        self.db.add_all([brand, stocked, empty])
+        self.db.flush()
+
+        self.latest = datetime(2026, 3, 1, 9, 30)
+        for i in range(3):
+            product = Product(name=f"Status Product {i}", product_type="Flower", brand_id=brand.id)
+            self.db.add(product)
+            self.db.flush()
+            self.db.add(Price(
+                product_id=product.id,
+                dispensary_id=stocked.id,
+                amount=30.0 + i,
+                last_updated=self.latest - timedelta(hours=i),
+            ))
+        self.db.commit()
+
+    def test_status_per_scraper(self, client, admin_headers):
+        """Each scraper reports its dispensary's latest price update and price count"""
+        response = client.get("/scrapers/status", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = {item["name"]: item for item in response.json()}
+
+        assert data["stocked"]["status"] == "success"
+        assert data["stocked"]["last_product_count"] == 3
+        assert data["stocked"]["last_run"] == self.latest.isoformat()
+
+        assert data["empty"]["status"] == "never_run"
+        assert data["empty"]["last_product_count"] == 0
+        assert data["empty"]["error_message"] is None
+
+        assert data["missing"]["status"] == "never_run"
+        assert data["missing"]["error_message"] == "Dispensary not found in database"
+
+    def test_disabled_scraper_skips_database(self, client, admin_headers, fake_registry):
+        """Disabled scrapers report never_run and are left out of the query"""
+        fake_registry("dormant", enabled=False, dispensary_name="Stocked Dispensary")
+
+        response = client.get("/scrapers/status", headers=admin_headers)
+
+        data = {item["name"]: item for item in response.json()}
+        assert data["dormant"]["status"] == "never_run"
+        assert data["dormant"]["error_message"] == "Scraper is disabled"
+        assert data["stocked"]["status"] == "success"
+
+    def test_status_cached_until_a_run(self, client, admin_headers):
+        """Repeat polls are served from cache; running scrapers drops it"""
+        first = client.get("/scrapers/status", headers=admin_headers)
+
+        empty = self.db.query(Dispensary).filter(Dispensary.name == "Empty Dispensary").one()
+        product = self.db.query(Product).first()
+        self.db.add(Price(product_id=product.id, dispensary_id=empty.id, amount=10.0))
+        self.db.commit()
+
+        cached = client.get("/scrapers/status", headers=admin_headers)
+        client.post("/scrapers/run/all", headers=admin_headers)
+        fresh = client.get("/scrapers/status", headers=admin_headers)
+
+        def empty_status(response):
+            return next(item for item in response.json() if item["name"] == "empty")["status"]
+
+        assert empty_status(first) == "never_run"
+        assert empty_status(cached) == "never_run"
+        assert empty_status(fresh) == "success"
+
+    def test_failed_status_is_not_cached(self, client, admin_headers):
+        """A database error reports every scraper failed for that request only"""
+        from sqlalchemy import event
+        from sqlalchemy.exc import OperationalError
+        from tests.conftest import engine
+
+        def fail(conn, cursor, statement, parameters, context, executemany):
+            if "group by" in statement.lower():
+                raise OperationalError(statement, parameters, Exception("database is down"))
+
+        event.listen(engine, "before_cursor_execute", fail)
+        try:
+            failed = client.get("/scrapers/status", headers=admin_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", fail)
+        recovered = client.get("/scrapers/status", headers=admin_headers)
+
+        assert {item["status"] for item in failed.json()} == {"failed"}
+        assert "database is down" in failed.json()[0]["error_message"]
+        data = {item["name"]: item for item in recovered.json()}
+        assert data["stocked"]["status"] == "success"
+
+    def test_status_is_one_query(self, client, admin_headers):
+        """Status for every scraper comes from a single grouped query"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/scrapers/status", headers=admin_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == status.HTTP_200_OK
+        price_queries = [sql for sql in statements if "prices" in sql]
+        assert len(price_queries) == 1
+        assert "group by" in price_queries[0]
+        # Dispensaries for all three scrapers are matched by one IN filter
+        dispensary_queries = [sql for sql in statements if "from dispensaries" in sql]
+        assert dispensary_queries == price_queries
+        assert "dispensaries.name in" in dispensary_queries[0]
+
+
+@pytest.mark.integration
+class TestRecentProducts:
+    """Tests for GET /scrapers/products/recent/{scraper_id}"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session, fake_registry):
+        """One dispensary with a few priced products"""
+        self.db = db_session
+
+        fake_registry("recent")
+
+        brand = Brand(name="Recent Brand")
+        dispensary = Dispensary(name="Recent Dispensary")
+        self.db.add_all([brand, dispensary])
+        self.db.flush()
+
+        base_time = datetime(2026, 3, 1, 9, 0)
+        self.products = []
+        for i in range(4):
+            product = Product(
+                name=f"Recent Product {i}",
+                product_type="Flower",
+                brand_id=brand.id,
+                thc_percentage=20.0 + i,
+            )
+            self.db.add(product)
+            self.db.flush()
+            self.db.add(Price(
+                product_id=product.id,
+                dispensary_id=dispensary.id,
+                amount=40.0 + i,
+                last_updated=base_time + timedelta(hours=i),
+            ))
+            self.products.append(product)
+        self.db.commit()
+
+    def test_most_recent_first(self, client, admin_headers):
+        """Products come back newest price update first, capped at limit"""
+        response = client.get(
+            "/scrapers/products/recent/recent", params={"limit": 3}, headers=admin_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["name"] for item in data] == [
+            "Recent Product 3", "Recent Product 2", "Recent Product 1"
+        ]
+        assert data[0]["brand"] == "Recent Brand"
+        assert data[0]["price"] == 43.0
+        assert data[0]["dispensary"] == "Recent Dispensary"
+
+    def test_no_per_row_queries(self, client, admin_headers):
+        """Products and brands load with the prices, not lazily per row"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/scrapers/products/recent/recent", headers=admin_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(response.json()) == 4
+        assert len([sql for sql in statements if "from products" in sql]) == 0
+        price_queries = [sql for sql in statements if "from prices" in sql]
+        assert len(price_queries) == 1
+        # Only the response columns are fetched, not whole product rows
+        assert "products.cbd_content" not in price_queries[0]
+
+    def test_dispensary_lookup_cached(self, client, admin_headers):
+        """The dispensary id is looked up once, not on every request"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for _ in range(3):
+                response = client.get("/scrapers/products/recent/recent", headers=admin_headers)
+                assert response.json()[0]["dispensary"] == "Recent Dispensary"
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len([sql for sql in statements if "from dispensaries" in sql]) == 1
+
+    def test_served_from_dispensary_index(self, client, admin_headers):
+        """The newest-first price scan walks the (dispensary_id, last_updated) index"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        captured = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "from prices" in statement.lower():
+                captured.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            client.get("/scrapers/products/recent/recent", headers=admin_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        statement, parameters = captured[0]
+        with engine.connect() as conn:
+            plan = " ".join(
+                row[-1] for row in conn.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                )
+            )
+
+        assert "ix_prices_dispensary_last_updated" in plan
+        # The index already yields rows newest first, so no sort step
+        assert "TEMP B-TREE FOR ORDER BY" not in plan
+
+    def test_unknown_dispensary(self, client, admin_headers, fake_registry):
+        """A scraper whose dispensary isn't in the database is a 404"""
+        fake_registry("nowhere")
+
+        response = client.get("/scrapers/products/recent/nowhere", headers=admin_headers)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
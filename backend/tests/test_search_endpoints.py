@@ -207,6 +207,14 @@ class TestProductSearch:
             assert result["min_price"] >= 40
             assert result["max_price"] <= 50
 
+    def test_search_price_range_narrows_aggregates(self, client):
+        """Out-of-range prices are left out of min/max and the dispensary count"""
+        response = client.get("/api/products/search?q=Gorilla Glue&max_price=47")
+
+        gorilla = next(r for r in response.json() if "Gorilla Glue" in r["name"])
+        assert gorilla["min_price"] == gorilla["max_price"] == 45.0
+        assert gorilla["dispensary_count"] == 1
+
     def test_search_with_thc_filter(self, client):
         """Test search filtered by THC percentage"""
         response = client.get("/api/products/search?q=Blue&min_thc=20")
@@ -391,6 +399,130 @@ class TestProductSearch:
         assert blue_dream is not None
         assert blue_dream["relevance_score"] >= 0.8
 
+    def test_search_variant_prices_and_weights(self, client):
+        """A parent's prices and weights come from its variants"""
+        parent = self.products[1]  # Blue Dream
+        for weight, amount in (("3.5g", 30.0), ("7g", 55.0)):
+            variant = Product(
+                name="Blue Dream", product_type="Flower", brand_id=parent.brand_id,
+                weight=weight, is_master=False, master_product_id=parent.id
+            )
+            self.db.add(variant)
+            self.db.flush()
+            self.db.add(Price(
+                amount=amount, in_stock=True,
+                product_id=variant.id, dispensary_id=self.dispensary_park.id
+            ))
+        self.db.commit()
+
+        response = client.get("/api/products/search?q=Blue Dream&product_type=Flower")
+
+        result = next(r for r in response.json() if r["name"] == "Blue Dream")
+        assert result["available_weights"] == ["3.5g", "7g"]
+        assert result["min_price"] == 30.0
+        assert result["max_price"] == 55.0
+        assert result["dispensary_count"] == 1
+
+    def test_search_query_count_independent_of_matches(self, client):
+        """Prices and variants load in bulk, not once per matching product"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/products/search?q=Blue Dream Gorilla Glue Kush")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(response.json()) >= 3
+        assert len(statements) == 3
+
+    def test_search_loads_only_needed_columns(self, client):
+        """Candidates are loaded without columns scoring and the response never read"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/products/search?q=Blue Dream")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()[0]["brand"] == "Tryke"
+        columns = statements[0].split(" from ")[0]
+        assert columns.count(".name_lower") == 2  # product and brand
+        assert "cbd_content" not in columns
+        assert "created_at" not in columns
+
+    def test_search_candidates_capped_by_matched_words(self, client, monkeypatch):
+        """A capped candidate pool keeps the names matching the most query words"""
+        monkeypatch.setattr("routers.search.SEARCH_CANDIDATE_LIMIT", 1)
+
+        response = client.get("/api/products/search?q=Blue Dream Cart")
+
+        assert [r["name"] for r in response.json()] == ["Blue Dream Vape Cart"]
+
+    def test_search_scores_renamed_product(self, client):
+        """The generated lowercase name follows renames, so scoring sees the new name"""
+        product = self.products[3]  # Granddaddy Purple
+        product.name = "Purple Haze"
+        self.db.commit()
+        self.db.refresh(product)
+
+        response = client.get("/api/products/search?q=PURPLE HAZE")
+
+        assert product.name_lower == "purple haze"
+        top = response.json()[0]
+        assert top["name"] == "Purple Haze"
+        assert top["relevance_score"] == 1.0
+
+    def test_search_repeat_is_cached(self, client):
+        """A repeated search (any case) is served without touching the database"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        first = client.get("/api/products/search?q=Blue Dream&product_type=Flower")
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            second = client.get("/api/products/search?q=blue dream&product_type=flower")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert second.json() == first.json()
+        assert statements == []
+
+    def test_search_cache_cleared_after_scraper_run(self, client, db_session):
+        """Clearing the search cache makes new prices visible immediately"""
+        from routers.search import clear_search_caches
+
+        before = client.get("/api/products/search?q=Blue Dream&product_type=Flower").json()
+        price = db_session.query(Price).filter(Price.product_id == self.products[1].id).one()
+        price.amount = 30.0
+        db_session.commit()
+
+        stale = client.get("/api/products/search?q=Blue Dream&product_type=Flower").json()
+        clear_search_caches()
+        fresh = client.get("/api/products/search?q=Blue Dream&product_type=Flower").json()
+
+        assert stale == before
+        assert fresh[0]["min_price"] == 30.0
+
 
 @pytest.mark.integration
 class TestProductAutocomplete:
@@ -474,6 +606,33 @@ class TestProductAutocomplete:
         # Both should return same results
         assert len(results_lower) == len(results_upper)
 
+    def test_autocomplete_prefix_matches_first(self, client, db_session):
+        """Names starting with the query rank ahead of mid-name matches"""
+        db_session.add(Product(name="Dream Queen", product_type="Flower",
+                               brand_id=self.brand.id, is_master=True))
+        db_session.commit()
+
+        response = client.get("/api/products/autocomplete?q=dream")
+
+        assert [s["name"] for s in response.json()] == ["Dream Queen", "Blue Dream"]
+
+    def test_autocomplete_wildcards_are_literal(self, client):
+        """LIKE wildcards in the query match only themselves"""
+        response = client.get("/api/products/autocomplete?q=%25_")
+
+        assert response.json() == []
+
+    def test_autocomplete_case_variants_share_cache(self, client, db_session):
+        """Case variants of a query are answered from one cached entry"""
+        first = client.get("/api/products/autocomplete?q=blu")
+        db_session.add(Product(name="Blue Cheese", product_type="Flower",
+                               brand_id=self.brand.id, is_master=True))
+        db_session.commit()
+
+        second = client.get("/api/products/autocomplete?q=BLU")
+
+        assert second.json() == first.json()
+
     def test_autocomplete_no_results(self, client):
         """Test autocomplete returns empty when no matches"""
         response = client.get("/api/products/autocomplete?q=NonExistentXYZ")
@@ -44,15 +44,22 @@ class TestGetUserProfile:
             thc_percentage=20.0,
             product_type="flower",
         )
+        product2 = Product(
+            id="test-product-id-2",
+            name="Test Product 2",
+            brand_id="test-brand-id",
+            thc_percentage=18.0,
+            product_type="flower",
+        )
         db_session.add(brand)
         db_session.add(product)
+        db_session.add(product2)
         db_session.commit()
 
-        # Create a couple of reviews
+        # Create a couple of reviews (one review per user per product)
         review1 = Review(
             user_id=user.id,
             product_id="test-product-id",
-            rating=5,
             effects_rating=5,
             taste_rating=4,
             value_rating=5,
@@ -60,8 +67,7 @@ class TestGetUserProfile:
         )
         review2 = Review(
             user_id=user.id,
-            product_id="test-product-id",
-            rating=4,
+            product_id="test-product-id-2",
             effects_rating=4,
             taste_rating=4,
             value_rating=4,
@@ -77,6 +83,50 @@ class TestGetUserProfile:
         assert response.status_code == status.HTTP_200_OK
         assert response.json()["review_count"] == 2
 
+    def test_review_count_follows_reviews(self, client, auth_headers, db_session):
+        """The stored count tracks created and deleted reviews without a COUNT query"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        db_session.add(Brand(id="brand-1", name="Brand"))
+        for i in range(2):
+            db_session.add(Product(
+                id=f"product-{i}", name=f"Product {i}", brand_id="brand-1", product_type="flower"
+            ))
+        db_session.commit()
+
+        review_ids = []
+        for i in range(2):
+            response = client.post("/api/reviews/", json={
+                "product_id": f"product-{i}",
+                "effects_rating": 4,
+                "taste_rating": 4,
+                "value_rating": 4,
+                "intention_type": "medical",
+                "intention_tag": "pain",
+            }, headers=auth_headers)
+            review_ids.append(response.json()["id"])
+        client.delete(f"/api/reviews/{review_ids[0]}", headers=auth_headers)
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/users/me", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()["review_count"] == 1
+        assert not [sql for sql in statements if "from reviews" in sql]
+
+        # Reviews removed by a cascading product delete are counted too
+        db_session.delete(db_session.get(Product, "product-1"))
+        db_session.commit()
+        assert client.get("/api/users/me", headers=auth_headers).json()["review_count"] == 0
+
 
 @pytest.mark.integration
 class TestUpdateUserProfile:
@@ -152,7 +202,6 @@ class TestGetUserReviews:
         review = Review(
             user_id=user.id,
             product_id="product-1",
-            rating=5,
             effects_rating=5,
             taste_rating=4,
             value_rating=5,
@@ -176,24 +225,23 @@ class TestGetUserReviews:
         """Test pagination of review results"""
         user, _ = authenticated_user
 
-        # Create test product
+        # Create test products (one review per user per product)
         brand = Brand(id="brand-1", name="Brand")
-        product = Product(
-            id="product-1",
-            name="Product",
-            brand_id="brand-1",
-            thc_percentage=20.0,
-            product_type="flower",
-        )
         db_session.add(brand)
-        db_session.add(product)
+        for i in range(10):
+            db_session.add(Product(
+                id=f"product-{i}",
+                name=f"Product {i}",
+                brand_id="brand-1",
+                thc_percentage=20.0,
+                product_type="flower",
+            ))
 
         # Create multiple reviews
         for i in range(10):
             review = Review(
                 user_id=user.id,
-                product_id="product-1",
-                rating=5,
+                product_id=f"product-{i}",
                 effects_rating=5,
                 taste_rating=5,
                 value_rating=5,
@@ -210,6 +258,39 @@ class TestGetUserReviews:
         response = client.get("/api/users/me/reviews?skip=5", headers=auth_headers)
         assert len(response.json()) == 5
 
+    def test_get_reviews_single_query(self, client, authenticated_user, db_session):
+        """Product names come from a join, not a lazy load per review"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        user, _ = authenticated_user
+        db_session.add(Brand(id="brand-1", name="Brand"))
+        for i in range(5):
+            db_session.add(Product(
+                id=f"product-{i}", name=f"Product {i}", brand_id="brand-1", product_type="flower"
+            ))
+            db_session.add(Review(
+                user_id=user.id, product_id=f"product-{i}",
+                effects_rating=4, taste_rating=4, value_rating=4, comment=f"Review {i}",
+            ))
+        db_session.commit()
+        user_id = user.id
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get(f"/api/users/{user_id}/reviews")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert {r["product_name"] for r in response.json()} == {f"Product {i}" for i in range(5)}
+        assert len([sql for sql in statements if "from products" in sql]) == 0
+        assert len([sql for sql in statements if "from reviews" in sql]) == 1
+
     def test_get_reviews_unauthenticated(self, client):
         """Test accessing reviews without authentication"""
         response = client.get("/api/users/me/reviews")
@@ -274,7 +355,6 @@ class TestGetPublicUserReviews:
         review = Review(
             user_id=user.id,
             product_id="product-1",
-            rating=4,
             effects_rating=4,
             taste_rating=4,
             value_rating=4,
@@ -0,0 +1,235 @@
+"""
+Test suite for watchlist endpoints (/api/watchlist/*)
+"""
+import pytest
+from fastapi import status
+from models import Brand, Product
+
+
+@pytest.mark.integration
+class TestGetWatchlist:
+    """Tests for GET /api/watchlist/ endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """A few products to watch"""
+        db_session.add(Brand(id="brand-1", name="Brand"))
+        for i in range(4):
+            db_session.add(Product(
+                id=f"product-{i}", name=f"Product {i}", brand_id="brand-1", product_type="Flower"
+            ))
+        db_session.commit()
+
+    def test_lists_watched_products(self, client, auth_headers):
+        """Watched products come back with their name and type"""
+        client.post("/api/watchlist/add", json={"product_id": "product-1"}, headers=auth_headers)
+
+        response = client.get("/api/watchlist/", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["product_id"] == "product-1"
+        assert data[0]["product_name"] == "Product 1"
+        assert data[0]["product_type"] == "Flower"
+        assert data[0]["created_at"]
+
+    def test_single_query(self, client, auth_headers):
+        """Product details come from a join, not a lazy load per watched item"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        for i in range(4):
+            client.post(
+                "/api/watchlist/add", json={"product_id": f"product-{i}"}, headers=auth_headers
+            )
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/watchlist/", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert {item["product_name"] for item in response.json()} == {
+            f"Product {i}" for i in range(4)
+        }
+        assert len([sql for sql in statements if "from products" in sql]) == 0
+        assert len([sql for sql in statements if "from watchlists" in sql]) == 1
+
+    def test_lookups_use_user_product_index(self, client, auth_headers):
+        """User-only and user+product lookups both search the unique index"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        client.post("/api/watchlist/add", json={"product_id": "product-1"}, headers=auth_headers)
+        captured = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "from watchlists" in statement.lower():
+                captured.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            client.get("/api/watchlist/", headers=auth_headers)
+            client.get("/api/watchlist/check/product-1", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(captured) == 2
+        with engine.connect() as conn:
+            for statement, parameters in captured:
+                plan = " ".join(
+                    row[-1] for row in conn.exec_driver_sql(
+                        "EXPLAIN QUERY PLAN " + statement, parameters
+                    )
+                )
+                # SQLite names a UNIQUE constraint's index sqlite_autoindex_*
+                assert "SEARCH watchlists USING INDEX sqlite_autoindex_watchlists" in plan
+
+    def test_requires_auth(self, client):
+        """The watchlist is private to the signed-in user"""
+        response = client.get("/api/watchlist/")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.integration
+class TestAddToWatchlist:
+    """Tests for POST /api/watchlist/add endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """A parent product with one variant"""
+        db_session.add(Brand(id="brand-1", name="Brand"))
+        db_session.add(Product(
+            id="parent-1", name="Parent", brand_id="brand-1", product_type="Flower", is_master=True
+        ))
+        db_session.add(Product(
+            id="variant-1", name="Parent 3.5g", brand_id="brand-1", product_type="Flower",
+            is_master=False, master_product_id="parent-1"
+        ))
+        db_session.commit()
+
+    def test_variant_resolves_to_parent(self, client, auth_headers):
+        """Watching a variant watches its parent"""
+        response = client.post(
+            "/api/watchlist/add", json={"product_id": "variant-1"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "added"
+        assert response.json()["product_id"] == "parent-1"
+        assert response.json()["watchlist_id"]
+
+    def test_single_statement(self, client, auth_headers):
+        """A successful add is one INSERT ... SELECT, with no pre-checks"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                "/api/watchlist/add", json={"product_id": "parent-1"}, headers=auth_headers
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == status.HTTP_200_OK
+        watchlist_sql = [sql for sql in statements if "watchlists" in sql or "from products" in sql]
+        assert len(watchlist_sql) == 1
+        assert watchlist_sql[0].startswith("insert into watchlists")
+
+    def test_duplicate_rejected(self, client, auth_headers):
+        """Watching the same product twice is a 400"""
+        client.post("/api/watchlist/add", json={"product_id": "parent-1"}, headers=auth_headers)
+
+        response = client.post(
+            "/api/watchlist/add", json={"product_id": "variant-1"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_product(self, client, auth_headers):
+        """An unknown product is a 404"""
+        response = client.post(
+            "/api/watchlist/add", json={"product_id": "missing"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.integration
+class TestCheckWatchlist:
+    """Tests for GET /api/watchlist/check/{product_id} endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, db_session):
+        """A product to watch"""
+        db_session.add(Brand(id="brand-1", name="Brand"))
+        db_session.add(Product(id="product-1", name="Product 1", brand_id="brand-1", product_type="Flower"))
+        db_session.commit()
+
+    def test_cached_until_watchlist_changes(self, client, auth_headers):
+        """Repeat checks are served from cache; add and remove refresh the answer"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        assert client.get(
+            "/api/watchlist/check/product-1", headers=auth_headers
+        ).json()["is_watched"] is False
+
+        client.post("/api/watchlist/add", json={"product_id": "product-1"}, headers=auth_headers)
+        response = client.get("/api/watchlist/check/product-1", headers=auth_headers)
+        assert response.json()["is_watched"] is True
+        assert response.json()["alert_settings"]["alert_on_stock"] is True
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/watchlist/check/product-1", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()["is_watched"] is True
+        assert not [sql for sql in statements if "from watchlists" in sql]
+
+        client.delete("/api/watchlist/remove/product-1", headers=auth_headers)
+        assert client.get(
+            "/api/watchlist/check/product-1", headers=auth_headers
+        ).json()["is_watched"] is False
+
+    def test_selects_only_response_columns(self, client, auth_headers):
+        """The check reads the four columns it returns, not the whole row"""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        client.post("/api/watchlist/add", json={"product_id": "product-1"}, headers=auth_headers)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lower())
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/watchlist/check/product-1", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.json()["alert_settings"]["price_drop_threshold"] == 10.0
+        [sql] = [sql for sql in statements if "from watchlists" in sql]
+        assert "created_at" not in sql
+        assert "user_id" not in sql.split("from")[0]
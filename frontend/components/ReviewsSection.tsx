@@ -25,7 +25,9 @@ interface Review {
 
 export default function ReviewsSection({ productId }: ReviewsSectionProps) {
   const [reviews, setReviews] = useState<Review[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [showForm, setShowForm] = useState(false)
   const [filterIntention, setFilterIntention] = useState<string | null>(null)
   const [sortBy, setSortBy] = useState('recent')
@@ -34,16 +36,23 @@ export default function ReviewsSection({ productId }: ReviewsSectionProps) {
     loadReviews()
   }, [filterIntention, sortBy, productId])
 
+  const buildParams = (cursor?: string) => {
+    const params: any = { sort_by: sortBy }
+    if (filterIntention) {
+      params.intention_tag = filterIntention
+    }
+    if (cursor) {
+      params.cursor = cursor
+    }
+    return params
+  }
+
   const loadReviews = async () => {
     try {
       setLoading(true)
-      const params: any = { sort_by: sortBy }
-      if (filterIntention) {
-        params.intention_tag = filterIntention
-      }
-
-      const response = await api.reviews.list(productId, params)
-      setReviews(response.data)
+      const response = await api.reviews.list(productId, buildParams())
+      setReviews(response.data.items)
+      setNextCursor(response.data.next_cursor)
     } catch (error) {
       console.error('Failed to load reviews:', error)
     } finally {
@@ -51,6 +60,20 @@ export default function ReviewsSection({ productId }: ReviewsSectionProps) {
     }
   }
 
+  const loadMoreReviews = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const response = await api.reviews.list(productId, buildParams(nextCursor))
+      setReviews((prev) => [...prev, ...response.data.items])
+      setNextCursor(response.data.next_cursor)
+    } catch (error) {
+      console.error('Failed to load more reviews:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleReviewSubmitted = () => {
     setShowForm(false)
     loadReviews() // Refresh reviews list
@@ -172,6 +195,17 @@ export default function ReviewsSection({ productId }: ReviewsSectionProps) {
           {reviews.map((review) => (
             <ReviewCard key={review.id} review={review} onUpvote={loadReviews} />
           ))}
+          {nextCursor && (
+            <div className="text-center">
+              <button
+                onClick={loadMoreReviews}
+                disabled={loadingMore}
+                className="px-4 py-2 border border-cannabis-600 text-cannabis-700 rounded-lg hover:bg-cannabis-50 transition-colors font-semibold disabled:opacity-50 disabled:cursor-not-allowed"
+              >
+                {loadingMore ? 'Loading...' : 'Load More Reviews'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>